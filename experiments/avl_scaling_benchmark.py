@@ -0,0 +1,64 @@
+"""
+Measure how AVLTree insert, find and remove times scale with the number of keys, next to the
+linear bulk build of AVLTree.from_sorted.
+
+With heights stored on the nodes each operation is O(log n), so the time per operation divided
+by log2(n) should stay roughly flat as n grows by powers of ten. Recomputing heights recursively
+made every operation O(subtree size) instead, which this benchmark makes obvious.
+
+Usage:
+    PYTHONPATH=. python experiments/avl_scaling_benchmark.py [max_exponent]
+
+e.g. `PYTHONPATH=. python experiments/avl_scaling_benchmark.py 7` runs 10^3 up to 10^7 keys
+(10^7 needs a few GB of memory and several minutes).
+"""
+import math
+import random
+import sys
+import time
+
+from structures.avl_tree import AVLTree
+
+
+def run(n, seed=0):
+    """
+    Insert n shuffled keys, look each up, then remove them all, and bulk build a tree of the sorted keys.
+
+    :param n: The number of keys.
+    :param seed: Seed of the random generator.
+
+    :return tuple: Microseconds per insert, find, remove and bulk built key, and the final tree height.
+    """
+    keys = list(range(n))
+    random.Random(seed).shuffle(keys)
+    tree = AVLTree()
+    start = time.perf_counter()
+    for key in keys:
+        tree.add_node(key)
+    inserted = time.perf_counter()
+    for key in keys:
+        tree.find_node(key)
+    found = time.perf_counter()
+    height = tree.root.get_height()
+    for key in keys:
+        tree.remove_node(key)
+    removed = time.perf_counter()
+    AVLTree.from_sorted(range(n))
+    built = time.perf_counter()
+    scale = 1e6 / n
+    return ((inserted - start) * scale, (found - inserted) * scale, (removed - found) * scale,
+            (built - removed) * scale, height)
+
+
+def main():
+    max_exponent = int(sys.argv[1]) if len(sys.argv) > 1 else 6
+    print(f"{'keys':>10} {'height':>7} {'insert (us)':>12} {'find (us)':>10} {'remove (us)':>12} {'build (us)':>11} {'insert/log2 n':>14}")
+    for exponent in range(3, max_exponent + 1):
+        n = 10 ** exponent
+        insert, find, remove, build, height = run(n)
+        print(f"{n:>10} {height:>7} {insert:>12.2f} {find:>10.2f} {remove:>12.2f} {build:>11.2f} "
+              f"{insert / math.log2(n):>14.3f}")
+
+
+if __name__ == "__main__":
+    main()
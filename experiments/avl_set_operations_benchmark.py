@@ -0,0 +1,66 @@
+"""
+Benchmark join-based AVLTree.union against inserting one tree's values into the other one by one.
+
+Merging m values into a tree of n values by repeated add_node costs O(m log n), while union costs
+O(m log(n/m + 1)), which is linear when the trees are of similar size. Pass a worker count to also
+time union with the two halves below the root combined in a process pool.
+
+Usage:
+    PYTHONPATH=. python experiments/avl_set_operations_benchmark.py [n] [workers]
+
+e.g. `PYTHONPATH=. python experiments/avl_set_operations_benchmark.py 1000000 2`
+"""
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from structures.avl_tree import AVLTree
+
+
+def make_trees(n, m, seed=0):
+    """
+    Build a tree of n even values and a tree of m random values, half of them shared.
+
+    :param n: The number of values in the large tree.
+    :param m: The number of values in the small tree.
+    :param seed: Seed of the random generator.
+
+    :return tuple: The two trees and the values of the small one.
+    """
+    values = random.Random(seed).sample(range(2 * n), m)
+    return AVLTree.from_sorted(range(0, 2 * n, 2)), AVLTree.from_iterable(values), values
+
+
+def time_insert(n, m):
+    large, _, values = make_trees(n, m)
+    start = time.perf_counter()
+    for value in values:
+        if not large.find_node(value):
+            large.add_node(value)
+    return time.perf_counter() - start
+
+
+def time_union(n, m, executor=None):
+    large, small, _ = make_trees(n, m)
+    start = time.perf_counter()
+    large.union(small, executor=executor)
+    return time.perf_counter() - start
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else 0
+    executor = ProcessPoolExecutor(workers) if workers else None
+    print(f"{'n':>10} {'m':>10} {'insert (s)':>11} {'union (s)':>10}" + (f" {'pool (s)':>9}" if executor else ""))
+    for m in (n // 1000, n // 100, n // 10, n):
+        row = f"{n:>10} {m:>10} {time_insert(n, m):>11.3f} {time_union(n, m):>10.3f}"
+        if executor:
+            row += f" {time_union(n, m, executor):>9.3f}"
+        print(row)
+    if executor:
+        executor.shutdown()
+
+
+if __name__ == "__main__":
+    main()
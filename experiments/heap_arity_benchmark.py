@@ -0,0 +1,59 @@
+"""
+Benchmark push and pop throughput of Heap for different arities.
+
+For each heap size n, n random floats are pushed one at a time and then all popped,
+and the best arity for each phase is reported, showing where higher arities overtake
+the binary heap.
+
+Usage:
+    PYTHONPATH=. python experiments/heap_arity_benchmark.py [max_exponent] [arity ...]
+
+e.g. `PYTHONPATH=. python experiments/heap_arity_benchmark.py 7 2 4 8` runs sizes 10^4 to 10^7 (slow).
+"""
+import random
+import sys
+import time
+
+from structures.heap import MinHeap
+
+
+def time_arity(values, arity):
+    """
+    Time pushing every value into an empty heap, then popping them all.
+
+    :param values: The values to push.
+    :param arity: The arity of the heap.
+
+    :return float, float: Seconds spent pushing and popping.
+    """
+    heap = MinHeap(arity=arity)
+    start = time.perf_counter()
+    for v in values:
+        heap.push(v)
+    pushed = time.perf_counter()
+    for _ in range(len(values)):
+        heap.pop()
+    return pushed - start, time.perf_counter() - pushed
+
+
+def main():
+    max_exponent = int(sys.argv[1]) if len(sys.argv) > 1 else 6
+    arities = [int(a) for a in sys.argv[2:]] or [2, 3, 4, 8]
+    rng = random.Random(0)
+    print(f"{'n':>10} {'arity':>6} {'push (s)':>10} {'pop (s)':>10} {'total (s)':>10}")
+    for exponent in range(4, max_exponent + 1):
+        n = 10 ** exponent
+        values = [rng.random() for _ in range(n)]
+        results = {}
+        for arity in arities:
+            push, pop = time_arity(values, arity)
+            results[arity] = (push, pop)
+            print(f"{n:>10} {arity:>6} {push:>10.3f} {pop:>10.3f} {push + pop:>10.3f}")
+        best_push = min(arities, key=lambda a: results[a][0])
+        best_pop = min(arities, key=lambda a: results[a][1])
+        best_total = min(arities, key=lambda a: sum(results[a]))
+        print(f"{n:>10} best arity: push={best_push} pop={best_pop} total={best_total}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark PairingHeap against the array Heap on mixed push/pop/meld traces.
+
+Each trace simulates a sharded scheduler: a set of per-worker heaps receives pushes and pops,
+and every so often two workers' heaps are melded. The array heap melds by extending one array
+with the other and re-heapifying, O(n + m); the pairing heap melds in O(1).
+
+Usage:
+    PYTHONPATH=. python experiments/pairing_heap_benchmark.py [operations] [meld_fraction ...]
+
+e.g. `PYTHONPATH=. python experiments/pairing_heap_benchmark.py 200000 0 0.001 0.01`
+"""
+import random
+import sys
+import time
+
+from structures.heap import MinHeap
+from structures.pairing_heap import MinPairingHeap
+
+
+def make_trace(operations, meld_fraction, workers=16, seed=0):
+    """
+    Build a random trace of (op, worker, argument) tuples.
+
+    :param operations: The number of operations in the trace.
+    :param meld_fraction: Fraction of operations that meld one worker's heap into another's.
+    :param workers: The number of per-worker heaps.
+    :param seed: Seed of the random generator.
+
+    :return list: The trace.
+    """
+    rng = random.Random(seed)
+    trace = []
+    for _ in range(operations):
+        r = rng.random()
+        if r < meld_fraction:
+            a, b = rng.sample(range(workers), 2)
+            trace.append(("meld", a, b))
+        elif r < 0.6:
+            trace.append(("push", rng.randrange(workers), rng.random()))
+        else:
+            trace.append(("pop", rng.randrange(workers), None))
+    return trace
+
+
+def run_array(trace, workers=16):
+    heaps = [MinHeap() for _ in range(workers)]
+    start = time.perf_counter()
+    for op, worker, arg in trace:
+        heap = heaps[worker]
+        if op == "push":
+            heap.push(arg)
+        elif op == "pop":
+            if not heap.isEmpty():
+                heap.pop()
+        else:
+            heap.data.extend(heaps[arg].data)
+            heap.heapify()
+            heaps[arg].data = []
+    return time.perf_counter() - start
+
+
+def run_pairing(trace, workers=16):
+    heaps = [MinPairingHeap() for _ in range(workers)]
+    start = time.perf_counter()
+    for op, worker, arg in trace:
+        heap = heaps[worker]
+        if op == "push":
+            heap.push(arg)
+        elif op == "pop":
+            if not heap.isEmpty():
+                heap.pop()
+        else:
+            heap.meld(heaps[arg])
+    return time.perf_counter() - start
+
+
+def main():
+    operations = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    fractions = [float(f) for f in sys.argv[2:]] or [0.0, 0.001, 0.01, 0.05]
+    print(f"{'ops':>10} {'meld %':>8} {'array (s)':>10} {'pairing (s)':>12}")
+    for fraction in fractions:
+        trace = make_trace(operations, fraction)
+        print(f"{operations:>10} {fraction * 100:>8.2f} {run_array(trace):>10.3f} {run_pairing(trace):>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Benchmark UnrolledLinkedList against DoublyLinkedList on appends, full scans and middle inserts.
+
+The doubly linked list allocates one node per element, while the unrolled list stores elements in
+blocks of block_capacity, so it allocates far fewer objects and scans run over contiguous lists.
+
+Usage:
+    PYTHONPATH=. python experiments/unrolled_list_benchmark.py [elements] [block_capacity ...]
+
+e.g. `PYTHONPATH=. python experiments/unrolled_list_benchmark.py 200000 16 64 256`
+"""
+import random
+import sys
+import time
+
+from structures.d_linked_list import DoublyLinkedList
+from structures.unrolled_linked_list import UnrolledLinkedList
+
+
+def run(make_list, elements, inserts=2000, seed=0):
+    """
+    Time a workload against a fresh list.
+
+    :param make_list: Callable returning an empty list.
+    :param elements: The number of elements appended.
+    :param inserts: The number of inserts at random indices.
+    :param seed: Seed of the random generator.
+
+    :return tuple: Seconds spent appending, scanning and inserting, and node bytes per element.
+    """
+    rng = random.Random(seed)
+    linked_list = make_list()
+    start = time.perf_counter()
+    for i in range(elements):
+        linked_list.add(i)
+    appended = time.perf_counter()
+    total = 0
+    for data in linked_list:
+        total += data
+    scanned = time.perf_counter()
+    for i in range(inserts):
+        linked_list.insert(rng.randrange(len(linked_list)), i)
+    inserted = time.perf_counter()
+    return (appended - start, scanned - appended, inserted - scanned,
+            linked_list.memory_stats()["bytes_per_element"])
+
+
+def main():
+    elements = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    capacities = [int(c) for c in sys.argv[2:]] or [16, 64, 256]
+    print(f"{'list':>16} {'append (s)':>11} {'scan (s)':>9} {'insert (s)':>11} {'bytes/elem':>11}")
+    rows = [("doubly linked", DoublyLinkedList)]
+    rows += [(f"unrolled B={capacity}", lambda capacity=capacity: UnrolledLinkedList(capacity)) for capacity in capacities]
+    for name, make_list in rows:
+        append, scan, insert, per_element = run(make_list, elements)
+        print(f"{name:>16} {append:>11.3f} {scan:>9.3f} {insert:>11.3f} {per_element:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
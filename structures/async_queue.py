@@ -0,0 +1,208 @@
+import asyncio
+from structures.queue import Queue
+from structures.stack import Stack
+from structures.priority_queue import PriorityQueue
+
+class AsyncDataStore:
+    """
+    An asyncio wrapper around a Queue, Stack or PriorityQueue.
+    Coroutines waiting for an element or for free capacity are parked on futures and woken in
+    arrival order, so consumers never have to poll.
+    Space complexity of O(n).
+    """
+    def __init__(self, store, capacity=None):
+        """
+        Initialize the wrapper around an empty store.
+
+        :param store: The empty structure holding the elements, ordering is inherited from it.
+        :param capacity: Maximum number of elements held at once, None for unbounded.
+
+        :raises ValueError: If capacity is not positive.
+        """
+        if capacity is not None and capacity < 1:
+            raise ValueError("Capacity must be positive.")
+        self.capacity = capacity
+        self.__store = store
+        self.__size = 0             # Number of elements in the store
+        self.__getters = Queue()    # Futures of coroutines waiting for an element
+        self.__putters = Queue()    # Futures of coroutines waiting for free capacity
+
+    @staticmethod
+    def __wakeup_next(waiters):
+        """
+        Wake the first waiter that is still pending, discarding cancelled ones. O(1) amortized
+
+        :param waiters: Queue of futures to wake from.
+        """
+        while not waiters.isEmpty():
+            waiter = waiters.get()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
+    def isEmpty(self):
+        """
+        Return True if the store is empty, False otherwise. O(1)
+
+        :return bool: True if the store is empty, False otherwise.
+        """
+        return self.__size == 0
+
+    def isFull(self):
+        """
+        Return True if the store is at capacity, False otherwise. O(1)
+
+        :return bool: True if the store is full, False otherwise.
+        """
+        return self.capacity is not None and self.__size >= self.capacity
+
+    def __len__(self):
+        """
+        Return the number of elements in the store. O(1)
+
+        :return int: Number of elements.
+        """
+        return self.__size
+
+    def try_add(self, data):
+        """
+        Add an element without waiting. Cost of the underlying add.
+
+        :param data: The data to add.
+        :return bool: True if the element was added, False if the store is full.
+        """
+        if self.isFull():
+            return False
+        self.__store.add(data)
+        self.__size += 1
+        self.__wakeup_next(self.__getters)
+        return True
+
+    def try_get(self, default=None):
+        """
+        Get and delete the next element without waiting. Cost of the underlying get.
+
+        :param default: Value returned if the store is empty.
+        :return: The next element, or default if the store is empty.
+        """
+        if self.isEmpty():
+            return default
+        data = self.__store.get()
+        self.__size -= 1
+        self.__wakeup_next(self.__putters)
+        return data
+
+    def peek(self):
+        """
+        Return the next element without removing it. Cost of the underlying peek.
+
+        :return: The next element.
+
+        :raises IndexError: If the store is empty.
+        """
+        return self.__store.peek()
+
+    async def add(self, data):
+        """
+        Add an element, waiting while the store is full.
+
+        :param data: The data to add.
+        """
+        while self.isFull():
+            putter = asyncio.get_running_loop().create_future()
+            self.__putters.add(putter)
+            try:
+                await putter
+            except BaseException:
+                putter.cancel()
+                # A wakeup meant for this coroutine must be handed on to the next one.
+                if not self.isFull() and not putter.cancelled():
+                    self.__wakeup_next(self.__putters)
+                raise
+        self.try_add(data)
+
+    async def get(self):
+        """
+        Get and delete the next element, waiting while the store is empty.
+
+        :return: The next element.
+        """
+        while self.isEmpty():
+            getter = asyncio.get_running_loop().create_future()
+            self.__getters.add(getter)
+            try:
+                await getter
+            except BaseException:
+                getter.cancel()
+                # A wakeup meant for this coroutine must be handed on to the next one.
+                if not self.isEmpty() and not getter.cancelled():
+                    self.__wakeup_next(self.__getters)
+                raise
+        return self.try_get()
+
+    async def get_batch(self, max_n, max_wait=None):
+        """
+        Wait for at least one element, then collect up to max_n elements.
+
+        :param max_n: Maximum number of elements in the batch.
+        :param max_wait: Seconds to keep waiting for more elements once the first has arrived,
+            None to only take those already available.
+        :return list: The elements in the order they were retrieved.
+
+        :raises ValueError: If max_n is not positive.
+        """
+        if max_n < 1:
+            raise ValueError("Batch size must be positive.")
+        batch = [await self.get()]
+        loop = asyncio.get_running_loop()
+        deadline = None if max_wait is None else loop.time() + max_wait
+        while len(batch) < max_n:
+            if not self.isEmpty():
+                batch.append(self.try_get())
+                continue
+            if deadline is None or loop.time() >= deadline:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self.get(), deadline - loop.time()))
+            except TimeoutError:
+                break
+        return batch
+
+    async def batches(self, max_n, max_wait=None):
+        """
+        Drain the store forever in batches, for use with async for.
+
+        :param max_n: Maximum number of elements in each batch.
+        :param max_wait: Seconds to wait for each batch to fill, see get_batch.
+        :return list: Successive batches.
+        """
+        while True:
+            yield await self.get_batch(max_n, max_wait)
+
+    def __str__(self):
+        return self.__store.__str__()
+
+    def __repr__(self):
+        return self.__str__()
+
+
+class AsyncQueue(AsyncDataStore):
+    def __init__(self, capacity=None):
+        """
+        Initialise the super class with first-in first-out ordering.
+        """
+        super().__init__(Queue(), capacity)
+
+class AsyncStack(AsyncDataStore):
+    def __init__(self, capacity=None):
+        """
+        Initialise the super class with last-in first-out ordering.
+        """
+        super().__init__(Stack(), capacity)
+
+class AsyncPriorityQueue(AsyncDataStore):
+    def __init__(self, capacity=None):
+        """
+        Initialise the super class with lowest-value first ordering.
+        """
+        super().__init__(PriorityQueue(), capacity)
@@ -1,7 +1,13 @@
+from structures.node_pool import NodePool
+
 class AVLNode:
     """
     A node in an AVL tree
+    The height and size of the subtree rooted at the node are stored on it and refreshed from its
+    children by update_bf().
     """
+    __slots__ = ('value', 'parent', 'left', 'right', 'balance_factor', 'height', 'size')
+
     def __init__(self, value, parent=None):
         """Initialize the node"""
         self.value = value
@@ -9,32 +15,102 @@ class AVLNode:
         self.left = None
         self.right = None
         self.balance_factor = 0
+        self.height = 1
+        self.size = 1 # Number of nodes in the subtree rooted at this node
 
     def get_height(self):
-        if self.left is None and self.right is None:
-            return 1
-        elif self.left is None:
-            return self.right.get_height() + 1
-        elif self.right is None:
-            return self.left.get_height() + 1
-        else:
-            return max(self.left.get_height(), self.right.get_height()) + 1
+        """Return the stored height of the subtree rooted at the node. O(1)"""
+        return self.height
 
     def update_bf(self):
-        hr = 0 if self.right is None else self.right.get_height()
-        hl = 0 if self.left is None else self.left.get_height()
+        """Recompute the balance factor, height and size from those stored on the children. O(1)"""
+        hr = 0 if self.right is None else self.right.height
+        hl = 0 if self.left is None else self.left.height
         self.balance_factor = hr-hl
+        self.height = max(hl, hr) + 1
+        self.update_size()
 
-class AVLTree:
+    def update_size(self):
+        """Recompute the subtree size from the stored sizes of the children. O(1)"""
+        self.size = 1 + (0 if self.left is None else self.left.size) + (0 if self.right is None else self.right.size)
+
+class AVLTree(NodePool):
     """
     An AVL tree is a self-balancing binary search tree invented by Adelson-Velsky and Landis.
     Balance factor of a node is the height of the right subtree minus the height of the left subtree.
     AVL condition: All nodes have a balance factor in {-1, 0, 1}.
     Thus, the height is always O(log n)
+    Each node also stores the size of its subtree, so order statistics (rank, select) take O(log n).
+    Split and the set operations are built on join, which links two trees around a value in
+    O(difference in heights), so combining trees of m <= n values takes O(m log(n/m + 1)).
     """
-    def __init__(self):
+    def __init__(self, pool_size=0):
+        """
+        Initialise an empty tree.
+            Removed nodes are kept, up to pool_size of them, and reused by later insertions instead of
+            allocating new nodes.
+
+        :param pool_size: The maximum number of detached nodes kept for reuse, 0 to disable pooling.
+        """
+        NodePool.__init__(self, AVLNode, pool_size)
         self.root = None
 
+    @classmethod
+    def from_sorted(cls, items, *args, **kwargs):
+        """
+        Build a perfectly balanced tree from values in strictly increasing order. O(n)
+        The middle value of each range becomes the root of its subtree, so no rotations are needed.
+
+        :param items: The values of the tree, in strictly increasing order.
+        :param args: Further arguments passed to the constructor.
+        :param kwargs: Further keyword arguments passed to the constructor, e.g. pool_size.
+
+        :return AVLTree: The new tree.
+
+        :raises ValueError: If the values are not in strictly increasing order.
+        """
+        values = list(items)
+        for previous, value in zip(values, values[1:]):
+            if not previous < value:
+                raise ValueError("Node already exists." if previous == value else "Values are not sorted.")
+        tree = cls(*args, **kwargs)
+        tree.root = tree.__build(values, 0, len(values), None)
+        return tree
+
+    @classmethod
+    def from_iterable(cls, items, *args, **kwargs):
+        """
+        Build a perfectly balanced tree from values in any order, by sorting them first. O(n log n)
+
+        :param items: The distinct values of the tree.
+        :param args: Further arguments passed to the constructor.
+        :param kwargs: Further keyword arguments passed to the constructor, e.g. pool_size.
+
+        :return AVLTree: The new tree.
+
+        :raises ValueError: If a value is repeated.
+        """
+        return cls.from_sorted(sorted(items), *args, **kwargs)
+
+    def __build(self, values, lo, hi, parent):
+        """
+        Build a balanced subtree from the sorted values in [lo, hi) and return its root. O(hi - lo)
+        Recursion depth is the height of the subtree, O(log n).
+
+        :param values: The sorted values.
+        :param lo: Index of the first value of the subtree.
+        :param hi: Index past the last value of the subtree.
+        :param parent: The parent of the subtree root.
+        """
+        if lo >= hi:
+            return None
+        middle = (lo + hi) // 2
+        node = self._new_node(values[middle], parent)
+        node.left = self.__build(values, lo, middle, node)
+        node.right = self.__build(values, middle + 1, hi, node)
+        node.update_bf()
+        return node
+
     def __rotate_left(self, z):
         """
         Perform a left rotation on node z.
@@ -46,7 +122,8 @@ class AVLTree:
 
         y.parent = z.parent
         if z.parent is None:
-            self.root = y
+            if z is self.root: # Detached subtrees being joined have no parent either
+                self.root = y
         elif z == z.parent.left:
             z.parent.left = y
         else:
@@ -70,7 +147,8 @@ class AVLTree:
 
         y.parent = z.parent
         if z.parent is None:
-            self.root = y
+            if z is self.root: # Detached subtrees being joined have no parent either
+                self.root = y
         elif z == z.parent.left:
             z.parent.left = y
         else:
@@ -103,13 +181,14 @@ class AVLTree:
     def add_node(self, value):
         """
         Add a node to the tree, ensuring AVL condition is retained. O(log n)
+        Heights are refreshed on the way back up and the walk stops at the first unchanged height.
 
         :param value: The data to add.
 
         :raises ValueError: If the node is already present.
         """
         if not self.root:
-            self.root = AVLNode(value)
+            self.root = self._new_node(value)
             return
         current = self.root
         while True:
@@ -117,22 +196,27 @@ class AVLTree:
                 if current.left:
                     current = current.left
                 else:
-                    current.left = AVLNode(value, parent=current)
+                    current.left = self._new_node(value, current)
                     break
             elif value > current.value:
                 if current.right:
                     current = current.right
                 else:
-                    current.right = AVLNode(value, parent=current)
+                    current.right = self._new_node(value, current)
                     break
             else:
                 raise ValueError("Node already exists.")
         while current:
+            old_height = current.height
             current.update_bf()
             if abs(current.balance_factor) > 1:
                 self.__rebalance(current)
                 break
+            if current.height == old_height:
+                break
             current = current.parent
+        if current:
+            self.__refresh_sizes(current.parent)
 
     def __transplant(self, u, v):
         """Helper method: replace subtree rooted at u with subtree rooted at v."""
@@ -147,7 +231,8 @@ class AVLTree:
 
     def remove_node(self, value):
         """
-        Remove a node from the tree, ensuring AVL condition is retained.
+        Remove a node from the tree, ensuring AVL condition is retained. O(log n)
+        Heights are refreshed on the way back up and the walk stops once a subtree keeps its height.
 
         :param value: The data to remove.
 
@@ -179,7 +264,9 @@ class AVLTree:
             successor = node.right
             while successor.left:
                 successor = successor.left
-            parent = successor.parent
+            # Rebalancing starts where the successor was removed from, which is the successor itself
+            # when it was the right child of the removed node.
+            parent = successor if successor.parent is node else successor.parent
             if successor.parent != node:
                 self.__transplant(successor, successor.right)
                 successor.right = node.right
@@ -187,12 +274,518 @@ class AVLTree:
             self.__transplant(node, successor)
             successor.left = node.left
             successor.left.parent = successor
+            # The successor takes over the height of the removed node, to compare against on the way up.
+            successor.height = node.height
+            successor.balance_factor = node.balance_factor
+        self._release(node)
 
         while parent:
+            old_height = parent.height
             parent.update_bf()
             if abs(parent.balance_factor) > 1:
                 self.__rebalance(parent)
+                parent = parent.parent # The root of the rotated subtree
+            if parent.height == old_height:
+                break
             parent = parent.parent
+        if parent:
+            self.__refresh_sizes(parent.parent)
+
+    @staticmethod
+    def __refresh_sizes(node):
+        """
+        Recompute subtree sizes from a node up to the root, above where heights stopped changing. O(log n)
+
+        :param node: The lowest node whose size may be stale, or None.
+        """
+        while node:
+            node.update_size()
+            node = node.parent
+
+    def __len__(self):
+        """
+        Return the number of values in the tree. O(1)
+
+        :return int: The number of values in the tree.
+        """
+        return 0 if self.root is None else self.root.size
+
+    def rank(self, value, inclusive=False):
+        """
+        Return the number of values in the tree less than a value. O(log n)
+        The value need not be in the tree.
+
+        :param value: The value to rank.
+        :param inclusive: Also count a value equal to it.
+        :return int: The number of values less than (or equal to, if inclusive) the value.
+        """
+        count = 0
+        node = self.root
+        while node:
+            if value < node.value or (value == node.value and not inclusive):
+                node = node.left
+            else:
+                count += 1 + (0 if node.left is None else node.left.size)
+                node = node.right
+        return count
+
+    def select(self, k):
+        """
+        Return the k-th smallest value in the tree, counting from 0. O(log n)
+
+        :param k: The rank of the value, negative to count from the largest.
+        :return: The value with k values less than it.
+
+        :raises IndexError: If k is out of bounds.
+        """
+        size = len(self)
+        if k < 0:
+            k += size
+        if k < 0 or k >= size:
+            raise IndexError("Index out of bounds.")
+        node = self.root
+        while True:
+            left_size = 0 if node.left is None else node.left.size
+            if k < left_size:
+                node = node.left
+            elif k == left_size:
+                return node.value
+            else:
+                k -= left_size + 1
+                node = node.right
+
+    def count_range(self, lo, hi):
+        """
+        Return the number of values in the tree between lo and hi, both inclusive. O(log n)
+
+        :param lo: The lower bound.
+        :param hi: The upper bound.
+        :return int: The number of values v with lo <= v <= hi.
+        """
+        if hi < lo:
+            return 0
+        return self.rank(hi, inclusive=True) - self.rank(lo)
+
+    @staticmethod
+    def __first(node):
+        """Return the leftmost node of a non-empty subtree. O(log n)"""
+        while node.left:
+            node = node.left
+        return node
+
+    @staticmethod
+    def __last(node):
+        """Return the rightmost node of a non-empty subtree. O(log n)"""
+        while node.right:
+            node = node.right
+        return node
+
+    def __next(self, node):
+        """Return the in-order successor of a node, or None, by following parent pointers. O(1) amortized"""
+        if node.right:
+            return self.__first(node.right)
+        while node.parent and node is node.parent.right:
+            node = node.parent
+        return node.parent
+
+    def __previous(self, node):
+        """Return the in-order predecessor of a node, or None, by following parent pointers. O(1) amortized"""
+        if node.left:
+            return self.__last(node.left)
+        while node.parent and node is node.parent.left:
+            node = node.parent
+        return node.parent
+
+    def __ceiling_node(self, value, strict=False):
+        """
+        Return the node with the smallest value at least (or, if strict, greater than) a value, or None. O(log n)
+        """
+        best = None
+        node = self.root
+        while node:
+            if value < node.value or (value == node.value and not strict):
+                best = node
+                node = node.left
+            else:
+                node = node.right
+        return best
+
+    def __floor_node(self, value, strict=False):
+        """
+        Return the node with the largest value at most (or, if strict, less than) a value, or None. O(log n)
+        """
+        best = None
+        node = self.root
+        while node:
+            if value > node.value or (value == node.value and not strict):
+                best = node
+                node = node.right
+            else:
+                node = node.left
+        return best
+
+    def __iter__(self):
+        """
+        Yield the values in ascending order. O(n) for a full pass
+        The tree is walked through parent pointers, so no recursion or stack is needed. The tree must
+        not be modified while it is being iterated over.
+        """
+        node = None if self.root is None else self.__first(self.root)
+        while node:
+            yield node.value
+            node = self.__next(node)
+
+    def __reversed__(self):
+        """
+        Yield the values in descending order. O(n) for a full pass
+        The tree must not be modified while it is being iterated over.
+        """
+        node = None if self.root is None else self.__last(self.root)
+        while node:
+            yield node.value
+            node = self.__previous(node)
+
+    def irange(self, lo=None, hi=None, inclusive=(True, True), reverse=False):
+        """
+        Yield the values between lo and hi in order. O(log n + k) for k values yielded
+        The tree must not be modified while it is being iterated over.
+
+        :param lo: The lower bound, None for no lower bound.
+        :param hi: The upper bound, None for no upper bound.
+        :param inclusive: Pair of flags, whether lo and hi themselves are included.
+        :param reverse: Yield the values in descending order instead.
+        """
+        include_lo, include_hi = inclusive
+        if reverse:
+            if hi is None:
+                node = None if self.root is None else self.__last(self.root)
+            else:
+                node = self.__floor_node(hi, strict=not include_hi)
+            while node and (lo is None or lo < node.value or (include_lo and lo == node.value)):
+                yield node.value
+                node = self.__previous(node)
+        else:
+            if lo is None:
+                node = None if self.root is None else self.__first(self.root)
+            else:
+                node = self.__ceiling_node(lo, strict=not include_lo)
+            while node and (hi is None or node.value < hi or (include_hi and node.value == hi)):
+                yield node.value
+                node = self.__next(node)
+
+    def floor(self, value):
+        """
+        Return the largest value in the tree at most a value. O(log n)
+
+        :param value: The value to search from, which need not be in the tree.
+        :return: The largest value less than or equal to it, or None if there is none.
+        """
+        node = self.__floor_node(value)
+        return None if node is None else node.value
+
+    def ceiling(self, value):
+        """
+        Return the smallest value in the tree at least a value. O(log n)
+
+        :param value: The value to search from, which need not be in the tree.
+        :return: The smallest value greater than or equal to it, or None if there is none.
+        """
+        node = self.__ceiling_node(value)
+        return None if node is None else node.value
+
+    def predecessor(self, value):
+        """
+        Return the largest value in the tree less than a value. O(log n)
+
+        :param value: The value to search from, which need not be in the tree.
+        :return: The largest value strictly less than it, or None if there is none.
+        """
+        node = self.__floor_node(value, strict=True)
+        return None if node is None else node.value
+
+    def successor(self, value):
+        """
+        Return the smallest value in the tree greater than a value. O(log n)
+
+        :param value: The value to search from, which need not be in the tree.
+        :return: The smallest value strictly greater than it, or None if there is none.
+        """
+        node = self.__ceiling_node(value, strict=True)
+        return None if node is None else node.value
+
+    def min(self):
+        """
+        Return the smallest value in the tree. O(log n)
+
+        :return: The smallest value.
+
+        :raises ValueError: If the tree is empty.
+        """
+        if self.root is None:
+            raise ValueError("Tree is empty.")
+        return self.__first(self.root).value
+
+    def max(self):
+        """
+        Return the largest value in the tree. O(log n)
+
+        :return: The largest value.
+
+        :raises ValueError: If the tree is empty.
+        """
+        if self.root is None:
+            raise ValueError("Tree is empty.")
+        return self.__last(self.root).value
+
+    @staticmethod
+    def __height(node):
+        """Return the height of a subtree, 0 if it is empty. O(1)"""
+        return 0 if node is None else node.height
+
+    @staticmethod
+    def __detach_children(node):
+        """Cut a node from its children and return them as detached subtrees. O(1)"""
+        left, right = node.left, node.right
+        node.left = node.right = None
+        if left:
+            left.parent = None
+        if right:
+            right.parent = None
+        return left, right
+
+    def __join(self, left, node, right):
+        """
+        Join two detached subtrees around a detached node and return the root of the result. O(|h(left) - h(right)| + 1)
+        Every value of left must be less than the node's value, and every value of right greater.
+        The node is hung from the spine of the taller subtree where the heights meet, and the path
+        above it is rebalanced as after an insertion.
+
+        :param left: Root of the subtree of smaller values, or None.
+        :param node: The node placed between them.
+        :param right: Root of the subtree of larger values, or None.
+        """
+        hl, hr = self.__height(left), self.__height(right)
+        if abs(hl - hr) <= 1:
+            node.left, node.right, node.parent = left, right, None
+            if left:
+                left.parent = node
+            if right:
+                right.parent = node
+            node.update_bf()
+            return node
+        if hl > hr:
+            # Walk down the right spine of left to the first subtree no taller than right plus one.
+            parent, spine = None, left
+            while spine and spine.height > hr + 1:
+                parent, spine = spine, spine.right
+            node.left, node.right = spine, right
+            parent.right = node
+        else:
+            parent, spine = None, right
+            while spine and spine.height > hl + 1:
+                parent, spine = spine, spine.left
+            node.left, node.right = left, spine
+            parent.left = node
+        node.parent = parent
+        if node.left:
+            node.left.parent = node
+        if node.right:
+            node.right.parent = node
+        node.update_bf()
+        while True:
+            parent.update_bf()
+            if abs(parent.balance_factor) > 1:
+                self.__rebalance(parent)
+                parent = parent.parent # The root of the rotated subtree
+            if parent.parent is None:
+                return parent
+            parent = parent.parent
+
+    def __split(self, root, value):
+        """
+        Split a detached subtree around a value. O(log n)
+
+        :param root: The root of the subtree, or None.
+        :param value: The value to split at.
+
+        :return tuple: The detached subtree of smaller values, the node holding the value or None,
+            and the detached subtree of larger values.
+        """
+        if root is None:
+            return None, None, None
+        left, right = self.__detach_children(root)
+        if value < root.value:
+            smaller, found, larger = self.__split(left, value)
+            return smaller, found, self.__join(larger, root, right)
+        if value > root.value:
+            smaller, found, larger = self.__split(right, value)
+            return self.__join(left, root, smaller), found, larger
+        return left, root, right
+
+    def __split_last(self, root):
+        """
+        Remove the node with the largest value from a non-empty detached subtree. O(log n)
+
+        :return tuple: The root of the remaining subtree, and the detached node.
+        """
+        left, right = self.__detach_children(root)
+        if right is None:
+            return left, root
+        rest, last = self.__split_last(right)
+        return self.__join(left, root, rest), last
+
+    def __join_two(self, left, right):
+        """
+        Join two detached subtrees, every value of left being less than every value of right. O(log n)
+        """
+        if left is None:
+            return right
+        rest, last = self.__split_last(left)
+        return self.__join(rest, last, right)
+
+    def __combine(self, operation, a, b):
+        """
+        Return the root of the union, intersection or difference of two detached subtrees. O(m log(n/m + 1))
+        The root of a splits b, the halves are combined recursively and joined back around it.
+
+        :param operation: One of "union", "intersection" or "difference".
+        :param a: The root of the first subtree, or None.
+        :param b: The root of the second subtree, or None.
+        """
+        if a is None or b is None:
+            if operation == "union":
+                return b if a is None else a
+            return a if operation == "difference" else None
+        left, right = self.__detach_children(a)
+        b_left, found, b_right = self.__split(b, a.value)
+        left = self.__combine(operation, left, b_left)
+        right = self.__combine(operation, right, b_right)
+        return self.__join_halves(operation, left, a, found, right)
+
+    def __join_halves(self, operation, left, pivot, found, right):
+        """
+        Join the combined halves of a set operation, keeping the pivot if it belongs to the result. O(log n)
+
+        :param operation: One of "union", "intersection" or "difference".
+        :param left: The combined subtree of values less than the pivot.
+        :param pivot: The root node of the first subtree.
+        :param found: The node of the second subtree with the pivot value, or None.
+        :param right: The combined subtree of values greater than the pivot.
+        """
+        if operation == "intersection":
+            keep = found is not None
+        else:
+            keep = operation == "union" or found is None
+        if found is not None:
+            self._release(found)
+        if keep:
+            return self.__join(left, pivot, right)
+        self._release(pivot)
+        return self.__join_two(left, right)
+
+    def __set_operation(self, operation, other, executor):
+        """
+        Replace the tree with a set operation between it and another tree, leaving the other empty.
+        With an executor the two halves below the root are combined in it, each as a pair of trees.
+
+        :param operation: One of "union", "intersection" or "difference".
+        :param other: The tree to combine with.
+        :param executor: A concurrent.futures executor, or None.
+
+        :raises ValueError: If other is this tree.
+        """
+        if other is self:
+            raise ValueError("Cannot combine a tree with itself.")
+        a, b = self.root, other.root
+        self.root = other.root = None
+        if executor is None or a is None or b is None:
+            self.root = self.__combine(operation, a, b)
+            return
+        left, right = self.__detach_children(a)
+        b_left, found, b_right = self.__split(b, a.value)
+        halves = [executor.submit(_combine_trees, operation, self.__tree_of(mine), self.__tree_of(theirs))
+                  for mine, theirs in ((left, b_left), (right, b_right))]
+        left, right = (half.result().root for half in halves)
+        self.root = self.__join_halves(operation, left, a, found, right)
+
+    @staticmethod
+    def __tree_of(root):
+        """Return a new tree holding a detached subtree. O(1)"""
+        tree = AVLTree()
+        tree.root = root
+        return tree
+
+    @classmethod
+    def join(cls, left, value, right):
+        """
+        Build a tree of the values of two trees and a value between them, leaving both trees empty. O(|h(left) - h(right)| + 1)
+
+        :param left: A tree whose values are all less than value.
+        :param value: The value placed between them.
+        :param right: A tree whose values are all greater than value.
+
+        :return AVLTree: The joined tree.
+
+        :raises ValueError: If the values of left or right are not on the correct side of value.
+        """
+        if (left.root and not left.max() < value) or (right.root and not value < right.min()):
+            raise ValueError("Values of left must be less than value, and values of right greater.")
+        tree = cls(pool_size=left.pool_size)
+        a, b = left.root, right.root
+        left.root = right.root = None
+        tree.root = tree.__join(a, tree._new_node(value), b)
+        return tree
+
+    def split(self, value):
+        """
+        Cut the tree in two at a value, keeping the values less than it and returning the rest as a new tree. O(log n)
+
+        :param value: The value to split at, which need not be in the tree.
+        :return AVLTree: A tree of the values greater than or equal to value.
+        """
+        root, self.root = self.root, None
+        smaller, found, larger = self.__split(root, value)
+        if found is not None:
+            larger = self.__join(None, found, larger)
+        self.root = smaller
+        rest = type(self)(pool_size=self.pool_size)
+        rest.root = larger
+        return rest
+
+    def union(self, other, executor=None):
+        """
+        Add every value of another tree to this one, reusing its nodes and leaving it empty. O(m log(n/m + 1))
+
+        :param other: The tree to absorb.
+        :param executor: A concurrent.futures executor, e.g. a ProcessPoolExecutor, to combine the two
+            halves below the root in, None to run in this process. Subtrees are pickled to reach a
+            process pool, an O(n) cost that only pays off when comparing values is expensive.
+
+        :raises ValueError: If other is this tree.
+        """
+        self.__set_operation("union", other, executor)
+
+    def intersection(self, other, executor=None):
+        """
+        Keep only the values also in another tree, leaving the other tree empty. O(m log(n/m + 1))
+
+        :param other: The tree to intersect with.
+        :param executor: A concurrent.futures executor to combine the two halves below the root in, as in union.
+
+        :raises ValueError: If other is this tree.
+        """
+        self.__set_operation("intersection", other, executor)
+
+    def difference(self, other, executor=None):
+        """
+        Remove every value of another tree from this one, leaving the other tree empty. O(m log(n/m + 1))
+
+        :param other: The tree of values to remove.
+        :param executor: A concurrent.futures executor to combine the two halves below the root in, as in union.
+
+        :raises ValueError: If other is this tree.
+        """
+        self.__set_operation("difference", other, executor)
 
     def find_node(self, value):
         """
@@ -210,4 +803,18 @@ class AVLTree:
                 node = node.right
             else:
                 return True
-        return False
\ No newline at end of file
+        return False
+
+
+def _combine_trees(operation, tree, other):
+    """
+    Run a set operation between two trees and return the result, for use as an executor task.
+
+    :param operation: One of "union", "intersection" or "difference".
+    :param tree: The first tree, replaced by the result.
+    :param other: The second tree.
+
+    :return AVLTree: The first tree.
+    """
+    getattr(tree, operation)(other)
+    return tree
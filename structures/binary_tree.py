@@ -2,6 +2,8 @@ class BTNode:
     """
     A node in a binary tree.
     """
+    __slots__ = ('value', 'parent', 'left', 'right')
+
     def __init__(self, value):
         """Initialize an empty node."""
         self.value = value  # The data of the node
@@ -0,0 +1,184 @@
+import threading
+from structures.queue import Queue
+from typing import override
+
+class BlockingQueue(Queue):
+    """
+    A bounded, thread-safe queue implementation.
+    Producers block while the queue is full and consumers block while it is empty,
+    waking on condition variables rather than polling.
+    Space complexity of O(n).
+    """
+    def __init__(self, capacity=None):
+        """
+        Initialize an empty blocking queue.
+
+        :param capacity: Maximum number of elements held at once, None for unbounded.
+
+        :raises ValueError: If capacity is not positive.
+        """
+        if capacity is not None and capacity < 1:
+            raise ValueError("Capacity must be positive.")
+        super().__init__()
+        self.capacity = capacity
+        self.__lock = threading.RLock()
+        self.__not_empty = threading.Condition(self.__lock) # Signalled when elements are added, to all waiters as get_many waits for several
+        self.__not_full = threading.Condition(self.__lock)  # Signalled when an element is removed
+
+    def __is_full(self):
+        """Return True if the queue holds capacity elements. Caller must hold the lock."""
+        return self.capacity is not None and super().__len__() >= self.capacity
+
+    @override
+    def add(self, data, timeout=None):
+        """
+        Add an element to the back of the queue, blocking while the queue is full. O(1) amortized
+
+        :param data: The data to add.
+        :param timeout: Maximum seconds to wait for space, None to wait indefinitely.
+
+        :raises IndexError: If the queue is still full after timeout seconds.
+        """
+        with self.__not_full:
+            if not self.__not_full.wait_for(lambda: not self.__is_full(), timeout):
+                raise IndexError("Queue is full.")
+            super().add(data)
+            self.__not_empty.notify_all()
+
+    @override
+    def get(self, timeout=None):
+        """
+        Get and delete the element at the front of the queue, blocking while it is empty. O(1) amortized
+
+        :param timeout: Maximum seconds to wait for an element, None to wait indefinitely.
+        :return: The data at the front of the queue.
+
+        :raises IndexError: If the queue is still empty after timeout seconds.
+        """
+        with self.__not_empty:
+            if not self.__not_empty.wait_for(lambda: not self.isEmpty(), timeout):
+                raise IndexError("Queue is empty.")
+            data = super().get()
+            self.__not_full.notify()
+            return data
+
+    @override
+    def add_many(self, iterable, timeout=None):
+        """
+        Add every element of an iterable, blocking whenever the queue is full. O(m)
+
+        :param iterable: The data to add.
+        :param timeout: Maximum seconds to wait for space for each element, None to wait indefinitely.
+
+        :raises IndexError: If the queue stays full for timeout seconds, earlier elements remain added.
+        """
+        if self.capacity is None:
+            with self.__lock:
+                super().add_many(iterable)
+                self.__not_empty.notify_all()
+            return
+        for data in iterable:
+            self.add(data, timeout)
+
+    @override
+    def get_many(self, n, timeout=None):
+        """
+        Get and delete n elements from the front of the queue, blocking until n are present. O(n)
+
+        :param n: The number of elements to retrieve.
+        :param timeout: Maximum seconds to wait for n elements, None to wait indefinitely.
+        :return list: The data in the order it was retrieved.
+
+        :raises ValueError: If n exceeds the capacity of the queue.
+        :raises IndexError: If fewer than n elements are present after timeout seconds.
+        """
+        if self.capacity is not None and n > self.capacity:
+            raise ValueError("Cannot get more elements than the capacity.")
+        with self.__not_empty:
+            if not self.__not_empty.wait_for(lambda: len(self) >= n, timeout):
+                raise IndexError("Queue has fewer than n elements.")
+            items = super().get_many(n)
+            self.__not_full.notify_all()
+            return items
+
+    @override
+    def peek_many(self, indices):
+        """
+        Return the elements at several positions from the front of the queue. O(k)
+
+        :param indices: Iterable of positions, 0 being the front and -1 the back.
+        :return list: The data at each position, in the order the positions were given.
+
+        :raises IndexError: If a position is out of bounds.
+        """
+        with self.__lock:
+            return super().peek_many(indices)
+
+    def try_add(self, data):
+        """
+        Add an element to the back of the queue without blocking. O(1) amortized
+
+        :param data: The data to add.
+        :return bool: True if the element was added, False if the queue is full.
+        """
+        with self.__lock:
+            if self.__is_full():
+                return False
+            super().add(data)
+            self.__not_empty.notify_all()
+            return True
+
+    def try_get(self, default=None):
+        """
+        Get and delete the element at the front of the queue without blocking. O(1) amortized
+
+        :param default: Value returned if the queue is empty.
+        :return: The data at the front of the queue, or default if it is empty.
+        """
+        with self.__lock:
+            if super().isEmpty():
+                return default
+            data = super().get()
+            self.__not_full.notify()
+            return data
+
+    @override
+    def peek(self):
+        """
+        Return the element at the front of the queue. O(1).
+
+        :return: The data at the front of the queue.
+
+        :raises IndexError: If queue is empty.
+        """
+        with self.__lock:
+            return super().peek()
+
+    @override
+    def isEmpty(self):
+        """
+        Return True if the queue is empty, False otherwise. O(1)
+
+        :return bool: True if the queue is empty, False otherwise.
+        """
+        with self.__lock:
+            return super().isEmpty()
+
+    def isFull(self):
+        """
+        Return True if the queue is at capacity, False otherwise. O(1)
+
+        :return bool: True if the queue is full, False otherwise.
+        """
+        with self.__lock:
+            return self.__is_full()
+
+    @override
+    def __len__(self):
+        with self.__lock:
+            return super().__len__()
+
+    @override
+    def __str__(self):
+        with self.__lock:
+            return super().__str__()
@@ -0,0 +1,213 @@
+from structures.data_store import DataStore
+from structures.queue import Queue
+from typing import override
+
+class BucketQueue(DataStore):
+    """
+    A priority queue for integer priorities in a small fixed range [0, max_priority].
+    One FIFO queue is kept per priority, and a cursor tracks the lowest bucket that may be non-empty,
+    so elements of equal priority leave in the order they were added.
+    Space complexity of O(n + C) for C possible priorities.
+    """
+    def __init__(self, max_priority=255):
+        """
+        Initialize an empty queue.
+
+        :param max_priority: The highest priority accepted.
+
+        :raises ValueError: If max_priority is negative.
+        """
+        if max_priority < 0:
+            raise ValueError("Maximum priority must be non-negative.")
+        self.max_priority = max_priority
+        self.__buckets = [Queue() for _ in range(max_priority + 1)]
+        self.__cursor = max_priority + 1 # Lowest priority whose bucket may be non-empty
+        self.__size = 0
+
+    def __lowest(self):
+        """
+        Move the cursor to the lowest non-empty bucket and return it. O(C) worst case, O(1) amortized
+        when priorities are retrieved in non-decreasing order.
+
+        :raises IndexError: If queue is empty.
+        """
+        if self.__size == 0:
+            raise IndexError("Queue is empty.")
+        while self.__buckets[self.__cursor].isEmpty():
+            self.__cursor += 1
+        return self.__buckets[self.__cursor]
+
+    @override
+    def add(self, data, priority=None):
+        """
+        Add an element behind all elements of lower or equal priority. O(1)
+
+        :param data: The data to add.
+        :param priority: Integer priority of the element, None to use the data itself.
+
+        :raises ValueError: If the priority is not an integer in [0, max_priority].
+        """
+        if priority is None:
+            priority = data
+        if not isinstance(priority, int) or priority < 0 or priority > self.max_priority:
+            raise ValueError("Priority out of range.")
+        self.__buckets[priority].add(data)
+        self.__cursor = min(self.__cursor, priority)
+        self.__size += 1
+
+    @override
+    def get(self):
+        """
+        Get and delete the element with the lowest priority. O(1) amortized
+
+        :return: The data of the element.
+
+        :raises IndexError: If queue is empty.
+        """
+        data = self.__lowest().get()
+        self.__size -= 1
+        return data
+
+    @override
+    def peek(self):
+        """
+        Return the element with the lowest priority. O(1) amortized
+
+        :return: The data of the element.
+
+        :raises IndexError: If queue is empty.
+        """
+        return self.__lowest().peek()
+
+    def isEmpty(self):
+        """
+        Return True if the queue is empty, False otherwise. O(1)
+
+        :return bool: True if the queue is empty, False otherwise.
+        """
+        return self.__size == 0
+
+    def __len__(self):
+        return self.__size
+
+    def __str__(self):
+        items = []
+        for bucket in self.__buckets[self.__cursor:]:
+            items.extend(bucket.peek_many(range(len(bucket))))
+        return f"{str(items)[:-1]}, ...]"
+
+    def __repr__(self):
+        return self.__str__()
+
+
+class RadixHeap(DataStore):
+    """
+    A monotone priority queue for non-negative integer priorities.
+    Priorities added must be at least the last priority retrieved or peeked, as in Dijkstra's algorithm.
+    Bucket i holds the elements whose priority first differs from the last retrieved priority in bit i-1,
+    so an element only ever moves to lower buckets and each is moved O(log C) times for priorities below C.
+    Space complexity of O(n + log C).
+    """
+    def __init__(self):
+        """Initialize an empty heap."""
+        self.__buckets = [[]] # Lists of (priority, data) pairs
+        self.__last = 0       # The last priority retrieved or peeked, which every priority must be at least
+        self.__size = 0
+
+    def __bucket_index(self, priority):
+        """Return the bucket of a priority relative to the last retrieved priority. O(1)"""
+        return (priority ^ self.__last).bit_length()
+
+    def __fill_lowest(self):
+        """
+        Ensure bucket 0 is non-empty by redistributing the first non-empty bucket around its minimum.
+        O(log C) amortized
+
+        :raises IndexError: If heap is empty.
+        """
+        if self.__size == 0:
+            raise IndexError("Queue is empty.")
+        if self.__buckets[0]:
+            return
+        index = 1
+        while not self.__buckets[index]:
+            index += 1
+        entries = self.__buckets[index]
+        self.__buckets[index] = []
+        self.__last = min(entries, key=lambda entry: entry[0])[0]
+        for entry in entries:
+            self.__buckets[self.__bucket_index(entry[0])].append(entry)
+
+    @override
+    def add(self, data, priority=None):
+        """
+        Add an element. O(1)
+
+        :param data: The data to add.
+        :param priority: Integer priority of the element, None to use the data itself.
+
+        :raises ValueError: If the priority is not a non-negative integer.
+        :raises ValueError: If the priority is below the last retrieved priority.
+        """
+        if priority is None:
+            priority = data
+        if not isinstance(priority, int) or priority < 0:
+            raise ValueError("Priority must be a non-negative integer.")
+        if priority < self.__last:
+            raise ValueError(f"Priority {priority} violates monotonicity, last retrieved was {self.__last}.")
+        index = self.__bucket_index(priority)
+        while len(self.__buckets) <= index:
+            self.__buckets.append([])
+        self.__buckets[index].append((priority, data))
+        self.__size += 1
+
+    @override
+    def get(self):
+        """
+        Get and delete an element with the lowest priority. O(log C) amortized
+
+        :return: The data of the element.
+
+        :raises IndexError: If heap is empty.
+        """
+        self.__fill_lowest()
+        self.__size -= 1
+        return self.__buckets[0].pop()[1]
+
+    @override
+    def peek(self):
+        """
+        Return an element with the lowest priority. O(log C) amortized
+
+        :return: The data of the element.
+
+        :raises IndexError: If heap is empty.
+        """
+        self.__fill_lowest()
+        return self.__buckets[0][-1][1]
+
+    def last_priority(self):
+        """
+        Return the last retrieved or peeked priority, the lowest priority that may still be added. O(1)
+
+        :return integer: The last retrieved or peeked priority.
+        """
+        return self.__last
+
+    def isEmpty(self):
+        """
+        Return True if the heap is empty, False otherwise. O(1)
+
+        :return bool: True if the heap is empty, False otherwise.
+        """
+        return self.__size == 0
+
+    def __len__(self):
+        return self.__size
+
+    def __str__(self):
+        entries = sorted((entry for bucket in self.__buckets for entry in bucket), key=lambda entry: entry[0])
+        return f"{str([entry[1] for entry in entries])[:-1]}, ...]"
+
+    def __repr__(self):
+        return self.__str__()
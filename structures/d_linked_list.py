@@ -1,26 +1,134 @@
+from itertools import count, islice
 from structures.data_store import DataStore
+from structures.node_pool import NodePool
+from structures.ownership import Owner
 from typing import override
 
+_stamps = count() # Source of node stamps, so a node reused from the pool is told apart from its past use
+
 class Node:
     """
-    A node in a singly linked list.
+    A node in a doubly linked list.
     """
-    def __init__(self, data):
+    __slots__ = ('data', 'next', 'prev', 'owner', 'stamp')
+
+    def __init__(self, data, owner=None):
         """Initialize an empty node."""
         self.data = data # Stores the data at this node
         self.next = None # Stores the reference to the next element
         self.prev = None # Stores the reference to the previous element
+        self.owner = owner # Stores the ownership token of the list holding this node, or None
+        self.stamp = next(_stamps) # Changes whenever the node is reset, invalidating its handles
+
+class Handle:
+    """
+    An opaque reference to an element of a doubly linked list, valid until the element is removed.
+    """
+    __slots__ = ('_node', '_stamp')
+
+    def __init__(self, node):
+        """Initialize a handle to a node in a list."""
+        self._node = node # Stores the referenced node
+        self._stamp = node.stamp # Stores the stamp of the node when the handle was made
 
-class DoublyLinkedList(DataStore):
+class DoublyLinkedList(DataStore, NodePool):
     """
     A doubly linked list implementation.
+    The length is kept in a counter, and a finger remembers the last node reached by index, so an
+    index is reached by walking from whichever of the head, the tail or the finger is closest.
     Space complexity of O(n).
     """
-    def __init__(self):
-        """Initialize an empty doubly linked list."""
-        super().__init__()
+    STR_LIMIT = 1000 # Maximum number of elements written out by __str__
+
+    def __init__(self, pool_size=0):
+        """
+        Initialize an empty doubly linked list.
+            Removed nodes are kept, up to pool_size of them, and reused by later insertions instead of
+            allocating new nodes.
+
+        :param pool_size: The maximum number of detached nodes kept for reuse, 0 to disable pooling.
+        """
+        NodePool.__init__(self, Node, pool_size)
         self.__head = None # Stores the reference to the first element in the list
         self.__tail = None # Stores the reference to the last element in the list
+        self.__size = 0    # Number of elements in the list
+        self.__finger = None      # Stores the reference to the last node reached by index, or None
+        self.__finger_index = 0   # Index of the finger node
+        self.__owner = Owner()    # Ownership token of the nodes of this list
+
+    def __node_at(self, index):
+        """
+        Return the node at a valid index, walking from the closest of the head, the tail and the finger,
+        and move the finger there. O(distance from the closest of them)
+
+        :param index: The index of the node, in [0, len).
+        """
+        if index < self.__size - 1 - index:
+            current, counter = self.__head, 0
+        else:
+            current, counter = self.__tail, self.__size - 1
+        if self.__finger is not None and abs(self.__finger_index - index) < abs(counter - index):
+            current, counter = self.__finger, self.__finger_index
+        while counter < index:
+            current = current.next
+            counter += 1
+        while counter > index:
+            current = current.prev
+            counter -= 1
+        self.__finger, self.__finger_index = current, index
+        return current
+
+    def __detach(self, target):
+        """
+        Relink the neighbours of a node around it, leaving its own pointers untouched. O(1)
+
+        :param target: The node to detach.
+        """
+        if target.prev is None:
+            self.__head = target.next
+        else:
+            target.prev.next = target.next
+        if target.next is None:
+            self.__tail = target.prev
+        else:
+            target.next.prev = target.prev
+
+    def __handle_node(self, handle):
+        """
+        Return the node of a handle, checking that its element is still in this list. O(log n) amortised
+
+        :param handle: A handle returned by add(), insert() or insert_after().
+
+        :raises ValueError: If the element was removed, or belongs to another list.
+        """
+        node = handle._node
+        if node.stamp != handle._stamp:
+            raise ValueError("Handle is stale.")
+        node.owner = node.owner.resolve()
+        if node.owner is not self.__owner:
+            raise ValueError("Handle belongs to another list.")
+        return node
+
+    def __unlink(self, target, index):
+        """
+        Remove a node from the list and return its data, keeping the finger valid. O(1)
+
+        :param target: The node to remove.
+        :param index: The index of the node.
+        """
+        self.__detach(target)
+        if target is self.__finger:
+            # Keep the finger nearby: the next node takes over the index, otherwise step back.
+            if target.next is not None:
+                self.__finger = target.next
+            else:
+                self.__finger, self.__finger_index = target.prev, index - 1
+        elif self.__finger_index > index:
+            self.__finger_index -= 1
+        self.__size -= 1
+        data = target.data
+        self._release(target)
+        return data
 
     @override
     def add(self, data):
@@ -28,8 +136,10 @@ class DoublyLinkedList(DataStore):
         Append an element to the doubly linked list. O(1)
 
         :param data: The data to append.
+        :return Handle: Handle of the element, for use with remove_handle, move_to_front, move_to_back
+            and insert_after while the element is in the list.
         """
-        new_node = Node(data)
+        new_node = self._new_node(data, self.__owner)
         if self.__head is None:
             self.__head = new_node
             self.__tail = new_node
@@ -37,44 +147,43 @@ class DoublyLinkedList(DataStore):
             self.__tail.next = new_node
             new_node.prev = self.__tail
             self.__tail = new_node
+        self.__size += 1
+        return Handle(new_node)
 
     @override
     def insert(self, index, data):
         """
-        Insert an element at a specified index. O(n)
+        Insert an element at a specified index. O(n), O(1) near either end or the last accessed index
 
         :param index: Index at which to insert.
         :param data: The data to insert.
+        :return Handle: Handle of the element, as returned by add().
 
         :raises IndexError: If index is out of bounds.
         """
         if index < 0:
-            index += len(self) + 1
-        if index < 0 or index > len(self):
+            index += self.__size + 1
+        if index < 0 or index > self.__size:
             raise IndexError("Index out of bounds.")
-        if index == len(self):
-            self.add(data)
-        elif index == 0:
-            new_node = Node(data)
-            new_node.next = self.__head
-            self.__head.prev = new_node
+        if index == self.__size:
+            return self.add(data)
+        current = self.__node_at(index)
+        new_node = self._new_node(data, self.__owner)
+        new_node.prev = current.prev
+        new_node.next = current
+        if current.prev is None:
             self.__head = new_node
         else:
-            new_node = Node(data)
-            counter = 1
-            current = self.__head.next
-            while counter < index:
-                current = current.next
-                counter += 1
-            new_node.prev = current.prev
-            new_node.next = current
             current.prev.next = new_node
-            current.prev = new_node
+        current.prev = new_node
+        self.__size += 1
+        self.__finger = new_node
+        return Handle(new_node)
 
     @override
     def get(self, index=-1):
         """
-        Get and delete the element at a specific index. O(n)
+        Get and delete the element at a specific index. O(n), O(1) near either end or the last accessed index
 
         :param index: The index to retrieve.
         :return: The data at the index.
@@ -82,31 +191,10 @@ class DoublyLinkedList(DataStore):
         :raises IndexError: If index is out of bounds.
         """
         if index < 0:
-            index += len(self)
-        if index < 0 or index > len(self):
+            index += self.__size
+        if index < 0 or index >= self.__size:
             raise IndexError("Index out of bounds.")
-        if index == 0:
-            target = self.__head
-            self.__head = target.next
-            if self.__head is None:
-                self.__tail = None
-            else:
-                self.__head.prev = None
-            return target.data
-        elif index == len(self)-1:
-            target = self.__tail
-            self.__tail = target.prev
-            self.__tail.next = None
-            return target.data
-        else:
-            counter = 1
-            current = self.__head.next
-            while counter < index:
-                current = current.next
-                counter += 1
-            current.prev.next = current.next
-            current.next.prev = current.prev
-            return current.data
+        return self.__unlink(self.__node_at(index), index)
 
     @override
     def remove(self, data):
@@ -120,30 +208,95 @@ class DoublyLinkedList(DataStore):
         """
         if self.isEmpty():
             raise IndexError("List is empty.")
-        if self.__head.data == data:
-            self.__head = self.__head.next
-            if self.__head is None:
-                self.__tail = None
-            else:
-                self.__head.prev = None
-        elif self.__tail.data == data:
-            self.__tail = self.__tail.prev
-            self.__tail.next = None
-        else:
-            current = self.__head.next
-            if current is None:
+        target = self.__head
+        index = 0
+        while target.data != data:
+            target = target.next
+            index += 1
+            if target is None:
                 raise ValueError("Value not found.")
-            while current.data != data:
-                current = current.next
-                if current is None:
-                    raise ValueError("Value not found.")
-            current.prev.next = current.next
-            current.next.prev = current.prev
+        self.__unlink(target, index)
+
+    def remove_handle(self, handle):
+        """
+        Remove the element of a handle returned by add(), insert() or insert_after(). O(1)
+        The index of the handle is unknown, so the finger is dropped. The handle is stale afterwards.
+
+        :param handle: The handle of the element to remove.
+        :return: The data of the element.
+
+        :raises ValueError: If the handle is stale or belongs to another list.
+        """
+        node = self.__handle_node(handle)
+        self.__detach(node)
+        self.__finger = None
+        self.__size -= 1
+        data = node.data
+        self._release(node)
+        return data
+
+    def move_to_front(self, handle):
+        """
+        Move the element of a handle to the start of the list, keeping the handle valid. O(1)
+
+        :param handle: The handle of an element in this list.
+
+        :raises ValueError: If the handle is stale or belongs to another list.
+        """
+        node = self.__handle_node(handle)
+        if node is self.__head:
+            return
+        self.__detach(node)
+        self.__finger = None
+        node.prev = None
+        node.next = self.__head
+        self.__head.prev = node
+        self.__head = node
+
+    def move_to_back(self, handle):
+        """
+        Move the element of a handle to the end of the list, keeping the handle valid. O(1)
+
+        :param handle: The handle of an element in this list.
+
+        :raises ValueError: If the handle is stale or belongs to another list.
+        """
+        node = self.__handle_node(handle)
+        if node is self.__tail:
+            return
+        self.__detach(node)
+        self.__finger = None
+        node.next = None
+        node.prev = self.__tail
+        self.__tail.next = node
+        self.__tail = node
+
+    def insert_after(self, handle, data):
+        """
+        Insert an element directly after the element of a handle. O(1)
+
+        :param handle: The handle of an element in this list.
+        :param data: The data to insert.
+        :return Handle: Handle of the new element.
+
+        :raises ValueError: If the handle is stale or belongs to another list.
+        """
+        node = self.__handle_node(handle)
+        if node is self.__tail:
+            return self.add(data)
+        new_node = self._new_node(data, self.__owner)
+        new_node.prev = node
+        new_node.next = node.next
+        node.next.prev = new_node
+        node.next = new_node
+        self.__size += 1
+        self.__finger = None
+        return Handle(new_node)
 
     @override
     def set(self, index, data):
         """
-        Set an element at a specific index. O(n)
+        Set an element at a specific index. O(n), O(1) near either end or the last accessed index
 
         :param index: The index to update.
         :param data: The new data.
@@ -151,20 +304,15 @@ class DoublyLinkedList(DataStore):
         :raises IndexError: If index is out of bounds.
         """
         if index < 0:
-            index += len(self)
-        if index < 0 or index >= len(self):
+            index += self.__size
+        if index < 0 or index >= self.__size:
             raise ValueError("Index out of bounds.")
-        counter = 0
-        current = self.__head
-        while counter < index:
-            current = current.next
-            counter += 1
-        current.data = data
+        self.__node_at(index).data = data
 
     @override
     def peek(self, index):
         """
-        Return the element at a specific index. O(n)
+        Return the element at a specific index. O(n), O(1) near either end or the last accessed index
 
         :param index: The index to retrieve.
         :return: The data at the index.
@@ -172,15 +320,261 @@ class DoublyLinkedList(DataStore):
         :raises IndexError: If index is out of bounds.
         """
         if index < 0:
-            index += len(self)
-        if index < 0 or index >= len(self):
+            index += self.__size
+        if index < 0 or index >= self.__size:
             raise ValueError("Index out of bounds.")
+        return self.__node_at(index).data
+
+    @override
+    def add_many(self, iterable):
+        """
+        Append every element of an iterable, in order. O(m)
+
+        :param iterable: The data to append.
+        """
+        for data in iterable:
+            new_node = self._new_node(data, self.__owner)
+            if self.__head is None:
+                self.__head = new_node
+            else:
+                self.__tail.next = new_node
+                new_node.prev = self.__tail
+            self.__tail = new_node
+            self.__size += 1
+
+    @override
+    def get_many(self, n):
+        """
+        Get and delete the last n elements of the list, as if by repeated calls to get(). O(n)
+
+        :param n: The number of elements to retrieve.
+        :return list: The data in the order it was retrieved, last element first.
+
+        :raises IndexError: If fewer than n elements are in the list.
+        """
+        items = []
+        current = self.__tail
+        while len(items) < n:
+            if current is None:
+                raise IndexError("Index out of bounds.")
+            items.append(current.data)
+            current = current.prev
+        while self.__tail is not current:
+            target = self.__tail
+            self.__tail = target.prev
+            self._release(target)
+        if current is None:
+            self.__head = None
+        else:
+            current.next = None
+        self.__size -= len(items)
+        if self.__finger_index >= self.__size:
+            self.__finger = None
+        return items
+
+    @override
+    def peek_many(self, indices):
+        """
+        Return the elements at several indices in a single walk of the list. O(n + k log k)
+
+        :param indices: Iterable of indices to retrieve.
+        :return list: The data at each index, in the order the indices were given.
+
+        :raises ValueError: If an index is out of bounds.
+        """
+        length = self.__size
+        positions = []
+        for index in indices:
+            if index < 0:
+                index += length
+            if index < 0 or index >= length:
+                raise ValueError("Index out of bounds.")
+            positions.append(index)
+        items = [None] * len(positions)
+        current = self.__head
         counter = 0
+        for i in sorted(range(len(positions)), key=positions.__getitem__):
+            while counter < positions[i]:
+                current = current.next
+                counter += 1
+            items[i] = current.data
+        return items
+
+    def extend_list(self, other):
+        """
+        Append every element of another doubly linked list by relinking its nodes, leaving it empty. O(1)
+        Handles of the moved elements now belong to this list.
+
+        :param other: The list to absorb.
+
+        :raises ValueError: If other is this list.
+        """
+        if other is self:
+            raise ValueError("Cannot extend a list with itself.")
+        if other.__head is None:
+            return
+        if self.__head is None:
+            self.__head = other.__head
+        else:
+            self.__tail.next = other.__head
+            other.__head.prev = self.__tail
+        self.__tail = other.__tail
+        self.__size += other.__size
+        other.__owner.forward = self.__owner
+        other.__clear()
+
+    def splice(self, index, other):
+        """
+        Insert every element of another doubly linked list at an index by relinking its nodes, leaving
+        it empty. O(1) near either end or the last accessed index, O(n) otherwise to reach the index
+        Handles of the moved elements now belong to this list.
+
+        :param index: Index at which the first element of other is placed.
+        :param other: The list to absorb.
+
+        :raises IndexError: If index is out of bounds.
+        :raises ValueError: If other is this list.
+        """
+        if other is self:
+            raise ValueError("Cannot splice a list into itself.")
+        if index < 0:
+            index += self.__size + 1
+        if index < 0 or index > self.__size:
+            raise IndexError("Index out of bounds.")
+        if index == self.__size:
+            self.extend_list(other)
+            return
+        if other.__head is None:
+            return
+        current = self.__node_at(index)
+        first, last = other.__head, other.__tail
+        first.prev = current.prev
+        if current.prev is None:
+            self.__head = first
+        else:
+            current.prev.next = first
+        last.next = current
+        current.prev = last
+        self.__finger_index += other.__size
+        self.__size += other.__size
+        other.__owner.forward = self.__owner
+        other.__clear()
+
+    def split_at(self, index):
+        """
+        Cut the list in two at an index by relinking, keeping the elements before it and returning the
+        rest as a new list. O(min(index, n - index))
+        Handles of the moved elements now belong to the new list. The nodes of the shorter part are
+        relabelled, the longer part keeping or taking over the ownership token of this list.
+
+        :param index: Index of the first element moved to the new list.
+        :return DoublyLinkedList: A list of the elements from index onwards.
+
+        :raises IndexError: If index is out of bounds.
+        """
+        if index < 0:
+            index += self.__size
+        if index < 0 or index > self.__size:
+            raise IndexError("Index out of bounds.")
+        rest = type(self)(pool_size=self.pool_size)
+        if index == self.__size:
+            return rest
+        first = self.__node_at(index)
+        rest.__head, rest.__tail, rest.__size = first, self.__tail, self.__size - index
+        rest.__finger, rest.__finger_index = first, 0
+        self.__tail = first.prev
+        if self.__tail is None:
+            self.__head = None
+        else:
+            self.__tail.next = None
+        first.prev = None
+        self.__size = index
+        self.__finger = self.__tail
+        self.__finger_index = index - 1
+        if index < rest.__size:
+            self.__owner, rest.__owner = rest.__owner, self.__owner
+            node, owner = self.__head, self.__owner
+        else:
+            node, owner = first, rest.__owner
+        while node is not None:
+            node.owner = owner
+            node = node.next
+        return rest
+
+    def __clear(self):
+        """
+        Forget every node, after they have been moved to another list, and take a fresh ownership token. O(1)
+        """
+        self.__head = None
+        self.__tail = None
+        self.__size = 0
+        self.__finger = None
+        self.__finger_index = 0
+        self.__owner = Owner()
+
+    def __iter__(self):
+        """
+        Yield the elements from the head to the tail. O(n) for a full pass
+        The list must not be modified while it is being iterated over.
+        """
         current = self.__head
-        while counter < index:
+        while current:
+            yield current.data
             current = current.next
-            counter += 1
-        return current.data
+
+    def __reversed__(self):
+        """
+        Yield the elements from the tail to the head. O(n) for a full pass
+        The list must not be modified while it is being iterated over.
+        """
+        current = self.__tail
+        while current:
+            yield current.data
+            current = current.prev
+
+    def __contains__(self, data):
+        """
+        Return True if an element equal to data is in the list. O(n)
+        """
+        current = self.__head
+        while current:
+            if current.data == data:
+                return True
+            current = current.next
+        return False
+
+    def __getitem__(self, index):
+        """
+        Return the element at an index, or a lazy view of a slice.
+        A slice returns a generator that walks the list once from the first index of the slice, so
+        nothing is copied up front and list[a:b] costs O(b - a) once the walk has reached a.
+
+        :param index: An integer index or a slice.
+        :return: The data at the index, or a generator over the sliced elements.
+
+        :raises IndexError: If an integer index is out of bounds.
+        """
+        if isinstance(index, slice):
+            return self.__slice(*index.indices(self.__size))
+        if index < -self.__size or index >= self.__size:
+            raise IndexError("Index out of bounds.")
+        return self.peek(index)
+
+    def __slice(self, start, stop, step):
+        """
+        Yield the elements of a slice given by normalised start, stop and step indices. O(|stop - start|)
+        A negative step walks backwards along the previous pointers.
+        """
+        if start >= stop if step > 0 else start <= stop:
+            return
+        current = self.__node_at(start)
+        while True:
+            yield current.data
+            start += step
+            if start >= stop if step > 0 else start <= stop:
+                return
+            for _ in range(abs(step)):
+                current = current.next if step > 0 else current.prev
 
     def isEmpty(self):
         """
@@ -192,26 +586,17 @@ class DoublyLinkedList(DataStore):
 
     def __len__(self):
         """
-        Return the length of the list. O(n)
+        Return the length of the list. O(1)
 
         :return int: Length of the list.
         """
-        counter = 0
-        current = self.__head
-        while current:
-            counter += 1
-            current = current.next
-        return counter
+        return self.__size
 
     def __str__(self):
-        if self.isEmpty():
-            return "[]"
-        out_str = "["
-        current = self.__head
-        while current:
-            out_str += str(current.data) + ", "
-            current = current.next
-        return out_str[:-2] + "]"
+        shown = ", ".join(map(str, islice(self, self.STR_LIMIT)))
+        if self.__size > self.STR_LIMIT:
+            return f"[{shown}, ... ({self.__size - self.STR_LIMIT} more)]"
+        return f"[{shown}]"
 
     def __repr__(self):
         return self.__str__()
\ No newline at end of file
@@ -71,3 +71,42 @@ class DataStore:
         :raises IndexError: If index is out of bounds.
         """
         return "peek() not implemented for this structure type."
+
+    def add_many(self, iterable):
+        """
+        Add every element of an iterable, as if by repeated calls to add().
+
+        :param iterable: The data to add.
+        """
+        for data in iterable:
+            self.add(data)
+
+    def extend(self, iterable):
+        """
+        Append every element of an iterable to the back of the structure, in order.
+
+        :param iterable: The data to append.
+        """
+        self.add_many(iterable)
+
+    def get_many(self, n):
+        """
+        Get and delete n elements, as if by repeated calls to get().
+
+        :param n: The number of elements to retrieve.
+        :return list: The data in the order it was retrieved.
+
+        :raises IndexError: If fewer than n elements are present.
+        """
+        return [self.get() for _ in range(n)]
+
+    def peek_many(self, indices):
+        """
+        Return the elements at several indices.
+
+        :param indices: Iterable of indices to retrieve.
+        :return list: The data at each index, in the order the indices were given.
+
+        :raises IndexError: If an index is out of bounds.
+        """
+        return [self.peek(index) for index in indices]
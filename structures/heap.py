@@ -1,118 +1,173 @@
+from operator import lt, gt
+
+class HeapEntry:
+    """
+    A heap entry ordered by a key, then by a sequence number among keys where neither is less than the other.
+    Unlike a (key, seq) tuple, which only falls back to seq when the keys compare ==, this also breaks
+    ties between keys that define __lt__ but keep the default identity __eq__.
+    """
+    __slots__ = ('key', 'seq', 'item')
+
+    def __init__(self, key, seq, item=None):
+        """Initialize an entry."""
+        self.key = key   # The value the entry is ordered by
+        self.seq = seq   # Tie-breaker between keys that are not less than each other
+        self.item = item # Optional data carried alongside the key
+
+    def __lt__(self, other):
+        return self.key < other.key or (not other.key < self.key and self.seq < other.seq)
+
+    def __gt__(self, other):
+        return other.key < self.key or (not self.key < other.key and self.seq > other.seq)
+
 class Heap:
     """
     Generalised array-based heap implementation for min- and max-heaps.
     """
-    def __init__(self, is_min=True):
+    def __init__(self, is_min=True, arity=2):
         """
         Initialise the empty heap, storing a flag defining if the heap is a min- or max-heap.
-        Array-based, so root is index 0, left and right child of node at index n are index 2n+1 and 2n+2 respectively.
+        Array-based, so root is index 0, the children of node at index n are indexes dn+1 to dn+d for arity d,
+        i.e. 2n+1 and 2n+2 for the default binary heap.
+        A higher arity makes the tree shallower, so pushes are cheaper but each pop compares more children per level.
 
         :param is_min: Signifies if the heap is a min- or max-heap.
+        :param arity: The maximum number of children of each node.
+
+        :raises ValueError: If arity is less than 2.
         """
+        if arity < 2:
+            raise ValueError("Arity must be at least 2.")
         self.data = []
         self.is_min = is_min
+        self.arity = arity
 
-    def __compare(self, a, b):
+    @classmethod
+    def from_iterable(cls, items, *args, **kwargs):
         """
-        Compare two heap elements with the suitable comparison operator. O(1)
+        Build a heap from an iterable in linear time. O(n)
 
-        :param a: The first element to compare.
-        :param b: The second element to compare.
+        :param items: The elements of the heap.
+        :param args: Further arguments passed to the constructor, e.g. is_min for Heap.
+        :param kwargs: Further keyword arguments passed to the constructor.
 
-        :return: e.g. True if element a is smaller than element b, and it is a min-heap.
+        :return Heap: The new heap.
         """
-        return a < b if self.is_min else a > b
+        heap = cls(*args, **kwargs)
+        heap.data = list(items)
+        heap.heapify()
+        return heap
 
-    def __swap(self, a, b):
+    def heapify(self):
         """
-        Swap the two nodes at the same time. O(1)
-
-        :param a: the index of the first node to swap.
-        :param b: the index of the second node to swap.
+        Restore the heap property over the whole array using Floyd's bottom-up algorithm. O(n)
+        Only the nodes up to the parent of the last element have children, so each of those is sifted down in reverse order.
         """
-        c = self.data[a]
-        self.data[a] = self.data[b]
-        self.data[b] = c
+        for index in range((len(self.data) - 2) // self.arity, -1, -1):
+            self.__sift_down(index)
 
-    @staticmethod
-    def __get_parent(index):
+    def push(self, value):
         """
-        Compute the parent of node at the input index. O(1)
-
-        :param index: the index of the child.
+        Insert an element and restore heap property. O(log n)
 
-        :return integer|None: the index of the parent node or None if no parent.
+        :param value: Data to insert.
         """
-        if index == 0:
-            return None
-        return (index-1) // 2
+        self.data.append(value)
+        self.__sift_up(len(self.data) - 1)
 
-    def __get_children(self, index):
+    def pop(self):
         """
-        Compute the children indexes. O(1)
-
-        :param index: the index of the parent.
+        Remove and return root element. O(log n)
 
-        :return integer|None, integer|None: index of the children or None if no child in that direction.
+        :return element: the maximal/minimal element.
         """
-        left, right = (index*2)+1, (index*2)+2
-        if left >= len(self.data):
-            return None, None
-        elif right >= len(self.data):
-            return left, None
-        else:
-            return left, right
+        if not self.data:
+            raise ValueError("Heap is empty")
+        last = self.data.pop()
+        if not self.data:
+            return last
+        root = self.data[0]
+        self.data[0] = last
+        self.__sift_down(0)
+        return root
 
-    def push(self, value):
+    def pushpop(self, value):
         """
-        Insert an element and restore heap property. O(log n)
+        Push an element then pop the root, in a single sift. O(log n)
+        If the element would become the root it is returned immediately without touching the heap.
 
         :param value: Data to insert.
+        :return element: the maximal/minimal element of the heap and the new element.
         """
-        self.data.append(value)
-        self.__sift_up(len(self.data) - 1)
+        before = lt if self.is_min else gt
+        if self.data and before(self.data[0], value):
+            value, self.data[0] = self.data[0], value
+            self.__sift_down(0)
+        return value
 
-    def pop(self):
+    def replace(self, value):
         """
-        Remove and return root element. O(log n)
+        Pop the root then push an element, in a single sift. O(log n)
+        Unlike pushpop, the returned root may be worse than the new element.
 
-        :return element: the maximal/minimal element.
+        :param value: Data to insert.
+        :return element: the maximal/minimal element before the insertion.
+
+        :raises ValueError: If the heap is empty.
         """
         if not self.data:
             raise ValueError("Heap is empty")
-        self.data[0], self.data[-1] = self.data[-1], self.data[0]
-        root = self.data.pop()
+        root = self.data[0]
+        self.data[0] = value
         self.__sift_down(0)
         return root
 
     def __sift_up(self, child):
         """
         Sift an element up the heap until the heap condition is satisfied. O(log n)
+        Parents are moved down into the hole left by the element, which is written once at the end.
 
         :param child: element index to sift.
         """
-        parent = self.__get_parent(child)
-        if parent is not None and self.__compare(self.data[child], self.data[parent]):
-            self.__swap(child, parent)
-            self.__sift_up(parent)
+        data = self.data
+        before = lt if self.is_min else gt
+        arity = self.arity
+        item = data[child]
+        while child > 0:
+            parent = (child - 1) // arity
+            if not before(item, data[parent]):
+                break
+            data[child] = data[parent]
+            child = parent
+        data[child] = item
 
     def __sift_down(self, parent):
         """
         Sift an element down the heap until the heap condition is satisfied. O(log n)
+        Children are moved up into the hole left by the element, which is written once at the end.
 
         :param parent: element index to sift.
         """
-        child_l, child_r = self.__get_children(parent)
-        if not child_l:
-            return
-        elif not child_r and self.__compare(self.data[child_l], self.data[parent]):
-            self.__swap(parent, child_l)
-            self.__sift_down(child_l)
-        elif child_l and child_r:
-            child = child_l if self.__compare(self.data[child_l], self.data[child_r]) else child_r
-            if self.__compare(self.data[child], self.data[parent]):
-                self.__swap(parent, child)
-                self.__sift_down(child)
+        data = self.data
+        before = lt if self.is_min else gt
+        arity = self.arity
+        size = len(data)
+        item = data[parent]
+        first = arity * parent + 1
+        while first < size:
+            child = first
+            sibling = first + 1
+            last = min(first + arity, size)
+            while sibling < last:
+                if before(data[sibling], data[child]):
+                    child = sibling
+                sibling += 1
+            if not before(data[child], item):
+                break
+            data[parent] = data[child]
+            parent = child
+            first = arity * parent + 1
+        data[parent] = item
 
     def size(self):
         """
@@ -140,15 +195,15 @@ class Heap:
 
 
 class MinHeap(Heap):
-    def __init__(self):
+    def __init__(self, arity=2):
         """
         Initialise the super class.
         """
-        super().__init__(is_min=True)
+        super().__init__(is_min=True, arity=arity)
 
 class MaxHeap(Heap):
-    def __init__(self):
+    def __init__(self, arity=2):
         """
         Initialise the super class.
         """
-        super().__init__(is_min=False)
+        super().__init__(is_min=False, arity=arity)
@@ -0,0 +1,221 @@
+from operator import lt, gt
+
+class IndexedHeap:
+    """
+    Array-based heap of keys ordered by priority, with a key to position map.
+    Keys are unique, so a priority can be changed or a key removed in place instead of
+    pushing duplicates and skipping stale entries on pop.
+    Space complexity of O(n).
+    """
+    def __init__(self, is_min=True):
+        """
+        Initialise the empty heap.
+        Keys and priorities are held in parallel arrays laid out as in Heap, and the position of each
+        key is tracked in a dictionary which every move keeps up to date.
+
+        :param is_min: Signifies if the heap is a min- or max-heap.
+        """
+        self.keys = []
+        self.priorities = []
+        self.is_min = is_min
+        self.__positions = {} # Dictionary linking a key to its index in the arrays
+
+    def __move(self, key, priority, index):
+        """Write a key and its priority at an index and record the new position. O(1)"""
+        self.keys[index] = key
+        self.priorities[index] = priority
+        self.__positions[key] = index
+
+    def __sift_up(self, child):
+        """
+        Sift an element up the heap until the heap condition is satisfied. O(log n)
+
+        :param child: element index to sift.
+        """
+        keys, priorities = self.keys, self.priorities
+        before = lt if self.is_min else gt
+        key, priority = keys[child], priorities[child]
+        while child > 0:
+            parent = (child - 1) >> 1
+            if not before(priority, priorities[parent]):
+                break
+            self.__move(keys[parent], priorities[parent], child)
+            child = parent
+        self.__move(key, priority, child)
+
+    def __sift_down(self, parent):
+        """
+        Sift an element down the heap until the heap condition is satisfied. O(log n)
+
+        :param parent: element index to sift.
+        """
+        keys, priorities = self.keys, self.priorities
+        before = lt if self.is_min else gt
+        size = len(keys)
+        key, priority = keys[parent], priorities[parent]
+        child = 2 * parent + 1
+        while child < size:
+            if child + 1 < size and before(priorities[child + 1], priorities[child]):
+                child += 1
+            if not before(priorities[child], priority):
+                break
+            self.__move(keys[child], priorities[child], parent)
+            parent = child
+            child = 2 * parent + 1
+        self.__move(key, priority, parent)
+
+    def __index(self, key):
+        """
+        Return the position of a key. O(1)
+
+        :raises KeyError: If the key is not in the heap.
+        """
+        if key not in self.__positions:
+            raise KeyError("Key not found.")
+        return self.__positions[key]
+
+    def push(self, key, priority):
+        """
+        Insert a key with a priority and restore heap property. O(log n)
+
+        :param key: Hashable handle of the element.
+        :param priority: Value the heap is ordered by.
+
+        :raises KeyError: If the key is already present.
+        """
+        if key in self.__positions:
+            raise KeyError("Key already present.")
+        self.keys.append(key)
+        self.priorities.append(priority)
+        self.__sift_up(len(self.keys) - 1)
+
+    def pop(self):
+        """
+        Remove and return the root key and its priority. O(log n)
+
+        :return tuple: The (key, priority) pair with the minimal/maximal priority.
+
+        :raises ValueError: If the heap is empty.
+        """
+        if not self.keys:
+            raise ValueError("Heap is empty")
+        root = self.keys[0], self.priorities[0]
+        self.remove(root[0])
+        return root
+
+    def peek(self):
+        """
+        Return the root key and its priority. O(1)
+
+        :return tuple: The (key, priority) pair with the minimal/maximal priority.
+
+        :raises ValueError: If the heap is empty.
+        """
+        if not self.keys:
+            raise ValueError("Heap is empty")
+        return self.keys[0], self.priorities[0]
+
+    def get_priority(self, key):
+        """
+        Return the priority of a key. O(1)
+
+        :param key: The key to look up.
+        :return: The priority of the key.
+
+        :raises KeyError: If the key is not in the heap.
+        """
+        return self.priorities[self.__index(key)]
+
+    def update(self, key, priority):
+        """
+        Change the priority of a key, sifting it in whichever direction is needed. O(log n)
+
+        :param key: The key to update.
+        :param priority: The new priority.
+
+        :raises KeyError: If the key is not in the heap.
+        """
+        index = self.__index(key)
+        old = self.priorities[index]
+        self.priorities[index] = priority
+        if (lt if self.is_min else gt)(priority, old):
+            self.__sift_up(index)
+        else:
+            self.__sift_down(index)
+
+    def decrease_key(self, key, priority):
+        """
+        Move a key towards the root by giving it a priority no worse than its current one. O(log n)
+        For a max-heap this means increasing the priority.
+
+        :param key: The key to update.
+        :param priority: The new priority.
+
+        :raises KeyError: If the key is not in the heap.
+        :raises ValueError: If the new priority would move the key away from the root.
+        """
+        index = self.__index(key)
+        if (lt if self.is_min else gt)(self.priorities[index], priority):
+            raise ValueError("New priority moves the key away from the root.")
+        self.priorities[index] = priority
+        self.__sift_up(index)
+
+    def remove(self, key):
+        """
+        Remove a key from anywhere in the heap. O(log n)
+
+        :param key: The key to remove.
+        :return: The priority the key had.
+
+        :raises KeyError: If the key is not in the heap.
+        """
+        index = self.__index(key)
+        priority = self.priorities[index]
+        del self.__positions[key]
+        last_key, last_priority = self.keys.pop(), self.priorities.pop()
+        if index < len(self.keys):
+            self.__move(last_key, last_priority, index)
+            # The moved element may belong above or below its new slot.
+            self.__sift_up(index)
+            self.__sift_down(self.__positions[last_key])
+        return priority
+
+    def __contains__(self, key):
+        """
+        Return True if the key is in the heap. O(1)
+        """
+        return key in self.__positions
+
+    def __len__(self):
+        return len(self.keys)
+
+    def size(self):
+        """
+        Return the number of keys in the heap. O(1)
+
+        :return integer: the size of the heap.
+        """
+        return len(self.keys)
+
+    def isEmpty(self):
+        """
+        Check if the heap is empty. O(1)
+
+        :return: True if heap is empty, False otherwise.
+        """
+        return self.size() == 0
+
+
+class IndexedMinHeap(IndexedHeap):
+    def __init__(self):
+        """
+        Initialise the super class.
+        """
+        super().__init__(is_min=True)
+
+class IndexedMaxHeap(IndexedHeap):
+    def __init__(self):
+        """
+        Initialise the super class.
+        """
+        super().__init__(is_min=False)
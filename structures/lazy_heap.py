@@ -0,0 +1,178 @@
+from structures.heap import Heap
+from typing import override
+
+class LazyHeap(Heap):
+    """
+    Heap supporting removal of arbitrary elements by tombstoning.
+    A discarded element stays in the array until it reaches the root, where it is dropped, or until
+    dead elements make up more than max_dead_ratio of the array, when the array is compacted and
+    re-heapified in one linear pass. Elements must be hashable.
+    Space complexity of O(n).
+    """
+    def __init__(self, is_min=True, arity=2, max_dead_ratio=0.5):
+        """
+        Initialise the empty heap.
+
+        :param is_min: Signifies if the heap is a min- or max-heap.
+        :param arity: The maximum number of children of each node.
+        :param max_dead_ratio: Fraction of dead elements in the array above which it is compacted.
+
+        :raises ValueError: If max_dead_ratio is not between 0 and 1.
+        """
+        if not 0 <= max_dead_ratio < 1:
+            raise ValueError("Dead ratio must be in [0, 1).")
+        super().__init__(is_min=is_min, arity=arity)
+        self.max_dead_ratio = max_dead_ratio
+        self.__live = {}       # Dictionary linking an element to its number of live copies
+        self.__tombstones = {} # Dictionary linking an element to its number of discarded copies
+        self.__live_count = 0
+        self.__dead_count = 0
+
+    @staticmethod
+    def __increment(counts, item, step):
+        """Add step to the count of an item, dropping the entry once it reaches zero. O(1)"""
+        count = counts.get(item, 0) + step
+        if count:
+            counts[item] = count
+        else:
+            del counts[item]
+
+    def __drop_dead_root(self):
+        """Pop discarded elements off the root until a live one or nothing remains. O(d log n)"""
+        while self.data and self.data[0] in self.__tombstones:
+            self.__increment(self.__tombstones, self.data[0], -1)
+            self.__dead_count -= 1
+            super().pop()
+
+    @override
+    def heapify(self):
+        """
+        Drop every discarded element from the array and restore the heap property. O(n)
+        """
+        if self.__tombstones:
+            data = []
+            for item in self.data:
+                if item in self.__tombstones:
+                    self.__increment(self.__tombstones, item, -1)
+                else:
+                    data.append(item)
+            self.data = data
+        self.__live = {}
+        for item in self.data:
+            self.__increment(self.__live, item, 1)
+        self.__live_count = len(self.data)
+        self.__tombstones = {}
+        self.__dead_count = 0
+        super().heapify()
+
+    @override
+    def push(self, value):
+        """
+        Insert an element and restore heap property. O(log n)
+
+        :param value: Data to insert.
+        """
+        super().push(value)
+        self.__increment(self.__live, value, 1)
+        self.__live_count += 1
+
+    @override
+    def pop(self):
+        """
+        Remove and return the root live element. O(log n) amortized
+
+        :return element: the maximal/minimal live element.
+
+        :raises ValueError: If the heap has no live elements.
+        """
+        self.__drop_dead_root()
+        root = super().pop()
+        self.__increment(self.__live, root, -1)
+        self.__live_count -= 1
+        return root
+
+    @override
+    def pushpop(self, value):
+        """
+        Push an element then pop the root live element, in a single sift. O(log n) amortized
+
+        :param value: Data to insert.
+        :return element: the maximal/minimal element of the live elements and the new element.
+        """
+        self.__drop_dead_root()
+        root = super().pushpop(value)
+        if root is not value:
+            self.__increment(self.__live, value, 1)
+            self.__increment(self.__live, root, -1)
+        return root
+
+    @override
+    def replace(self, value):
+        """
+        Pop the root live element then push an element, in a single sift. O(log n) amortized
+
+        :param value: Data to insert.
+        :return element: the maximal/minimal live element before the insertion.
+
+        :raises ValueError: If the heap has no live elements.
+        """
+        self.__drop_dead_root()
+        root = super().replace(value)
+        self.__increment(self.__live, value, 1)
+        self.__increment(self.__live, root, -1)
+        return root
+
+    @override
+    def peek(self):
+        """
+        Return the smallest/largest live element in the heap. O(1) amortized
+
+        :return element: The smallest/largest live element in the heap.
+
+        :raises ValueError: If the heap has no live elements.
+        """
+        self.__drop_dead_root()
+        if not self.data:
+            raise ValueError("Heap is empty")
+        return self.data[0]
+
+    def discard(self, item):
+        """
+        Remove one live copy of an element, if present, by tombstoning it. O(1) amortized
+        Compacts the array once dead elements exceed max_dead_ratio of it.
+
+        :param item: The element to remove.
+        :return bool: True if a copy was removed, False if the element was not in the heap.
+        """
+        if item not in self.__live:
+            return False
+        self.__increment(self.__live, item, -1)
+        self.__increment(self.__tombstones, item, 1)
+        self.__live_count -= 1
+        self.__dead_count += 1
+        if self.__dead_count > self.max_dead_ratio * len(self.data):
+            self.heapify()
+        return True
+
+    def __contains__(self, item):
+        """
+        Return True if a live copy of the element is in the heap. O(1)
+        """
+        return item in self.__live
+
+    def dead_count(self):
+        """
+        Return the number of discarded elements still held in the array. O(1)
+
+        :return integer: The number of dead elements.
+        """
+        return self.__dead_count
+
+    @override
+    def size(self):
+        """
+        Return the number of live elements in the heap. O(1)
+
+        :return integer: the size of the heap.
+        """
+        return self.__live_count
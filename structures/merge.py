@@ -0,0 +1,35 @@
+from structures.heap import HeapEntry, MinHeap, MaxHeap
+
+_EXHAUSTED = object() # Returned by next() once a source has no items left
+
+def merge(*iterables, key=None, reverse=False):
+    """
+    Lazily merge several sorted iterables into a single sorted stream. O(n log k) for n items from k sources
+    The heap holds one HeapEntry of (value, source id, item) per non-exhausted source, so only k items are in
+    memory, and the next item is pulled from a source only once its previous item has been yielded.
+    Equal items are yielded in the order of the sources they came from.
+
+    :param iterables: The sorted sources, each ordered by key and in the direction given by reverse.
+    :param key: Function computing the value items are ordered by, None to order the items themselves.
+    :param reverse: True if the sources are sorted largest first.
+
+    :return generator: The merged items.
+    """
+    heap = MaxHeap() if reverse else MinHeap()
+    sign = -1 if reverse else 1 # Keeps lower source ids first whichever direction the heap orders in
+    sources = []
+    for source_id, iterable in enumerate(iterables):
+        iterator = iter(iterable)
+        sources.append(iterator)
+        item = next(iterator, _EXHAUSTED)
+        if item is not _EXHAUSTED:
+            heap.data.append(HeapEntry(item if key is None else key(item), sign * source_id, item))
+    heap.heapify()
+    while heap.data:
+        order, item = heap.data[0].seq, heap.data[0].item
+        yield item
+        item = next(sources[sign * order], _EXHAUSTED)
+        if item is _EXHAUSTED:
+            heap.pop()
+        else:
+            heap.replace(HeapEntry(item if key is None else key(item), order, item))
@@ -0,0 +1,99 @@
+import sys
+import tracemalloc
+from functools import cache
+
+@cache
+def _node_bytes(node_class, slotted=True, samples=1000):
+    """
+    Measure the bytes allocated per node of a class, or of an equivalent class without __slots__.
+    Measured with tracemalloc, since sys.getsizeof misses the garbage collector header and the
+    attribute storage of unslotted objects. Cached, as the result depends only on the class.
+
+    :param node_class: The slotted node class.
+    :param slotted: False to measure a copy of the class that keeps its attributes in a __dict__.
+    :param samples: The number of nodes allocated to average over.
+
+    :return float: Bytes per node.
+    """
+    if slotted:
+        factory = lambda: node_class(None)
+    else:
+        names = node_class.__slots__
+        def __init__(self):
+            for name in names:
+                setattr(self, name, None)
+        factory = type("Unslotted" + node_class.__name__, (), {"__init__": __init__})
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    nodes = [factory() for _ in range(samples)]
+    allocated = tracemalloc.get_traced_memory()[0] - before - sys.getsizeof(nodes)
+    if not tracing:
+        tracemalloc.stop()
+    return allocated / samples
+
+
+class NodePool:
+    """
+    Mixin keeping a bounded free list of detached nodes for a linked structure to reuse.
+    A node is reset by re-running its __init__, so a reused node is indistinguishable from a new one
+    and every node class whose __init__ takes its data first can be pooled.
+    Space complexity of O(pool_size).
+    """
+    def __init__(self, node_class, pool_size=0):
+        """
+        Initialise an empty pool.
+
+        :param node_class: The class of the nodes of the structure.
+        :param pool_size: The maximum number of detached nodes kept for reuse, 0 to disable pooling.
+        """
+        self.pool_size = pool_size
+        self._node_class = node_class
+        self._pool = [] # Detached nodes available for reuse
+
+    def _new_node(self, *args):
+        """
+        Return a node built from args, reusing a pooled node if one is available. O(1)
+
+        :param args: The arguments of the node class constructor.
+        """
+        if not self._pool:
+            return self._node_class(*args)
+        node = self._pool.pop()
+        node.__init__(*args)
+        return node
+
+    def _release(self, node):
+        """
+        Reset a detached node, dropping its references, and keep it for reuse if the pool has room. O(1)
+
+        :param node: The node removed from the structure.
+        """
+        node.__init__(None)
+        if len(self._pool) < self.pool_size:
+            self._pool.append(node)
+
+    def memory_stats(self):
+        """
+        Report the memory used by the nodes, excluding the data they reference, next to what the same
+        nodes would use without __slots__, with attributes in a per-instance __dict__. O(1)
+        Call before and after a workload to compare.
+
+        :return dict: Number of elements and pooled nodes, bytes per node with and without slots, and
+            total node bytes and node bytes per element, including the pool, with and without slots.
+        """
+        elements = len(self)
+        nodes = elements + len(self._pool)
+        node_bytes = _node_bytes(self._node_class)
+        unslotted_bytes = _node_bytes(self._node_class, slotted=False)
+        return {
+            "elements": elements,
+            "pooled_nodes": len(self._pool),
+            "bytes_per_node": node_bytes,
+            "unslotted_bytes_per_node": unslotted_bytes,
+            "total_bytes": node_bytes * nodes,
+            "unslotted_total_bytes": unslotted_bytes * nodes,
+            "bytes_per_element": node_bytes * nodes / elements if elements else 0.0,
+            "unslotted_bytes_per_element": unslotted_bytes * nodes / elements if elements else 0.0,
+        }
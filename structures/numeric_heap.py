@@ -0,0 +1,261 @@
+from array import array
+from operator import lt, gt
+
+try:
+    import numpy as np
+except ImportError: # NumPy is optional, only used to speed up batch operations
+    np = None
+
+class NumericHeap:
+    """
+    Heap of numeric priorities with integer payload ids, stored in parallel typed arrays.
+    Each element costs 16 bytes (an 8 byte priority and an 8 byte id) instead of a pointer to a
+    boxed Python object, and batches can be pushed and popped in one call, using NumPy if installed.
+    Space complexity of O(n).
+    """
+    TYPECODES = ('d', 'q') # Double precision floats or signed 64-bit integers
+
+    def __init__(self, is_min=True, typecode='d'):
+        """
+        Initialise the empty heap, laid out as in Heap with priorities[i] belonging to ids[i].
+
+        :param is_min: Signifies if the heap is a min- or max-heap.
+        :param typecode: The array typecode of the priorities, 'd' for floats or 'q' for integers.
+
+        :raises ValueError: If the typecode is not supported.
+        """
+        if typecode not in self.TYPECODES:
+            raise ValueError("Typecode must be 'd' or 'q'.")
+        self.priorities = array(typecode)
+        self.ids = array('q')
+        self.is_min = is_min
+        self.__next_id = 0 # Id given to the next element pushed without one
+        self.__scratch = array(typecode, [0]), array('q', [0]) # Converts a pushed pair before it is stored
+
+    def __sift_up(self, child):
+        """
+        Sift an element up the heap until the heap condition is satisfied. O(log n)
+
+        :param child: element index to sift.
+        """
+        priorities, ids = self.priorities, self.ids
+        before = lt if self.is_min else gt
+        priority, payload = priorities[child], ids[child]
+        while child > 0:
+            parent = (child - 1) >> 1
+            if not before(priority, priorities[parent]):
+                break
+            priorities[child], ids[child] = priorities[parent], ids[parent]
+            child = parent
+        priorities[child], ids[child] = priority, payload
+
+    def __sift_down(self, parent):
+        """
+        Sift an element down the heap until the heap condition is satisfied. O(log n)
+
+        :param parent: element index to sift.
+        """
+        priorities, ids = self.priorities, self.ids
+        before = lt if self.is_min else gt
+        size = len(priorities)
+        priority, payload = priorities[parent], ids[parent]
+        child = 2 * parent + 1
+        while child < size:
+            if child + 1 < size and before(priorities[child + 1], priorities[child]):
+                child += 1
+            if not before(priorities[child], priority):
+                break
+            priorities[parent], ids[parent] = priorities[child], ids[child]
+            parent = child
+            child = 2 * parent + 1
+        priorities[parent], ids[parent] = priority, payload
+
+    def heapify(self):
+        """
+        Restore the heap property over the whole arrays using Floyd's bottom-up algorithm. O(n)
+        """
+        for index in range(len(self.priorities) // 2 - 1, -1, -1):
+            self.__sift_down(index)
+
+    def push(self, priority, payload=None):
+        """
+        Insert a priority with its payload id and restore heap property. O(log n)
+
+        :param priority: The number the heap is ordered by.
+        :param payload: Integer id of the element, None to use the next unused sequential id.
+
+        :return integer: The payload id.
+
+        :raises ValueError: If the priority does not fit the typecode or the payload is not a 64-bit integer.
+        """
+        priority_slot, id_slot = self.__scratch
+        try:
+            priority_slot[0] = priority
+            id_slot[0] = self.__next_id if payload is None else payload
+        except (TypeError, OverflowError) as error:
+            typecode = self.priorities.typecode
+            raise ValueError(f"Cannot store ({priority!r}, {payload!r}) in a '{typecode}' heap.") from error
+        priority, payload = priority_slot[0], id_slot[0]
+        self.__next_id = max(self.__next_id, payload + 1)
+        self.priorities.append(priority)
+        self.ids.append(payload)
+        self.__sift_up(len(self.priorities) - 1)
+        return payload
+
+    def push_many(self, priorities, payloads=None):
+        """
+        Insert a batch of priorities with their payload ids. O(min(m log(n+m), n+m))
+        NumPy arrays are copied into the typed arrays as raw bytes, and batches larger than the heap
+        are appended whole and re-heapified in one linear pass.
+
+        :param priorities: Iterable or NumPy array of priorities.
+        :param payloads: Iterable or NumPy array of integer ids, None to use sequential ids.
+
+        :raises ValueError: If priorities and payloads differ in length, or do not fit their typecodes.
+        """
+        new_priorities = self.__to_array(priorities, self.priorities.typecode)
+        if payloads is None:
+            new_ids = array('q', range(self.__next_id, self.__next_id + len(new_priorities)))
+        else:
+            new_ids = self.__to_array(payloads, 'q')
+            if len(new_ids) != len(new_priorities):
+                raise ValueError("Priorities and payloads differ in length.")
+        if new_ids:
+            self.__next_id = max(self.__next_id, max(new_ids) + 1)
+        start = len(self.priorities)
+        self.priorities.extend(new_priorities)
+        self.ids.extend(new_ids)
+        if len(new_priorities) > start:
+            self.heapify()
+        else:
+            for index in range(start, len(self.priorities)):
+                self.__sift_up(index)
+
+    @staticmethod
+    def __to_array(values, typecode):
+        """
+        Convert values to a typed array, copying NumPy arrays as raw bytes. O(m)
+
+        :param values: Iterable or NumPy array of numbers.
+        :param typecode: The typecode of the result.
+
+        :return array: The values as a typed array.
+
+        :raises ValueError: If the values cannot be stored with the typecode without loss, e.g. floats in 'q'.
+        """
+        if np is not None and isinstance(values, np.ndarray):
+            if not np.can_cast(values.dtype, typecode, casting='safe'):
+                raise ValueError(f"Cannot store {values.dtype} values in a '{typecode}' array without loss.")
+            converted = array(typecode)
+            converted.frombytes(np.ascontiguousarray(values, dtype=converted.typecode).tobytes())
+            return converted
+        try:
+            return array(typecode, values)
+        except (TypeError, OverflowError) as error:
+            raise ValueError(f"Cannot store the values in a '{typecode}' array.") from error
+
+    def pop(self):
+        """
+        Remove and return the root priority and its payload id. O(log n)
+
+        :return tuple: The (priority, id) pair with the minimal/maximal priority.
+
+        :raises ValueError: If the heap is empty.
+        """
+        if not self.priorities:
+            raise ValueError("Heap is empty")
+        root = self.priorities[0], self.ids[0]
+        last_priority, last_id = self.priorities.pop(), self.ids.pop()
+        if self.priorities:
+            self.priorities[0], self.ids[0] = last_priority, last_id
+            self.__sift_down(0)
+        return root
+
+    def pop_many(self, k):
+        """
+        Remove and return the k best priorities and their payload ids, best first. O(k log n)
+        With NumPy installed, large batches are selected with a partial sort of the whole heap and the
+        remainder re-heapified, O(n + k log k), instead of popped one by one.
+
+        :param k: The number of elements to pop.
+        :return array, array: The popped priorities and their ids.
+
+        :raises ValueError: If fewer than k elements are in the heap.
+        """
+        n = len(self.priorities)
+        if k > n:
+            raise ValueError("Heap has fewer than k elements.")
+        if np is not None and k > 0 and k * max(n.bit_length(), 1) > n:
+            return self.__pop_many_numpy(k)
+        priorities, ids = array(self.priorities.typecode), array('q')
+        for _ in range(k):
+            priority, payload = self.pop()
+            priorities.append(priority)
+            ids.append(payload)
+        return priorities, ids
+
+    def __pop_many_numpy(self, k):
+        """
+        Select the k best elements with NumPy and rebuild the heap from the rest. O(n + k log k)
+
+        :param k: The number of elements to pop, at least 1.
+        :return array, array: The popped priorities and their ids.
+        """
+        priorities = np.array(self.priorities)
+        ids = np.array(self.ids)
+        n = len(priorities)
+        # Max-heaps select from the top end instead of negating, which overflows for the minimum int64.
+        if k == n:
+            chosen = np.arange(n)
+        elif self.is_min:
+            chosen = np.argpartition(priorities, k - 1)[:k]
+        else:
+            chosen = np.argpartition(priorities, n - k)[n - k:]
+        chosen = chosen[np.argsort(priorities[chosen], kind="stable")]
+        if not self.is_min:
+            chosen = chosen[::-1]
+        remaining = np.ones(len(priorities), dtype=bool)
+        remaining[chosen] = False
+        self.priorities = self.__to_array(priorities[remaining], self.priorities.typecode)
+        self.ids = self.__to_array(ids[remaining], 'q')
+        self.heapify()
+        return self.__to_array(priorities[chosen], self.priorities.typecode), self.__to_array(ids[chosen], 'q')
+
+    def peek(self):
+        """
+        Return the root priority and its payload id. O(1)
+
+        :return tuple: The (priority, id) pair with the minimal/maximal priority.
+
+        :raises ValueError: If the heap is empty.
+        """
+        if not self.priorities:
+            raise ValueError("Heap is empty")
+        return self.priorities[0], self.ids[0]
+
+    def nbytes(self):
+        """
+        Return the number of bytes used by the stored elements. O(1)
+
+        :return integer: Bytes used by the priority and id arrays.
+        """
+        return len(self.priorities) * (self.priorities.itemsize + self.ids.itemsize)
+
+    def __len__(self):
+        return len(self.priorities)
+
+    def size(self):
+        """
+        Return the size of the heap, i.e., the number of elements in the heap. O(1)
+
+        :return integer: the size of the heap.
+        """
+        return len(self.priorities)
+
+    def isEmpty(self):
+        """
+        Check if the heap is empty. O(1)
+
+        :return: True if heap is empty, False otherwise.
+        """
+        return self.size() == 0
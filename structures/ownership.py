@@ -0,0 +1,26 @@
+class Owner:
+    """
+    Ownership token of a linked structure, recorded on its nodes so that a handle can be checked to
+    belong to it. When a structure absorbs the nodes of another, the token of the other forwards to
+    the token of the absorbing one instead of every node being relabelled.
+    """
+    __slots__ = ('forward',)
+
+    def __init__(self):
+        """Initialize a token that does not forward."""
+        self.forward = None # Stores the token this one forwards to, or None
+
+    def resolve(self):
+        """
+        Return the token at the end of the forwarding chain, pointing every token walked directly at it.
+        O(log n) amortised
+
+        :return Owner: The token of the structure currently holding the nodes labelled with this one.
+        """
+        root = self
+        while root.forward is not None:
+            root = root.forward
+        token = self
+        while token is not root:
+            token.forward, token = root, token.forward
+        return root
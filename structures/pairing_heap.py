@@ -0,0 +1,207 @@
+from operator import lt, gt
+from structures.ownership import Owner
+
+class PairingNode:
+    """
+    A node in a pairing heap.
+    """
+    __slots__ = ('value', 'child', 'sibling', 'prev', 'owner')
+
+    def __init__(self, value, owner=None):
+        """Initialize a node with no children."""
+        self.value = value  # The data of the node
+        self.child = None   # Pointer to the leftmost child
+        self.sibling = None # Pointer to the next sibling to the right
+        self.prev = None    # Pointer to the previous sibling, or to the parent for a leftmost child
+        self.owner = owner  # Ownership token of the heap holding the node, None once popped
+
+class PairingHeap:
+    """
+    Meldable heap implementation for min- and max-heaps.
+    A heap-ordered multiway tree where two heaps are joined by making the worse root the leftmost
+    child of the better one, so meld is O(1) and the restructuring is deferred to pop.
+    Space complexity: O(n)
+    """
+    def __init__(self, is_min=True):
+        """
+        Initialise the empty heap, storing a flag defining if the heap is a min- or max-heap.
+
+        :param is_min: Signifies if the heap is a min- or max-heap.
+        """
+        self.root = None
+        self.is_min = is_min
+        self.__size = 0
+        self.__owner = Owner() # Ownership token of the nodes of this heap
+
+    def __link(self, a, b):
+        """
+        Join two roots, the worse becoming the leftmost child of the better. O(1)
+
+        :param a: The first root, or None.
+        :param b: The second root, or None.
+
+        :return PairingNode: The root of the joined tree.
+        """
+        if a is None:
+            return b
+        if b is None:
+            return a
+        if (lt if self.is_min else gt)(b.value, a.value):
+            a, b = b, a
+        b.prev = a
+        b.sibling = a.child
+        if a.child is not None:
+            a.child.prev = b
+        a.child = b
+        a.sibling = None
+        a.prev = None
+        return a
+
+    def __merge_pairs(self, first):
+        """
+        Combine a list of sibling subtrees into one tree with the two-pass pairing strategy. O(k)
+        Siblings are linked in pairs from left to right, then the pairs are linked from right to left.
+
+        :param first: The leftmost sibling, or None.
+
+        :return PairingNode: The root of the combined tree.
+        """
+        pairs = []
+        while first is not None:
+            second = first.sibling
+            if second is None:
+                first.prev = None
+                pairs.append(first)
+                break
+            following = second.sibling
+            first.sibling = second.sibling = first.prev = second.prev = None
+            pairs.append(self.__link(first, second))
+            first = following
+        root = None
+        while pairs:
+            root = self.__link(pairs.pop(), root)
+        return root
+
+    def push(self, value):
+        """
+        Insert an element. O(1)
+
+        :param value: Data to insert.
+
+        :return PairingNode: Handle of the element, for use with decrease_key.
+        """
+        node = PairingNode(value, self.__owner)
+        self.root = self.__link(self.root, node)
+        self.__size += 1
+        return node
+
+    def pop(self):
+        """
+        Remove and return root element. O(log n) amortized
+
+        :return element: the maximal/minimal element.
+
+        :raises ValueError: If the heap is empty.
+        """
+        if self.root is None:
+            raise ValueError("Heap is empty")
+        root = self.root
+        self.root = self.__merge_pairs(root.child)
+        root.child = None
+        root.owner = None
+        self.__size -= 1
+        return root.value
+
+    def peek(self):
+        """
+        Return the smallest/largest element in the heap. O(1)
+
+        :return element: The smallest/largest element in the heap.
+
+        :raises ValueError: If the heap is empty.
+        """
+        if self.root is None:
+            raise ValueError("Heap is empty")
+        return self.root.value
+
+    def meld(self, other):
+        """
+        Move every element of another pairing heap into this one, leaving the other empty. O(1)
+        Handles of the moved elements now belong to this heap.
+
+        :param other: The heap to absorb.
+
+        :raises ValueError: If the heaps are not both min- or both max-heaps.
+        """
+        if other.is_min != self.is_min:
+            raise ValueError("Cannot meld a min-heap with a max-heap.")
+        if other is self:
+            return
+        self.root = self.__link(self.root, other.root)
+        self.__size += other.size()
+        other.root = None
+        other.__size = 0
+        other.__owner.forward = self.__owner
+        other.__owner = Owner()
+
+    def decrease_key(self, node, value):
+        """
+        Move an element towards the root by giving it a value no worse than its current one. O(log n) amortized
+        For a max-heap this means increasing the value. The subtree of the node is cut out and re-linked
+        with the root.
+
+        :param node: Handle returned by push for an element still in the heap.
+        :param value: The new value.
+
+        :raises ValueError: If the node was popped or belongs to another heap, or if the new value would
+            move the element away from the root.
+        """
+        if node.owner is None:
+            raise ValueError("Node was popped.")
+        node.owner = node.owner.resolve()
+        if node.owner is not self.__owner:
+            raise ValueError("Node belongs to another heap.")
+        if (lt if self.is_min else gt)(node.value, value):
+            raise ValueError("New value moves the element away from the root.")
+        node.value = value
+        if node is self.root:
+            return
+        if node.prev.child is node:
+            node.prev.child = node.sibling
+        else:
+            node.prev.sibling = node.sibling
+        if node.sibling is not None:
+            node.sibling.prev = node.prev
+        node.prev = node.sibling = None
+        self.root = self.__link(self.root, node)
+
+    def size(self):
+        """
+        Return the size of the heap, i.e., the number of elements in the heap. O(1)
+
+        :return integer: the size of the heap.
+        """
+        return self.__size
+
+    def isEmpty(self):
+        """
+        Check if the heap is empty. O(1)
+
+        :return: True if heap is empty, False otherwise.
+        """
+        return self.size() == 0
+
+
+class MinPairingHeap(PairingHeap):
+    def __init__(self):
+        """
+        Initialise the super class.
+        """
+        super().__init__(is_min=True)
+
+class MaxPairingHeap(PairingHeap):
+    def __init__(self):
+        """
+        Initialise the super class.
+        """
+        super().__init__(is_min=False)
@@ -1,31 +1,33 @@
 from structures.data_store import DataStore
+from structures.heap import HeapEntry, MinHeap
 from typing import override
 
 class PriorityQueue(DataStore):
     """
-    A queue implementation.
+    A priority queue implementation backed by a min-heap.
+    Elements are stored in entries with a sequence number, so elements of equal value, including
+    elements only ordered by __lt__, leave the queue in the order they were added.
     Space complexity of O(n).
     """
     def __init__(self):
         """Initialize an empty queue."""
-        self.__store = []
+        self.__heap = MinHeap()
+        self.__counter = 0 # Sequence number given to the next element added
 
     @override
     def add(self, data):
         """
-        Add an element to the back of the sub-queue consisting of lower value items. O(n)
+        Add an element behind all elements of lower or equal value. O(log n)
 
         :param data: The data to add.
         """
-        index = len(self.__store)
-        while index > 0 and self.__store[index-1] > data:
-            index -= 1
-        self.__store.insert(index, data)
+        self.__heap.push(HeapEntry(data, self.__counter))
+        self.__counter += 1
 
     @override
     def get(self):
         """
-        Get and delete the element at the front of the queue. O(n)
+        Get and delete the element at the front of the queue. O(log n)
 
         :return: The data at the index.
 
@@ -33,7 +35,7 @@ class PriorityQueue(DataStore):
         """
         if self.isEmpty():
             raise IndexError("Queue is empty.")
-        return self.__store.pop(0)
+        return self.__heap.pop().key
 
     @override
     def peek(self):
@@ -46,18 +48,75 @@ class PriorityQueue(DataStore):
         """
         if self.isEmpty():
             raise IndexError("Queue is empty.")
-        return self.__store[0]
+        return self.__heap.peek().key
+
+    @override
+    def add_many(self, iterable):
+        """
+        Add every element of an iterable, in order. O(min(m log(n+m), n+m))
+        Large batches are appended and re-heapified in one linear pass instead of pushed one by one.
+
+        :param iterable: The data to add.
+        """
+        entries = [HeapEntry(data, self.__counter + i) for i, data in enumerate(iterable)]
+        self.__counter += len(entries)
+        if len(entries) > self.__heap.size():
+            self.__heap.data.extend(entries)
+            self.__heap.heapify()
+        else:
+            for entry in entries:
+                self.__heap.push(entry)
+
+    @override
+    def get_many(self, n):
+        """
+        Get and delete the n lowest-value elements. O(n log m)
+
+        :param n: The number of elements to retrieve.
+        :return list: The data in the order it was retrieved.
+
+        :raises IndexError: If fewer than n elements are in the queue.
+        """
+        if n > self.__heap.size():
+            raise IndexError("Queue has fewer than n elements.")
+        return [self.__heap.pop().key for _ in range(n)]
+
+    @override
+    def peek_many(self, indices):
+        """
+        Return the elements at several positions in retrieval order. O(n log n + k)
+
+        :param indices: Iterable of positions, 0 being the front and -1 the back.
+        :return list: The data at each position, in the order the positions were given.
+
+        :raises IndexError: If a position is out of bounds.
+        """
+        ordered = sorted(self.__heap.data)
+        items = []
+        for index in indices:
+            if index < -len(ordered) or index >= len(ordered):
+                raise IndexError("Index out of bounds.")
+            items.append(ordered[index].key)
+        return items
 
     def isEmpty(self):
         """
-        Return True if the stack is empty, False otherwise. O(1)
+        Return True if the queue is empty, False otherwise. O(1)
+
+        :return bool: True if the queue is empty, False otherwise.
+        """
+        return self.__heap.isEmpty()
+
+    def __len__(self):
+        """
+        Return the number of elements in the queue. O(1)
 
-        :return bool: True if the list is empty, False otherwise.
+        :return int: Length of the queue.
         """
-        return self.__store == []
+        return self.__heap.size()
 
     def __str__(self):
-        return f"{str(self.__store)[:-1]}, ...]"
+        return f"{str([entry.key for entry in sorted(self.__heap.data)])[:-1]}, ...]"
 
     def __repr__(self):
-        return self.__str__()
\ No newline at end of file
+        return self.__str__()
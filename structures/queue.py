@@ -3,26 +3,50 @@ from typing import override
 
 class Queue(DataStore):
     """
-    A queue implementation.
+    A queue implementation backed by a circular buffer.
     Space complexity of O(n).
     """
+    MIN_CAPACITY = 8
+
     def __init__(self):
-        """Initialize an empty queue."""
-        self.__store = []
+        """
+        Initialize an empty queue.
+            The buffer is a fixed-size list with a head index and element count, the tail being
+            (head + size) % capacity. It doubles when full and halves when a quarter full.
+        """
+        self.__store = [None] * self.MIN_CAPACITY
+        self.__head = 0 # Index of the element at the front of the queue
+        self.__size = 0 # Number of elements in the queue
+
+    def __resize(self, capacity):
+        """
+        Copy the elements, in order, into a new buffer of the given capacity. O(n)
+
+        :param capacity: The capacity of the new buffer.
+        """
+        store = [None] * capacity
+        old_capacity = len(self.__store)
+        for i in range(self.__size):
+            store[i] = self.__store[(self.__head + i) % old_capacity]
+        self.__store = store
+        self.__head = 0
 
     @override
     def add(self, data):
         """
-        Add an element to the back of the queue. O(1)
+        Add an element to the back of the queue. O(1) amortized
 
         :param data: The data to add.
         """
-        self.__store.append(data)
+        if self.__size == len(self.__store):
+            self.__resize(2 * len(self.__store))
+        self.__store[(self.__head + self.__size) % len(self.__store)] = data
+        self.__size += 1
 
     @override
     def get(self):
         """
-        Get and delete the element at the front of the queue. O(n)
+        Get and delete the element at the front of the queue. O(1) amortized
 
         :return: The data at the index.
 
@@ -30,7 +54,13 @@ class Queue(DataStore):
         """
         if self.isEmpty():
             raise IndexError("Queue is empty.")
-        return self.__store.pop(0)
+        data = self.__store[self.__head]
+        self.__store[self.__head] = None # Drop the reference so the item can be collected
+        self.__head = (self.__head + 1) % len(self.__store)
+        self.__size -= 1
+        if len(self.__store) > self.MIN_CAPACITY and self.__size <= len(self.__store) // 4:
+            self.__resize(len(self.__store) // 2)
+        return data
 
     @override
     def peek(self):
@@ -43,18 +73,95 @@ class Queue(DataStore):
         """
         if self.isEmpty():
             raise IndexError("Queue is empty.")
-        return self.__store[0]
+        return self.__store[self.__head]
+
+    @override
+    def add_many(self, iterable):
+        """
+        Add every element of an iterable to the back of the queue, growing the buffer at most once. O(m)
+
+        :param iterable: The data to add.
+        """
+        items = list(iterable)
+        capacity = len(self.__store)
+        if self.__size + len(items) > capacity:
+            while self.__size + len(items) > capacity:
+                capacity *= 2
+            self.__resize(capacity)
+        tail = self.__head + self.__size
+        for data in items:
+            self.__store[tail % capacity] = data
+            tail += 1
+        self.__size += len(items)
+
+    @override
+    def get_many(self, n):
+        """
+        Get and delete n elements from the front of the queue, shrinking the buffer at most once. O(n)
+
+        :param n: The number of elements to retrieve.
+        :return list: The data in the order it was retrieved.
+
+        :raises IndexError: If fewer than n elements are in the queue.
+        """
+        if n > self.__size:
+            raise IndexError("Queue has fewer than n elements.")
+        if n <= 0:
+            return []
+        capacity = len(self.__store)
+        items = [None] * n
+        for i in range(n):
+            index = (self.__head + i) % capacity
+            items[i] = self.__store[index]
+            self.__store[index] = None
+        self.__head = (self.__head + n) % capacity
+        self.__size -= n
+        while capacity > self.MIN_CAPACITY and self.__size <= capacity // 4:
+            capacity //= 2
+        if capacity != len(self.__store):
+            self.__resize(capacity)
+        return items
+
+    @override
+    def peek_many(self, indices):
+        """
+        Return the elements at several positions from the front of the queue. O(k)
+
+        :param indices: Iterable of positions, 0 being the front and -1 the back.
+        :return list: The data at each position, in the order the positions were given.
+
+        :raises IndexError: If a position is out of bounds.
+        """
+        capacity = len(self.__store)
+        items = []
+        for index in indices:
+            if index < 0:
+                index += self.__size
+            if index < 0 or index >= self.__size:
+                raise IndexError("Index out of bounds.")
+            items.append(self.__store[(self.__head + index) % capacity])
+        return items
 
     def isEmpty(self):
         """
-        Return True if the stack is empty, False otherwise. O(1)
+        Return True if the queue is empty, False otherwise. O(1)
+
+        :return bool: True if the queue is empty, False otherwise.
+        """
+        return self.__size == 0
+
+    def __len__(self):
+        """
+        Return the number of elements in the queue. O(1)
 
-        :return bool: True if the list is empty, False otherwise.
+        :return int: Length of the queue.
         """
-        return self.__store == []
+        return self.__size
 
     def __str__(self):
-        return f"{str(self.__store)[:-1]}, ...]"
+        capacity = len(self.__store)
+        items = [self.__store[(self.__head + i) % capacity] for i in range(self.__size)]
+        return f"{str(items)[:-1]}, ...]"
 
     def __repr__(self):
-        return self.__str__()
\ No newline at end of file
+        return self.__str__()
@@ -1,24 +1,69 @@
+from itertools import islice
 from structures.data_store import DataStore
+from structures.node_pool import NodePool
 from typing import override
 
 class Node:
     """
     A node in a singly linked list.
     """
+    __slots__ = ('data', 'next')
+
     def __init__(self, data):
         """Initialize an empty node."""
         self.data = data # Stores the data at this node
         self.next = None # Stores the reference to the next element
 
-class SingularlyLinkedList(DataStore):
+class SingularlyLinkedList(DataStore, NodePool):
     """
     A singularly linked list implementation.
+    The length is kept in a counter, and a finger remembers the last node reached by index so that
+    sequential and nearby forward accesses resume from it instead of walking from the head.
     Space complexity of O(n).
     """
-    def __init__(self):
-        """Initialize an empty singularly linked list."""
-        super().__init__()
+    STR_LIMIT = 1000 # Maximum number of elements written out by __str__
+
+    def __init__(self, pool_size=0):
+        """
+        Initialize an empty singularly linked list.
+            Removed nodes are kept, up to pool_size of them, and reused by later insertions instead of
+            allocating new nodes.
+
+        :param pool_size: The maximum number of detached nodes kept for reuse, 0 to disable pooling.
+        """
+        NodePool.__init__(self, Node, pool_size)
         self.__head = None # Stores the reference to the first element in the list
+        self.__size = 0    # Number of elements in the list
+        self.__finger = None      # Stores the reference to the last node reached by index, or None
+        self.__finger_index = 0   # Index of the finger node
+
+    def __node_at(self, index):
+        """
+        Return the node at a valid index, starting from the finger when it is not past the index,
+        and move the finger there. O(distance from the finger or the head)
+
+        :param index: The index of the node, in [0, len).
+        """
+        if self.__finger is not None and self.__finger_index <= index:
+            current, counter = self.__finger, self.__finger_index
+        else:
+            current, counter = self.__head, 0
+        while counter < index:
+            current = current.next
+            counter += 1
+        self.__finger, self.__finger_index = current, index
+        return current
+
+    def __forget_first(self, n):
+        """
+        Update the finger after the first n nodes are removed. O(1)
+
+        :param n: The number of nodes removed from the head.
+        """
+        if self.__finger_index < n:
+            self.__finger = None
+        else:
+            self.__finger_index -= n
 
     @override
     def add(self, data):
@@ -27,14 +72,16 @@ class SingularlyLinkedList(DataStore):
 
         :param data: The data to pre-pend.
         """
-        new_node = Node(data)
+        new_node = self._new_node(data)
         new_node.next = self.__head
         self.__head = new_node
+        self.__size += 1
+        self.__finger_index += 1
 
     @override
     def insert(self, index, data):
         """
-        Insert an element at the given index in the list. O(n)
+        Insert an element at the given index in the list. O(n), O(1) next to the last accessed index
 
         :param index: Index at which to insert.
         :param data: The data to insert.
@@ -42,25 +89,22 @@ class SingularlyLinkedList(DataStore):
         :raises IndexError: If index is out of bounds.
         """
         if index < 0:
-            index += len(self) + 1
-        if index < 0 or index > len(self):
+            index += self.__size + 1
+        if index < 0 or index > self.__size:
             raise IndexError("Index out of bounds.")
         if index == 0:
             self.add(data)
         else:
-            current = self.__head
-            counter = 1
-            while counter < index:
-                current = current.next
-                counter += 1
-            new_node = Node(data)
+            current = self.__node_at(index - 1)
+            new_node = self._new_node(data)
             new_node.next = current.next
             current.next = new_node
+            self.__size += 1
 
     @override
     def get(self, index=0):
         """
-        Get and delete the element at a specific index. O(n)
+        Get and delete the element at a specific index. O(n), O(1) next to the last accessed index
 
         :param index: The index to retrieve.
         :return: The data at the index.
@@ -68,22 +112,21 @@ class SingularlyLinkedList(DataStore):
         :raises IndexError: If index is out of bounds.
         """
         if index < 0:
-            index += len(self)
-        if index < 0 or index >= len(self):
+            index += self.__size
+        if index < 0 or index >= self.__size:
             raise ValueError("Index out of bounds.")
         if index == 0:
-            current = self.__head
-            self.__head = current.next
-            return current.data
+            target = self.__head
+            self.__head = target.next
+            self.__forget_first(1)
         else:
-            counter = 1
-            current = self.__head
-            while counter < index:
-                current = current.next
-                counter += 1
+            current = self.__node_at(index - 1)
             target = current.next
             current.next = target.next
-            return target.data
+        self.__size -= 1
+        data = target.data
+        self._release(target)
+        return data
 
     @override
     def remove(self, data):
@@ -100,19 +143,30 @@ class SingularlyLinkedList(DataStore):
         current = self.__head
         if current.data == data:
             self.__head = current.next
+            self.__forget_first(1)
+            self._release(current)
         elif current.next is None:
             raise ValueError("Value not found.")
         else:
+            counter = 1 # Index of current.next
             while current.next.data != data:
                 current = current.next
+                counter += 1
                 if current.next is None:
                     raise ValueError("Value not found.")
-            current.next = current.next.next
+            target = current.next
+            current.next = target.next
+            if target is self.__finger:
+                self.__finger, self.__finger_index = current, counter - 1
+            elif self.__finger_index > counter:
+                self.__finger_index -= 1
+            self._release(target)
+        self.__size -= 1
 
     @override
     def set(self, index, data):
         """
-        Set an element at a specific index. O(n)
+        Set an element at a specific index. O(n), O(1) next to the last accessed index
 
         :param index: The index to update.
         :param data: The new data.
@@ -120,20 +174,15 @@ class SingularlyLinkedList(DataStore):
         :raises IndexError: If index is out of bounds.
         """
         if index < 0:
-            index += len(self)
-        if index < 0 or index >= len(self):
+            index += self.__size
+        if index < 0 or index >= self.__size:
             raise ValueError("Index out of bounds.")
-        counter = 0
-        current = self.__head
-        while counter < index:
-            current = current.next
-            counter += 1
-        current.data = data
+        self.__node_at(index).data = data
 
     @override
     def peek(self, index=0):
         """
-        Return the element at a specific index.
+        Return the element at a specific index. O(n), O(1) next to the last accessed index
 
         :param index: The index to retrieve.
         :return: The data at the index.
@@ -141,18 +190,163 @@ class SingularlyLinkedList(DataStore):
         :raises IndexError: If index is out of bounds.
         """
         if index < 0:
-            index += len(self)
-        if index < 0 or index >= len(self):
+            index += self.__size
+        if index < 0 or index >= self.__size:
             raise ValueError("Index out of bounds.")
-        if index == 0:
-            return self.__head.data
-        else:
-            counter = 1
-            current = self.__head
-            while counter < index:
+        return self.__node_at(index).data
+
+    @override
+    def add_many(self, iterable):
+        """
+        Pre-pend every element of an iterable, as if by repeated calls to add(). O(m)
+
+        :param iterable: The data to pre-pend.
+        """
+        added = 0
+        for data in iterable:
+            new_node = self._new_node(data)
+            new_node.next = self.__head
+            self.__head = new_node
+            added += 1
+        self.__size += added
+        self.__finger_index += added
+
+    @override
+    def extend(self, iterable):
+        """
+        Append every element of an iterable to the end of the list, in order. O(n + m)
+
+        :param iterable: The data to append.
+        """
+        tail = self.__node_at(self.__size - 1) if self.__head else None
+        for data in iterable:
+            new_node = self._new_node(data)
+            if tail is None:
+                self.__head = new_node
+            else:
+                tail.next = new_node
+            tail = new_node
+            self.__size += 1
+
+    @override
+    def get_many(self, n):
+        """
+        Get and delete the first n elements of the list. O(n)
+
+        :param n: The number of elements to retrieve.
+        :return list: The data in list order.
+
+        :raises ValueError: If fewer than n elements are in the list.
+        """
+        items = []
+        current = self.__head
+        while len(items) < n:
+            if current is None:
+                raise ValueError("Index out of bounds.")
+            items.append(current.data)
+            current = current.next
+        while self.__head is not current:
+            target = self.__head
+            self.__head = target.next
+            self._release(target)
+        self.__size -= len(items)
+        self.__forget_first(len(items))
+        return items
+
+    @override
+    def peek_many(self, indices):
+        """
+        Return the elements at several indices in a single walk of the list. O(n + k log k)
+
+        :param indices: Iterable of indices to retrieve.
+        :return list: The data at each index, in the order the indices were given.
+
+        :raises ValueError: If an index is out of bounds.
+        """
+        length = self.__size
+        positions = []
+        for index in indices:
+            if index < 0:
+                index += length
+            if index < 0 or index >= length:
+                raise ValueError("Index out of bounds.")
+            positions.append(index)
+        items = [None] * len(positions)
+        current = self.__head
+        counter = 0
+        for i in sorted(range(len(positions)), key=positions.__getitem__):
+            while counter < positions[i]:
                 current = current.next
                 counter += 1
-            return current.next.data
+            items[i] = current.data
+        return items
+
+    def __iter__(self):
+        """
+        Yield the elements from the head to the tail. O(n) for a full pass
+        The list must not be modified while it is being iterated over.
+        """
+        current = self.__head
+        while current:
+            yield current.data
+            current = current.next
+
+    def __reversed__(self):
+        """
+        Yield the elements from the tail to the head. O(n) time and memory
+        A singly linked list can only be walked forwards, so the elements are collected first.
+        """
+        items = list(self)
+        while items:
+            yield items.pop()
+
+    def __contains__(self, data):
+        """
+        Return True if an element equal to data is in the list. O(n)
+        """
+        current = self.__head
+        while current:
+            if current.data == data:
+                return True
+            current = current.next
+        return False
+
+    def __getitem__(self, index):
+        """
+        Return the element at an index, or a lazy view of a slice.
+        A slice returns a generator that walks the list once from the first index of the slice, so
+        nothing is copied up front and list[a:b] costs O(b - a) once the walk has reached a.
+
+        :param index: An integer index or a slice.
+        :return: The data at the index, or a generator over the sliced elements.
+
+        :raises IndexError: If an integer index is out of bounds.
+        """
+        if isinstance(index, slice):
+            return self.__slice(*index.indices(self.__size))
+        if index < -self.__size or index >= self.__size:
+            raise IndexError("Index out of bounds.")
+        return self.peek(index)
+
+    def __slice(self, start, stop, step):
+        """
+        Yield the elements of a slice given by normalised start, stop and step indices. O(|stop - start|)
+        A negative step collects the covered elements first, as the list can only be walked forwards.
+        """
+        if step < 0:
+            if start > stop:
+                yield from list(self.__slice(stop + 1, start + 1, 1))[::step]
+            return
+        if start >= stop:
+            return
+        current = self.__node_at(start)
+        while True:
+            yield current.data
+            start += step
+            if start >= stop:
+                return
+            for _ in range(step):
+                current = current.next
 
     def isEmpty(self):
         """
@@ -164,26 +358,17 @@ class SingularlyLinkedList(DataStore):
 
     def __len__(self):
         """
-        Return the length of the list. O(n)
+        Return the length of the list. O(1)
 
         :return int: Length of the list.
         """
-        counter = 0
-        current = self.__head
-        while current:
-            counter += 1
-            current = current.next
-        return counter
+        return self.__size
 
     def __str__(self):
-        if self.isEmpty():
-            return "[]"
-        out_str = "["
-        current = self.__head
-        while current:
-            out_str += str(current.data) + ", "
-            current = current.next
-        return out_str[:-2] + "]"
+        shown = ", ".join(map(str, islice(self, self.STR_LIMIT)))
+        if self.__size > self.STR_LIMIT:
+            return f"[{shown}, ... ({self.__size - self.STR_LIMIT} more)]"
+        return f"[{shown}]"
 
     def __repr__(self):
         return self.__str__()
@@ -45,6 +45,53 @@ class Stack(DataStore):
             raise IndexError("Stack is empty.")
         return self.__store[-1]
 
+    @override
+    def add_many(self, iterable):
+        """
+        Add every element of an iterable to the top of the stack, in order. O(m)
+
+        :param iterable: The data to add.
+        """
+        self.__store.extend(iterable)
+
+    @override
+    def get_many(self, n):
+        """
+        Get and delete n elements from the top of the stack. O(n)
+
+        :param n: The number of elements to retrieve.
+        :return list: The data in the order it was retrieved, top first.
+
+        :raises IndexError: If fewer than n elements are on the stack.
+        """
+        if n > len(self.__store):
+            raise IndexError("Stack has fewer than n elements.")
+        if n <= 0:
+            return []
+        items = self.__store[-n:]
+        del self.__store[-n:]
+        items.reverse()
+        return items
+
+    @override
+    def peek_many(self, indices):
+        """
+        Return the elements at several depths from the top of the stack. O(k)
+
+        :param indices: Iterable of depths, 0 being the top and -1 the bottom.
+        :return list: The data at each depth, in the order the depths were given.
+
+        :raises IndexError: If a depth is out of bounds.
+        """
+        items = []
+        for index in indices:
+            if index < 0:
+                index += len(self.__store)
+            if index < 0 or index >= len(self.__store):
+                raise IndexError("Index out of bounds.")
+            items.append(self.__store[-1 - index])
+        return items
+
     def isEmpty(self):
         """
         Return True if the stack is empty, False otherwise. O(1)
@@ -0,0 +1,127 @@
+from structures.heap import HeapEntry, MinHeap, MaxHeap
+
+class TopK:
+    """
+    Streaming selector of the k largest (or smallest) items seen so far.
+    The current selection is kept in a heap whose root is the worst selected item, so each new
+    item is compared against the root once and only replaces it when it is better.
+    Space complexity of O(k).
+    """
+    def __init__(self, k, key=None, largest=True):
+        """
+        Initialise an empty selector.
+        Items are stored as HeapEntry(key, order, item) entries, where order is the arrival position,
+        negated when selecting the largest. Order breaks ties whenever neither key is less than the
+        other, so among equal keys the earliest items are preferred and the items themselves are never compared.
+
+        :param k: The number of items to keep.
+        :param key: Function computing the value items are ranked by, None to rank the items themselves.
+        :param largest: True to keep the k largest items, False to keep the k smallest.
+
+        :raises ValueError: If k is not positive.
+        """
+        if k < 1:
+            raise ValueError("k must be positive.")
+        self.k = k
+        self.key = key
+        self.largest = largest
+        self.__heap = MinHeap() if largest else MaxHeap()
+        self.__count = 0 # Number of items seen
+
+    def push(self, item):
+        """
+        Offer an item to the selection. O(log k), O(1) if it is not better than the current worst.
+
+        :param item: The item to offer.
+        """
+        value = item if self.key is None else self.key(item)
+        data = self.__heap.data
+        self.__count += 1
+        if len(data) < self.k:
+            self.__heap.push(HeapEntry(value, -self.__count if self.largest else self.__count, item))
+        elif (data[0].key < value) if self.largest else (value < data[0].key):
+            self.__heap.replace(HeapEntry(value, -self.__count if self.largest else self.__count, item))
+
+    def consume(self, iterable):
+        """
+        Offer every item of an iterable, pulling one item at a time. O(n log k)
+
+        :param iterable: The items to offer, may be a generator.
+        """
+        for item in iterable:
+            self.push(item)
+
+    def snapshots(self, iterable, every):
+        """
+        Offer every item of an iterable, yielding the selection after every `every` items and at the end.
+
+        :param iterable: The items to offer, may be a generator.
+        :param every: The number of items between snapshots.
+        :return list: Successive snapshots, see snapshot().
+
+        :raises ValueError: If every is not positive.
+        """
+        if every < 1:
+            raise ValueError("Snapshot interval must be positive.")
+        pending = 0
+        for item in iterable:
+            self.push(item)
+            pending += 1
+            if pending == every:
+                pending = 0
+                yield self.snapshot()
+        if pending:
+            yield self.snapshot()
+
+    def snapshot(self):
+        """
+        Return the current selection, best item first. O(k log k)
+
+        :return list: The selected items.
+        """
+        return [entry.item for entry in sorted(self.__heap.data, reverse=self.largest)]
+
+    def seen(self):
+        """
+        Return the number of items offered so far. O(1)
+
+        :return integer: The number of items seen.
+        """
+        return self.__count
+
+    def __len__(self):
+        return self.__heap.size()
+
+
+def nlargest(k, iterable, key=None):
+    """
+    Return the k largest items of an iterable, largest first, using O(k) memory.
+
+    :param k: The number of items to return.
+    :param iterable: The items to select from, may be a generator.
+    :param key: Function computing the value items are ranked by.
+
+    :return list: The selected items.
+    """
+    if k < 1:
+        return []
+    selector = TopK(k, key=key, largest=True)
+    selector.consume(iterable)
+    return selector.snapshot()
+
+
+def nsmallest(k, iterable, key=None):
+    """
+    Return the k smallest items of an iterable, smallest first, using O(k) memory.
+
+    :param k: The number of items to return.
+    :param iterable: The items to select from, may be a generator.
+    :param key: Function computing the value items are ranked by.
+
+    :return list: The selected items.
+    """
+    if k < 1:
+        return []
+    selector = TopK(k, key=key, largest=False)
+    selector.consume(iterable)
+    return selector.snapshot()
@@ -0,0 +1,401 @@
+import sys
+from itertools import islice
+from structures.data_store import DataStore
+from typing import override
+
+class Block:
+    """
+    A block in an unrolled linked list, holding up to the list's block capacity of elements.
+    """
+    __slots__ = ('items', 'next', 'prev')
+
+    def __init__(self, items=None):
+        """Initialize a block holding a list of elements."""
+        self.items = [] if items is None else items # Stores the data of this block, in order
+        self.next = None # Stores the reference to the next block
+        self.prev = None # Stores the reference to the previous block
+
+class UnrolledLinkedList(DataStore):
+    """
+    An unrolled doubly linked list implementation, with the same interface and indexing as DoublyLinkedList.
+    Elements are stored in blocks of up to block_capacity elements, so a list of n elements allocates
+    O(n / B) blocks instead of n nodes and scans run over contiguous lists. A full block is split in
+    two on insertion, and a block less than half full is merged with a neighbour when they fit in one.
+    Space complexity of O(n).
+    """
+    STR_LIMIT = 1000 # Maximum number of elements written out by __str__
+
+    def __init__(self, block_capacity=64):
+        """
+        Initialize an empty unrolled linked list.
+
+        :param block_capacity: The maximum number of elements held by a block.
+
+        :raises ValueError: If block_capacity is less than 2.
+        """
+        if block_capacity < 2:
+            raise ValueError("Block capacity must be at least 2.")
+        super().__init__()
+        self.block_capacity = block_capacity
+        self.__head = None # Stores the reference to the first block in the list
+        self.__tail = None # Stores the reference to the last block in the list
+        self.__size = 0    # Number of elements in the list
+        self.__blocks = 0  # Number of blocks in the list
+
+    def __locate(self, index):
+        """
+        Return the block holding a valid index and the offset of the index within it, walking from
+        the closer end of the list. O(n / B)
+
+        :param index: The index of the element, in [0, len).
+        """
+        if index < self.__size - 1 - index:
+            block = self.__head
+            while index >= len(block.items):
+                index -= len(block.items)
+                block = block.next
+        else:
+            block = self.__tail
+            index -= self.__size - len(block.items)
+            while index < 0:
+                block = block.prev
+                index += len(block.items)
+        return block, index
+
+    def __link_after(self, block, new_block):
+        """
+        Link a new block after a block, or as the head if block is None. O(1)
+
+        :param block: The block to link after, or None.
+        :param new_block: The detached block to link.
+        """
+        new_block.prev = block
+        new_block.next = self.__head if block is None else block.next
+        if new_block.next is None:
+            self.__tail = new_block
+        else:
+            new_block.next.prev = new_block
+        if block is None:
+            self.__head = new_block
+        else:
+            block.next = new_block
+        self.__blocks += 1
+
+    def __unlink(self, block):
+        """
+        Remove a block from the list. O(1)
+
+        :param block: The block to remove.
+        """
+        if block.prev is None:
+            self.__head = block.next
+        else:
+            block.prev.next = block.next
+        if block.next is None:
+            self.__tail = block.prev
+        else:
+            block.next.prev = block.prev
+        self.__blocks -= 1
+
+    def __rebalance(self, block):
+        """
+        Restore the fill of a block after a removal, unlinking it when empty and merging it with a
+        neighbour when it is less than half full and both fit in one block. O(B)
+
+        :param block: The block an element was removed from.
+        """
+        if not block.items:
+            self.__unlink(block)
+            return
+        if len(block.items) * 2 >= self.block_capacity:
+            return
+        following = block.next
+        if following is not None and len(block.items) + len(following.items) <= self.block_capacity:
+            block.items.extend(following.items)
+            self.__unlink(following)
+        elif block.prev is not None and len(block.prev.items) + len(block.items) <= self.block_capacity:
+            block.prev.items.extend(block.items)
+            self.__unlink(block)
+
+    @override
+    def add(self, data):
+        """
+        Append an element to the list. O(1)
+
+        :param data: The data to append.
+        """
+        if self.__tail is None or len(self.__tail.items) >= self.block_capacity:
+            self.__link_after(self.__tail, Block())
+        self.__tail.items.append(data)
+        self.__size += 1
+
+    @override
+    def insert(self, index, data):
+        """
+        Insert an element at a specified index. O(n / B + B)
+        A full block is split in half first, so the insertion shifts at most B elements.
+
+        :param index: Index at which to insert.
+        :param data: The data to insert.
+
+        :raises IndexError: If index is out of bounds.
+        """
+        if index < 0:
+            index += self.__size + 1
+        if index < 0 or index > self.__size:
+            raise IndexError("Index out of bounds.")
+        if index == self.__size:
+            self.add(data)
+            return
+        block, offset = self.__locate(index)
+        if len(block.items) >= self.block_capacity:
+            half = len(block.items) // 2
+            self.__link_after(block, Block(block.items[half:]))
+            del block.items[half:]
+            if offset > half:
+                block, offset = block.next, offset - half
+        block.items.insert(offset, data)
+        self.__size += 1
+
+    @override
+    def get(self, index=-1):
+        """
+        Get and delete the element at a specific index. O(n / B + B)
+
+        :param index: The index to retrieve.
+        :return: The data at the index.
+
+        :raises IndexError: If index is out of bounds.
+        """
+        if index < 0:
+            index += self.__size
+        if index < 0 or index >= self.__size:
+            raise IndexError("Index out of bounds.")
+        block, offset = self.__locate(index)
+        data = block.items.pop(offset)
+        self.__size -= 1
+        self.__rebalance(block)
+        return data
+
+    @override
+    def remove(self, data):
+        """
+        Remove the first occurrence of an element. O(n)
+
+        :param data: The data to remove.
+
+        :raises ValueError: If value is not in the array.
+        :raises IndexError: If list is empty.
+        """
+        if self.isEmpty():
+            raise IndexError("List is empty.")
+        block = self.__head
+        while block is not None:
+            for offset, item in enumerate(block.items):
+                if item == data:
+                    del block.items[offset]
+                    self.__size -= 1
+                    self.__rebalance(block)
+                    return
+            block = block.next
+        raise ValueError("Value not found.")
+
+    @override
+    def set(self, index, data):
+        """
+        Set an element at a specific index. O(n / B)
+
+        :param index: The index to update.
+        :param data: The new data.
+
+        :raises IndexError: If index is out of bounds.
+        """
+        if index < 0:
+            index += self.__size
+        if index < 0 or index >= self.__size:
+            raise ValueError("Index out of bounds.")
+        block, offset = self.__locate(index)
+        block.items[offset] = data
+
+    @override
+    def peek(self, index):
+        """
+        Return the element at a specific index. O(n / B)
+
+        :param index: The index to retrieve.
+        :return: The data at the index.
+
+        :raises IndexError: If index is out of bounds.
+        """
+        if index < 0:
+            index += self.__size
+        if index < 0 or index >= self.__size:
+            raise ValueError("Index out of bounds.")
+        block, offset = self.__locate(index)
+        return block.items[offset]
+
+    @override
+    def add_many(self, iterable):
+        """
+        Append every element of an iterable, in order, filling the last block before linking new ones. O(m)
+
+        :param iterable: The data to append.
+        """
+        iterator = iter(iterable)
+        while True:
+            if self.__tail is None or len(self.__tail.items) >= self.block_capacity:
+                self.__link_after(self.__tail, Block())
+            room = self.block_capacity - len(self.__tail.items)
+            before = len(self.__tail.items)
+            self.__tail.items.extend(islice(iterator, room))
+            added = len(self.__tail.items) - before
+            self.__size += added
+            if added < room:
+                break
+        if not self.__tail.items:
+            self.__unlink(self.__tail)
+
+    @override
+    def get_many(self, n):
+        """
+        Get and delete the last n elements of the list, as if by repeated calls to get(). O(n)
+
+        :param n: The number of elements to retrieve.
+        :return list: The data in the order it was retrieved, last element first.
+
+        :raises IndexError: If fewer than n elements are in the list.
+        """
+        if n > self.__size:
+            raise IndexError("Index out of bounds.")
+        items = []
+        while len(items) < n:
+            block = self.__tail
+            take = min(n - len(items), len(block.items))
+            items.extend(reversed(block.items[len(block.items) - take:]))
+            del block.items[len(block.items) - take:]
+            self.__size -= take
+            if not block.items:
+                self.__unlink(block)
+        if self.__tail is not None:
+            self.__rebalance(self.__tail)
+        return items
+
+    def __iter__(self):
+        """
+        Yield the elements from the head to the tail. O(n) for a full pass
+        The list must not be modified while it is being iterated over.
+        """
+        block = self.__head
+        while block is not None:
+            yield from block.items
+            block = block.next
+
+    def __reversed__(self):
+        """
+        Yield the elements from the tail to the head. O(n) for a full pass
+        The list must not be modified while it is being iterated over.
+        """
+        block = self.__tail
+        while block is not None:
+            yield from reversed(block.items)
+            block = block.prev
+
+    def __contains__(self, data):
+        """
+        Return True if an element equal to data is in the list. O(n)
+        """
+        block = self.__head
+        while block is not None:
+            if data in block.items:
+                return True
+            block = block.next
+        return False
+
+    def __getitem__(self, index):
+        """
+        Return the element at an index, or a lazy view of a slice.
+        A slice returns a generator that walks the list once from the first index of the slice, so
+        nothing is copied up front.
+
+        :param index: An integer index or a slice.
+        :return: The data at the index, or a generator over the sliced elements.
+
+        :raises IndexError: If an integer index is out of bounds.
+        """
+        if isinstance(index, slice):
+            return self.__slice(*index.indices(self.__size))
+        if index < -self.__size or index >= self.__size:
+            raise IndexError("Index out of bounds.")
+        return self.peek(index)
+
+    def __slice(self, start, stop, step):
+        """
+        Yield the elements of a slice given by normalised start, stop and step indices. O(n / B + |stop - start|)
+        """
+        if start >= stop if step > 0 else start <= stop:
+            return
+        block, offset = self.__locate(start)
+        while True:
+            yield block.items[offset]
+            start += step
+            if start >= stop if step > 0 else start <= stop:
+                return
+            offset += step
+            while offset >= len(block.items):
+                offset -= len(block.items)
+                block = block.next
+            while offset < 0:
+                block = block.prev
+                offset += len(block.items)
+
+    def block_count(self):
+        """
+        Return the number of blocks in the list. O(1)
+
+        :return integer: The number of blocks.
+        """
+        return self.__blocks
+
+    def memory_stats(self):
+        """
+        Report the memory used by the blocks of the list, excluding the data they reference. O(n / B)
+        Call before and after a workload to compare.
+
+        :return dict: Number of elements and blocks, total block bytes and block bytes per element.
+        """
+        total = 0
+        block = self.__head
+        while block is not None:
+            total += sys.getsizeof(block) + sys.getsizeof(block.items)
+            block = block.next
+        return {
+            "elements": self.__size,
+            "blocks": self.__blocks,
+            "total_bytes": total,
+            "bytes_per_element": total / self.__size if self.__size else 0.0,
+        }
+
+    def isEmpty(self):
+        """
+        Return True if the list is empty, False otherwise. O(1)
+
+        :return bool: True if the list is empty, False otherwise.
+        """
+        return self.__size == 0
+
+    def __len__(self):
+        """
+        Return the length of the list. O(1)
+
+        :return int: Length of the list.
+        """
+        return self.__size
+
+    def __str__(self):
+        shown = ", ".join(map(str, islice(self, self.STR_LIMIT)))
+        if self.__size > self.STR_LIMIT:
+            return f"[{shown}, ... ({self.__size - self.STR_LIMIT} more)]"
+        return f"[{shown}]"
+
+    def __repr__(self):
+        return self.__str__()
@@ -0,0 +1,121 @@
+import asyncio
+import pytest
+from structures.async_queue import AsyncQueue, AsyncStack, AsyncPriorityQueue
+
+def run(coro):
+    return asyncio.run(coro)
+
+def test_queue_order():
+    async def main():
+        q = AsyncQueue()
+        for i in range(5):
+            await q.add(i)
+        return [await q.get() for _ in range(5)]
+    assert run(main()) == [0, 1, 2, 3, 4]
+
+def test_stack_order():
+    async def main():
+        s = AsyncStack()
+        for i in range(3):
+            await s.add(i)
+        return [await s.get() for _ in range(3)]
+    assert run(main()) == [2, 1, 0]
+
+def test_priority_queue_order():
+    async def main():
+        p = AsyncPriorityQueue()
+        for v in [3, 1, 2]:
+            await p.add(v)
+        return [await p.get() for _ in range(3)]
+    assert run(main()) == [1, 2, 3]
+
+def test_invalid_capacity_raises():
+    with pytest.raises(ValueError):
+        AsyncQueue(0)
+
+def test_try_add_and_try_get():
+    q = AsyncQueue(1)
+    assert q.try_get("empty") == "empty"
+    assert q.try_add(1)
+    assert not q.try_add(2)
+    assert q.isFull()
+    assert q.peek() == 1
+    assert len(q) == 1
+    assert str(q) == "[1, ...]"
+    assert q.try_get() == 1
+    assert q.isEmpty()
+
+def test_get_waits_for_add():
+    async def main():
+        q = AsyncQueue()
+        consumer = asyncio.create_task(q.get())
+        await asyncio.sleep(0)
+        assert not consumer.done()
+        await q.add("x")
+        return await consumer
+    assert run(main()) == "x"
+
+def test_add_waits_while_full():
+    async def main():
+        q = AsyncQueue(1)
+        await q.add(1)
+        producer = asyncio.create_task(q.add(2))
+        await asyncio.sleep(0)
+        assert not producer.done()
+        assert await q.get() == 1
+        await producer
+        return await q.get()
+    assert run(main()) == 2
+
+def test_cancelled_getter_is_skipped():
+    async def main():
+        q = AsyncQueue()
+        cancelled = asyncio.create_task(q.get())
+        waiting = asyncio.create_task(q.get())
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await q.add(1)
+        return await asyncio.wait_for(waiting, 1)
+    assert run(main()) == 1
+
+def test_get_batch_takes_available():
+    async def main():
+        q = AsyncQueue()
+        for i in range(10):
+            await q.add(i)
+        return await q.get_batch(4), await q.get_batch(100)
+    assert run(main()) == ([0, 1, 2, 3], [4, 5, 6, 7, 8, 9])
+
+def test_get_batch_waits_for_more():
+    async def main():
+        q = AsyncQueue()
+        async def produce():
+            for i in range(3):
+                await q.add(i)
+                await asyncio.sleep(0.01)
+        producer = asyncio.create_task(produce())
+        batch = await q.get_batch(3, max_wait=1)
+        await producer
+        return batch
+    assert run(main()) == [0, 1, 2]
+
+def test_get_batch_invalid_size_raises():
+    with pytest.raises(ValueError):
+        run(AsyncQueue().get_batch(0))
+
+def test_batches_async_for():
+    async def main():
+        q = AsyncQueue(2)
+        async def produce():
+            for i in range(7):
+                await q.add(i)
+        producer = asyncio.create_task(produce())
+        received = []
+        async for batch in q.batches(3, max_wait=0.05):
+            assert len(batch) <= 3
+            received += batch
+            if len(received) == 7:
+                break
+        await producer
+        return received
+    assert run(main()) == list(range(7))
@@ -367,3 +367,255 @@ def test_remove_causes_right_left_rebalance():
         return check_balanced(node.left) and check_balanced(node.right)
 
     assert check_balanced(tree.root)
+
+def check_tree(node, parent=None):
+    """Helper: assert parent pointers and balance factors are consistent, return height."""
+    if node is None:
+        return 0
+    assert node.parent is parent
+    hl = check_tree(node.left, node)
+    hr = check_tree(node.right, node)
+    assert node.balance_factor == hr - hl
+    assert abs(node.balance_factor) <= 1
+    assert node.height == max(hl, hr) + 1
+    assert node.size == 1 + (node.left.size if node.left else 0) + (node.right.size if node.right else 0)
+    return max(hl, hr) + 1
+
+def test_nodes_have_no_dict():
+    assert not hasattr(AVLNode(1), "__dict__")
+
+def test_remove_successor_child_rebalances_from_successor():
+    tree = AVLTree()
+    for v in [20, 10, 30, 5, 40, 3]:
+        tree.add_node(v)
+    tree.remove_node(20)
+    check_tree(tree.root)
+
+def test_pool_reuses_nodes_and_keeps_tree_valid():
+    import random
+    rng = random.Random(9)
+    tree = AVLTree(pool_size=16)
+    present = set()
+    for _ in range(2000):
+        v = rng.randint(0, 200)
+        if v in present:
+            tree.remove_node(v)
+            present.remove(v)
+        else:
+            tree.add_node(v)
+            present.add(v)
+        assert tree.memory_stats()["pooled_nodes"] <= 16
+    check_tree(tree.root)
+    assert get_inorder_values(tree.root) == sorted(present)
+    assert tree.memory_stats()["elements"] == len(present)
+
+def test_heights_stay_logarithmic_for_sorted_inserts():
+    import math
+    tree = AVLTree()
+    n = 20000
+    for v in range(n):
+        tree.add_node(v)
+    assert tree.root.get_height() == check_tree(tree.root)
+    assert tree.root.get_height() <= 1.45 * math.log2(n + 2)
+    for v in range(0, n, 2):
+        tree.remove_node(v)
+    assert tree.root.get_height() == check_tree(tree.root)
+
+def test_random_operations_keep_heights_consistent():
+    import random
+    rng = random.Random(21)
+    tree = AVLTree()
+    present = set()
+    for step in range(3000):
+        v = rng.randint(0, 500)
+        if v in present:
+            tree.remove_node(v)
+            present.remove(v)
+        else:
+            tree.add_node(v)
+            present.add(v)
+        if step % 50 == 0:
+            check_tree(tree.root)
+    check_tree(tree.root)
+    assert get_inorder_values(tree.root) == sorted(present)
+
+def test_rank_select_count_range():
+    tree = build_balanced_tree()
+    values = [10, 20, 25, 30, 35, 40, 50]
+    assert len(tree) == 7
+    assert [tree.select(k) for k in range(7)] == values
+    assert tree.select(-1) == 50
+    with pytest.raises(IndexError):
+        tree.select(7)
+    assert tree.rank(30) == 3
+    assert tree.rank(30, inclusive=True) == 4
+    assert tree.rank(31) == 4
+    assert tree.rank(5) == 0 and tree.rank(99) == 7
+    assert tree.count_range(20, 40) == 5
+    assert tree.count_range(21, 34) == 2
+    assert tree.count_range(40, 20) == 0
+    assert len(AVLTree()) == 0
+
+def test_order_statistics_match_sorted_list():
+    import bisect
+    import random
+    rng = random.Random(22)
+    tree = AVLTree(pool_size=8)
+    present = []
+    for step in range(3000):
+        v = rng.randint(0, 400)
+        index = bisect.bisect_left(present, v)
+        if index < len(present) and present[index] == v:
+            tree.remove_node(v)
+            present.pop(index)
+        else:
+            tree.add_node(v)
+            present.insert(index, v)
+        assert len(tree) == len(present)
+        if present and step % 10 == 0:
+            k = rng.randrange(len(present))
+            assert tree.select(k) == present[k]
+            probe = rng.randint(-10, 410)
+            assert tree.rank(probe) == bisect.bisect_left(present, probe)
+            lo, hi = sorted(rng.sample(range(-10, 410), 2))
+            assert tree.count_range(lo, hi) == bisect.bisect_right(present, hi) - bisect.bisect_left(present, lo)
+    check_tree(tree.root)
+
+def test_iteration_and_neighbours():
+    tree = build_balanced_tree()
+    values = [10, 20, 25, 30, 35, 40, 50]
+    assert list(tree) == values
+    assert list(reversed(tree)) == values[::-1]
+    assert list(AVLTree()) == []
+    assert tree.min() == 10 and tree.max() == 50
+    with pytest.raises(ValueError):
+        AVLTree().min()
+    with pytest.raises(ValueError):
+        AVLTree().max()
+    assert tree.floor(30) == 30 and tree.floor(29) == 25 and tree.floor(5) is None
+    assert tree.ceiling(30) == 30 and tree.ceiling(31) == 35 and tree.ceiling(51) is None
+    assert tree.predecessor(30) == 25 and tree.predecessor(10) is None
+    assert tree.successor(30) == 35 and tree.successor(50) is None
+
+def test_irange():
+    tree = build_balanced_tree()
+    assert list(tree.irange(20, 40)) == [20, 25, 30, 35, 40]
+    assert list(tree.irange(20, 40, inclusive=(False, False))) == [25, 30, 35]
+    assert list(tree.irange(21, 39, reverse=True)) == [35, 30, 25]
+    assert list(tree.irange(hi=25)) == [10, 20, 25]
+    assert list(tree.irange(lo=35, reverse=True)) == [50, 40, 35]
+    assert list(tree.irange(41, 49)) == []
+    assert list(tree.irange()) == list(tree)
+
+def test_range_queries_match_sorted_list():
+    import bisect
+    import random
+    rng = random.Random(23)
+    tree = AVLTree()
+    values = sorted(rng.sample(range(1000), 300))
+    for v in rng.sample(values, len(values)):
+        tree.add_node(v)
+    for _ in range(200):
+        lo, hi = sorted(rng.sample(range(-5, 1005), 2))
+        inclusive = (rng.random() < 0.5, rng.random() < 0.5)
+        start = bisect.bisect_left(values, lo) if inclusive[0] else bisect.bisect_right(values, lo)
+        stop = bisect.bisect_right(values, hi) if inclusive[1] else bisect.bisect_left(values, hi)
+        assert list(tree.irange(lo, hi, inclusive)) == values[start:stop]
+        assert list(tree.irange(lo, hi, inclusive, reverse=True)) == values[start:stop][::-1]
+
+def test_iteration_over_large_tree():
+    tree = AVLTree()
+    for v in range(20000):
+        tree.add_node(v)
+    assert list(tree) == list(range(20000))
+    assert next(reversed(tree)) == 19999
+
+def test_from_sorted_builds_balanced_tree():
+    for n in [0, 1, 2, 3, 7, 10, 1000]:
+        tree = AVLTree.from_sorted(range(n))
+        check_tree(tree.root)
+        assert list(tree) == list(range(n))
+        assert len(tree) == n
+    tree = AVLTree.from_sorted(range(1023))
+    assert tree.root.get_height() == 10
+    tree.add_node(1023)
+    tree.remove_node(0)
+    check_tree(tree.root)
+
+def test_from_sorted_rejects_unsorted_or_repeated_values():
+    with pytest.raises(ValueError, match="Node already exists"):
+        AVLTree.from_sorted([1, 2, 2])
+    with pytest.raises(ValueError, match="not sorted"):
+        AVLTree.from_sorted([1, 3, 2])
+
+def test_from_iterable():
+    tree = AVLTree.from_iterable([5, 1, 4, 2, 3], pool_size=4)
+    check_tree(tree.root)
+    assert list(tree) == [1, 2, 3, 4, 5]
+    assert tree.pool_size == 4
+    with pytest.raises(ValueError):
+        AVLTree.from_iterable([3, 1, 3])
+
+def test_join():
+    left = AVLTree.from_sorted(range(100))
+    right = AVLTree.from_sorted(range(101, 104))
+    tree = AVLTree.join(left, 100, right)
+    check_tree(tree.root)
+    assert list(tree) == list(range(104))
+    assert len(left) == 0 and len(right) == 0
+    tree = AVLTree.join(AVLTree(), 5, AVLTree.from_sorted(range(6, 500)))
+    check_tree(tree.root)
+    assert list(tree) == list(range(5, 500))
+    with pytest.raises(ValueError):
+        AVLTree.join(AVLTree.from_sorted([1, 2]), 2, AVLTree())
+    with pytest.raises(ValueError):
+        AVLTree.join(AVLTree(), 2, AVLTree.from_sorted([1, 3]))
+
+def test_split():
+    tree = AVLTree.from_iterable(range(0, 100, 2))
+    rest = tree.split(50)
+    check_tree(tree.root)
+    check_tree(rest.root)
+    assert list(tree) == list(range(0, 50, 2))
+    assert list(rest) == list(range(50, 100, 2))
+    rest2 = rest.split(71)
+    assert list(rest) == list(range(50, 71, 2))
+    assert list(rest2) == list(range(72, 100, 2))
+    assert list(tree.split(-1)) == list(range(0, 50, 2))
+    assert len(tree) == 0
+
+def test_set_operations_match_sets():
+    import random
+    rng = random.Random(25)
+    for _ in range(40):
+        a = set(rng.sample(range(600), rng.randint(0, 300)))
+        b = set(rng.sample(range(600), rng.randint(0, 30 if rng.random() < 0.5 else 300)))
+        for operation, expected in (("union", a | b), ("intersection", a & b), ("difference", a - b)):
+            tree, other = AVLTree.from_iterable(a, pool_size=4), AVLTree.from_iterable(b)
+            getattr(tree, operation)(other)
+            check_tree(tree.root)
+            assert list(tree) == sorted(expected)
+            assert len(tree) == len(expected)
+            assert len(other) == 0
+            tree.add_node(1000)
+            tree.remove_node(1000)
+
+def test_set_operation_with_itself_raises():
+    tree = AVLTree.from_sorted([1, 2])
+    with pytest.raises(ValueError):
+        tree.union(tree)
+
+def test_set_operations_in_executor():
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+    a, b = set(range(0, 3000, 2)), set(range(0, 3000, 3))
+    with ThreadPoolExecutor(2) as executor:
+        for operation, expected in (("union", a | b), ("intersection", a & b), ("difference", a - b)):
+            tree = AVLTree.from_iterable(a)
+            getattr(tree, operation)(AVLTree.from_iterable(b), executor=executor)
+            check_tree(tree.root)
+            assert list(tree) == sorted(expected)
+    with ProcessPoolExecutor(2) as executor:
+        tree = AVLTree.from_iterable(a)
+        tree.union(AVLTree.from_iterable(b), executor=executor)
+        check_tree(tree.root)
+        assert list(tree) == sorted(a | b)
@@ -180,3 +180,7 @@ def test_tree_size():
     for v in [10, 5, 15, 3, 7]:
         tree.add_node(v)
     assert tree.get_size() == 5
+
+def test_nodes_have_no_dict():
+    from structures.binary_tree import BTNode
+    assert not hasattr(BTNode(1), "__dict__")
@@ -0,0 +1,94 @@
+import threading
+import pytest
+from structures.blocking_queue import BlockingQueue
+
+def test_fifo_order():
+    q = BlockingQueue()
+    for i in range(20):
+        q.add(i)
+    assert len(q) == 20
+    assert [q.get() for _ in range(20)] == list(range(20))
+    assert q.isEmpty()
+
+def test_invalid_capacity_raises():
+    with pytest.raises(ValueError):
+        BlockingQueue(0)
+
+def test_try_add_respects_capacity():
+    q = BlockingQueue(2)
+    assert q.try_add(1)
+    assert q.try_add(2)
+    assert q.isFull()
+    assert not q.try_add(3)
+    assert str(q) == "[1, 2, ...]"
+
+def test_try_get_empty_returns_default():
+    q = BlockingQueue()
+    assert q.try_get() is None
+    assert q.try_get("none") == "none"
+    q.add(1)
+    assert q.try_get() == 1
+
+def test_get_timeout_raises():
+    q = BlockingQueue()
+    with pytest.raises(IndexError, match="Queue is empty."):
+        q.get(timeout=0.01)
+
+def test_add_timeout_raises_when_full():
+    q = BlockingQueue(1)
+    q.add(1)
+    with pytest.raises(IndexError, match="Queue is full."):
+        q.add(2, timeout=0.01)
+    assert q.peek() == 1
+
+def test_get_blocks_until_add():
+    q = BlockingQueue()
+    result = []
+    consumer = threading.Thread(target=lambda: result.append(q.get(timeout=5)))
+    consumer.start()
+    q.add("x")
+    consumer.join(5)
+    assert result == ["x"]
+
+def test_producers_block_for_backpressure():
+    q = BlockingQueue(4)
+    n = 500
+    def produce(offset):
+        for i in range(n):
+            q.add(offset + i, timeout=5)
+    producers = [threading.Thread(target=produce, args=(k * n,)) for k in range(3)]
+    for p in producers:
+        p.start()
+    received = []
+    for _ in range(3 * n):
+        received.append(q.get(timeout=5))
+        assert len(q) <= 4
+    for p in producers:
+        p.join(5)
+    assert sorted(received) == list(range(3 * n))
+    assert q.isEmpty()
+
+def test_batch_operations():
+    q = BlockingQueue()
+    q.add_many(range(10))
+    assert q.peek_many([0, -1]) == [0, 9]
+    assert q.get_many(4) == [0, 1, 2, 3]
+    assert len(q) == 6
+
+def test_bounded_add_many_timeout():
+    q = BlockingQueue(2)
+    with pytest.raises(IndexError, match="Queue is full."):
+        q.add_many([1, 2, 3], timeout=0.01)
+    assert str(q) == "[1, 2, ...]"
+
+def test_get_many_waits_for_enough():
+    q = BlockingQueue(4)
+    with pytest.raises(ValueError):
+        q.get_many(5)
+    q.add(1)
+    with pytest.raises(IndexError):
+        q.get_many(2, timeout=0.01)
+    producer = threading.Thread(target=lambda: q.add_many([2, 3]))
+    producer.start()
+    assert q.get_many(3, timeout=5) == [1, 2, 3]
+    producer.join(5)
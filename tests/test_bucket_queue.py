@@ -0,0 +1,90 @@
+import random
+import pytest
+from structures.bucket_queue import BucketQueue, RadixHeap
+
+
+def test_bucket_queue_order_and_fifo_ties():
+    q = BucketQueue(10)
+    for data, priority in [("a", 3), ("b", 1), ("c", 3), ("d", 0), ("e", 1)]:
+        q.add(data, priority)
+    assert q.peek() == "d"
+    assert len(q) == 5
+    assert str(q) == "['d', 'b', 'e', 'a', 'c', ...]"
+    assert [q.get() for _ in range(5)] == ["d", "b", "e", "a", "c"]
+    assert q.isEmpty()
+
+
+def test_bucket_queue_data_as_priority():
+    q = BucketQueue()
+    for v in [200, 5, 255, 0, 5]:
+        q.add(v)
+    assert [q.get() for _ in range(5)] == [0, 5, 5, 200, 255]
+
+
+def test_bucket_queue_cursor_moves_back():
+    q = BucketQueue(5)
+    q.add(4)
+    assert q.get() == 4
+    q.add(2)
+    q.add(5)
+    assert q.get() == 2
+
+
+def test_bucket_queue_errors():
+    q = BucketQueue(3)
+    with pytest.raises(ValueError):
+        q.add("x", 4)
+    with pytest.raises(ValueError):
+        q.add("x", -1)
+    with pytest.raises(ValueError):
+        q.add(1.5)
+    with pytest.raises(IndexError, match="Queue is empty."):
+        q.get()
+    with pytest.raises(IndexError, match="Queue is empty."):
+        q.peek()
+    with pytest.raises(ValueError):
+        BucketQueue(-1)
+
+
+def test_radix_heap_monotone_sequence():
+    rng = random.Random(4)
+    heap = RadixHeap()
+    reference = []
+    last = 0
+    for _ in range(2000):
+        if rng.random() < 0.6 or not reference:
+            priority = last + rng.randint(0, 1000)
+            heap.add(priority)
+            reference.append(priority)
+        else:
+            assert heap.peek() == min(reference)
+            last = heap.get()
+            assert last == min(reference)
+            reference.remove(last)
+            assert heap.last_priority() == last
+        assert len(heap) == len(reference)
+    assert [heap.get() for _ in range(len(heap))] == sorted(reference)
+    assert heap.isEmpty()
+
+
+def test_radix_heap_payloads():
+    heap = RadixHeap()
+    heap.add("far", 100)
+    heap.add("near", 3)
+    assert str(heap) == "['near', 'far', ...]"
+    assert heap.get() == "near"
+    assert heap.get() == "far"
+
+
+def test_radix_heap_errors():
+    heap = RadixHeap()
+    with pytest.raises(IndexError, match="Queue is empty."):
+        heap.get()
+    with pytest.raises(ValueError):
+        heap.add(-1)
+    heap.add(10)
+    heap.get()
+    with pytest.raises(ValueError, match="monotonicity"):
+        heap.add(9)
+    heap.add(10)
+    assert heap.get() == 10
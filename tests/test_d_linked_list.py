@@ -146,3 +146,317 @@ def test_str_populated(populated_list):
 
 def test_repr(populated_list):
     assert repr(populated_list) == str(populated_list)
+
+def test_add_many_and_extend(empty_list):
+    empty_list.add_many(range(3))
+    empty_list.extend(iter([3]))
+    assert str(empty_list) == "[0, 1, 2, 3]"
+    assert empty_list.peek(-1) == 3
+
+def test_get_many(populated_list):
+    assert populated_list.get_many(2) == [4, 3]
+    assert str(populated_list) == "[0, 1, 2]"
+    populated_list.add(9)
+    assert populated_list.get_many(4) == [9, 2, 1, 0]
+    assert populated_list.isEmpty()
+    with pytest.raises(IndexError):
+        populated_list.get_many(1)
+
+def test_peek_many(populated_list):
+    assert populated_list.peek_many([4, 0, -2]) == [4, 0, 3]
+    with pytest.raises(ValueError):
+        populated_list.peek_many([5])
+
+def test_nodes_have_no_dict():
+    from structures.d_linked_list import Node
+    assert not hasattr(Node(1), "__dict__")
+
+def test_pool_reuses_nodes():
+    dll = DoublyLinkedList(pool_size=3)
+    dll.add_many(range(6))
+    dll.get(0)
+    dll.get(2)
+    dll.remove(5)
+    dll.get_many(2)
+    assert str(dll) == "[1]"
+    assert dll.memory_stats()["pooled_nodes"] == 3
+    dll.add_many([7, 8])
+    dll.insert(0, 0)
+    dll.insert(2, 9)
+    assert str(dll) == "[0, 1, 9, 7, 8]"
+    assert dll.peek(-1) == 8
+    stats = dll.memory_stats()
+    assert stats["elements"] == 5 and stats["pooled_nodes"] == 0
+
+def test_random_operations_match_list():
+    import random
+    rng = random.Random(8)
+    dll = DoublyLinkedList(pool_size=4)
+    reference = []
+    for step in range(3000):
+        op = rng.random()
+        if op < 0.25 or not reference:
+            index = rng.randint(0, len(reference))
+            dll.insert(index, step)
+            reference.insert(index, step)
+        elif op < 0.35:
+            dll.add(step)
+            reference.append(step)
+        elif op < 0.5:
+            index = rng.randrange(len(reference))
+            assert dll.get(index) == reference.pop(index)
+        elif op < 0.6:
+            value = rng.choice(reference)
+            dll.remove(value)
+            reference.remove(value)
+        elif op < 0.7:
+            index = rng.randrange(-len(reference), len(reference))
+            dll.set(index, -step)
+            reference[index] = -step
+        elif op < 0.75:
+            n = rng.randint(0, min(3, len(reference)))
+            assert dll.get_many(n) == reference[::-1][:n]
+            del reference[len(reference) - n:]
+        else:
+            index = rng.randrange(len(reference))
+            assert dll.peek(index) == reference[index]
+        assert len(dll) == len(reference)
+    assert list(dll) == reference
+    assert list(reversed(dll)) == reference[::-1]
+
+def test_get_at_length_raises(populated_list):
+    with pytest.raises(IndexError):
+        populated_list.get(5)
+
+def test_sequential_access_uses_finger():
+    dll = DoublyLinkedList()
+    dll.add_many(range(20000))
+    assert [dll.peek(i) for i in range(len(dll))] == list(range(20000))
+    assert [dll.peek(i) for i in range(len(dll) - 1, -1, -1)] == list(range(19999, -1, -1))
+
+def test_iteration_and_contains():
+    dll = DoublyLinkedList()
+    dll.extend(range(5))
+    assert list(dll) == [0, 1, 2, 3, 4]
+    assert list(reversed(dll)) == [4, 3, 2, 1, 0]
+    assert 3 in dll
+    assert 7 not in dll
+    assert list(DoublyLinkedList()) == []
+
+def test_getitem_and_slices():
+    import random
+    rng = random.Random(17)
+    dll = DoublyLinkedList()
+    dll.extend(range(30))
+    reference = list(range(30))
+    assert dll[0] == 0 and dll[-1] == 29
+    with pytest.raises(IndexError):
+        dll[30]
+    with pytest.raises(IndexError):
+        dll[-31]
+    for _ in range(300):
+        start, stop = rng.randint(-35, 35), rng.randint(-35, 35)
+        step = rng.choice([1, 2, 3, -1, -2, -4])
+        assert list(dll[start:stop:step]) == reference[start:stop:step]
+    assert list(dll[::-1]) == reference[::-1]
+    view = dll[5:8]
+    assert not isinstance(view, list)
+    assert list(view) == [5, 6, 7]
+
+def test_str_truncates_long_lists():
+    dll = DoublyLinkedList()
+    dll.extend(range(DoublyLinkedList.STR_LIMIT + 5))
+    text = str(dll)
+    assert text.startswith("[0, 1, 2, ")
+    assert text.endswith(f"{DoublyLinkedList.STR_LIMIT - 1}, ... (5 more)]")
+    assert repr(dll) == text
+
+def test_extend_list_steals_nodes(populated_list):
+    other = DoublyLinkedList()
+    other.add_many([5, 6])
+    populated_list.extend_list(other)
+    assert list(populated_list) == [0, 1, 2, 3, 4, 5, 6]
+    assert list(reversed(populated_list)) == [6, 5, 4, 3, 2, 1, 0]
+    assert len(populated_list) == 7
+    assert other.isEmpty() and len(other) == 0 and str(other) == "[]"
+    empty = DoublyLinkedList()
+    empty.extend_list(populated_list)
+    assert list(empty) == [0, 1, 2, 3, 4, 5, 6]
+    with pytest.raises(ValueError):
+        empty.extend_list(empty)
+
+def test_splice(populated_list):
+    other = DoublyLinkedList()
+    other.add_many(["a", "b"])
+    populated_list.splice(2, other)
+    assert list(populated_list) == [0, 1, "a", "b", 2, 3, 4]
+    assert populated_list.peek(4) == 2
+    assert other.isEmpty()
+    other.add_many(["c"])
+    populated_list.splice(0, other)
+    other.add_many(["d"])
+    populated_list.splice(-1, other)
+    assert list(populated_list) == ["c", 0, 1, "a", "b", 2, 3, 4, "d"]
+    assert list(reversed(populated_list)) == ["d", 4, 3, 2, "b", "a", 1, 0, "c"]
+    with pytest.raises(IndexError):
+        populated_list.splice(10, other)
+
+def test_split_at(populated_list):
+    rest = populated_list.split_at(3)
+    assert list(populated_list) == [0, 1, 2]
+    assert list(rest) == [3, 4]
+    assert len(populated_list) == 3 and len(rest) == 2
+    assert rest.peek(-1) == 4 and populated_list.peek(-1) == 2
+    assert list(populated_list.split_at(3)) == []
+    whole = populated_list.split_at(0)
+    assert populated_list.isEmpty() and list(whole) == [0, 1, 2]
+    with pytest.raises(IndexError):
+        whole.split_at(4)
+
+def test_random_split_and_splice_match_list():
+    import random
+    rng = random.Random(19)
+    lists = [DoublyLinkedList() for _ in range(4)]
+    references = [[] for _ in range(4)]
+    for step in range(2000):
+        i, j = rng.sample(range(4), 2)
+        op = rng.random()
+        if op < 0.4:
+            lists[i].add(step)
+            references[i].append(step)
+        elif op < 0.6:
+            index = rng.randint(0, len(references[i]))
+            lists[i].splice(index, lists[j])
+            references[i][index:index] = references[j]
+            references[j] = []
+        elif op < 0.8:
+            index = rng.randint(0, len(references[i]))
+            moved = lists[i].split_at(index)
+            lists[j].extend_list(moved)
+            references[j] += references[i][index:]
+            del references[i][index:]
+        elif references[i]:
+            index = rng.randrange(len(references[i]))
+            assert lists[i].get(index) == references[i].pop(index)
+        for linked_list, reference in zip(lists, references):
+            assert len(linked_list) == len(reference)
+    for linked_list, reference in zip(lists, references):
+        assert list(linked_list) == reference
+        assert list(reversed(linked_list)) == reference[::-1]
+        assert [linked_list.peek(k) for k in range(len(reference))] == reference
+
+def test_handles(empty_list):
+    a = empty_list.add("a")
+    c = empty_list.add("c")
+    b = empty_list.insert(1, "b")
+    d = empty_list.insert_after(c, "d")
+    empty_list.insert_after(a, "a2")
+    assert list(empty_list) == ["a", "a2", "b", "c", "d"]
+    empty_list.move_to_front(c)
+    empty_list.move_to_back(a)
+    assert list(empty_list) == ["c", "a2", "b", "d", "a"]
+    assert list(reversed(empty_list)) == ["a", "d", "b", "a2", "c"]
+    assert empty_list.remove_handle(b) == "b"
+    assert empty_list.remove_handle(d) == "d"
+    assert list(empty_list) == ["c", "a2", "a"]
+    assert len(empty_list) == 3
+    assert empty_list.peek(1) == "a2"
+
+def test_handles_as_lru_cache():
+    import random
+    rng = random.Random(20)
+    dll = DoublyLinkedList(pool_size=8)
+    handles = {}
+    reference = []
+    for step in range(3000):
+        key = rng.randrange(40)
+        if key in handles:
+            if rng.random() < 0.2:
+                assert dll.remove_handle(handles.pop(key)) == key
+                reference.remove(key)
+            else:
+                dll.move_to_back(handles[key])
+                reference.remove(key)
+                reference.append(key)
+        else:
+            handles[key] = dll.add(key)
+            reference.append(key)
+            if len(reference) > 25:
+                evicted = dll.get(0)
+                assert evicted == reference.pop(0)
+                del handles[evicted]
+        if step % 7 == 0 and reference:
+            index = rng.randrange(len(reference))
+            assert dll.peek(index) == reference[index]
+        assert len(dll) == len(reference)
+    assert list(dll) == reference
+    assert list(reversed(dll)) == reference[::-1]
+
+def test_foreign_handle_is_rejected():
+    a, b = DoublyLinkedList(), DoublyLinkedList()
+    a.add(1)
+    a.add(2)
+    hb = b.add(10)
+    for operation in [a.remove_handle, a.move_to_front, a.move_to_back, lambda h: a.insert_after(h, 3)]:
+        with pytest.raises(ValueError):
+            operation(hb)
+    assert list(a) == [1, 2] and len(a) == 2
+    assert list(b) == [10] and len(b) == 1
+
+def test_removed_handle_is_stale(populated_list):
+    handle = populated_list.insert(1, 10)
+    assert populated_list.remove_handle(handle) == 10
+    for operation in [populated_list.remove_handle, populated_list.move_to_back,
+                      lambda h: populated_list.insert_after(h, 3)]:
+        with pytest.raises(ValueError):
+            operation(handle)
+    assert list(populated_list) == [0, 1, 2, 3, 4] and len(populated_list) == 5
+
+def test_handle_of_removed_element_is_stale_after_pool_reuse():
+    dll = DoublyLinkedList(pool_size=2)
+    dll.add(0)
+    handle = dll.add(1)
+    dll.get()
+    fresh = dll.add(2) # Reuses the node of the removed element
+    with pytest.raises(ValueError):
+        dll.remove_handle(handle)
+    assert list(dll) == [0, 2]
+    assert dll.remove_handle(fresh) == 2
+
+def test_handles_follow_moved_elements():
+    a, b = DoublyLinkedList(), DoublyLinkedList()
+    ha = a.add(1)
+    hb = b.add(2)
+    a.extend_list(b)
+    with pytest.raises(ValueError):
+        b.remove_handle(hb)
+    a.move_to_front(hb)
+    c = DoublyLinkedList()
+    hc = c.add(3)
+    a.splice(1, c)
+    with pytest.raises(ValueError):
+        c.move_to_front(hc)
+    a.move_to_back(ha)
+    assert list(a) == [2, 3, 1]
+    hd = b.add(4) # b keeps working with a fresh token after being emptied
+    assert b.remove_handle(hd) == 4 and list(a) == [2, 3, 1]
+    d = DoublyLinkedList()
+    d.extend_list(a)
+    for handle in [ha, hb, hc]:
+        with pytest.raises(ValueError):
+            a.remove_handle(handle)
+    assert [d.remove_handle(handle) for handle in [hc, hb, ha]] == [3, 2, 1]
+    assert d.isEmpty()
+
+@pytest.mark.parametrize("index", [0, 1, 4, 5])
+def test_split_at_moves_handles(index):
+    dll = DoublyLinkedList()
+    handles = [dll.add(i) for i in range(5)]
+    rest = dll.split_at(index)
+    for i, handle in enumerate(handles):
+        owner, other = (dll, rest) if i < index else (rest, dll)
+        with pytest.raises(ValueError):
+            other.move_to_front(handle)
+        owner.move_to_back(handle)
+    assert list(dll) == list(range(index))
+    assert list(rest) == list(range(index, 5))
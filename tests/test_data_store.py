@@ -24,3 +24,34 @@ def test_set():
 def test_peek():
     result = DataStore.peek(0)
     assert result == "peek() not implemented for this structure type."
+
+class ListStore(DataStore):
+    """Minimal subclass exercising the generic batch defaults."""
+    def __init__(self):
+        self.items = []
+    def add(self, data):
+        self.items.append(data)
+    def get(self):
+        if not self.items:
+            raise IndexError("Store is empty.")
+        return self.items.pop(0)
+    def peek(self, index):
+        return self.items[index]
+
+def test_add_many_and_extend():
+    store = ListStore()
+    store.add_many(iter([1, 2]))
+    store.extend(x for x in [3, 4])
+    assert store.items == [1, 2, 3, 4]
+
+def test_get_many():
+    store = ListStore()
+    store.add_many([1, 2, 3])
+    assert store.get_many(2) == [1, 2]
+    with pytest.raises(IndexError):
+        store.get_many(2)
+
+def test_peek_many():
+    store = ListStore()
+    store.add_many([1, 2, 3])
+    assert store.peek_many([2, 0, -1]) == [3, 1, 3]
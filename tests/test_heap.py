@@ -136,3 +136,64 @@ def test_pop_until_empty():
     while not heap.isEmpty():
         heap.pop()
     assert heap.isEmpty()
+
+
+def test_from_iterable_min_and_max():
+    values = [(i * 37) % 101 for i in range(101)]
+    min_heap = Heap.from_iterable(values)
+    assert [min_heap.pop() for _ in range(101)] == sorted(values)
+    max_heap = Heap.from_iterable(iter(values), is_min=False)
+    assert [max_heap.pop() for _ in range(101)] == sorted(values, reverse=True)
+
+
+def test_from_iterable_subclasses():
+    heap = MaxHeap.from_iterable([3, 9, 1])
+    assert isinstance(heap, MaxHeap)
+    assert heap.peek() == 9
+    heap = MinHeap.from_iterable([])
+    assert heap.isEmpty()
+
+
+def test_heapify_in_place():
+    heap = MinHeap()
+    heap.data = [9, 8, 7, 6, 5, 4, 3, 2, 1]
+    heap.heapify()
+    assert heap.peek() == 1
+    heap.push(0)
+    assert [heap.pop() for _ in range(10)] == list(range(10))
+
+
+@pytest.mark.parametrize("arity", [2, 3, 4, 8])
+def test_arity_pop_order(arity):
+    values = [(i * 7919) % 1009 for i in range(500)]
+    heap = MinHeap(arity=arity)
+    for v in values:
+        heap.push(v)
+    assert [heap.pop() for _ in range(500)] == sorted(values)
+    heap = MaxHeap.from_iterable(values, arity=arity)
+    assert heap.arity == arity
+    assert [heap.pop() for _ in range(500)] == sorted(values, reverse=True)
+
+
+def test_invalid_arity_raises():
+    with pytest.raises(ValueError):
+        Heap(arity=1)
+
+
+def test_pushpop():
+    heap = MinHeap.from_iterable([5, 3, 8])
+    assert heap.pushpop(1) == 1  # Smaller than root, heap untouched
+    assert heap.size() == 3
+    assert heap.pushpop(4) == 3
+    assert sorted(heap.data) == [4, 5, 8]
+    assert Heap().pushpop(7) == 7
+
+
+def test_replace():
+    heap = MaxHeap.from_iterable([5, 3, 8])
+    assert heap.replace(10) == 8
+    assert heap.peek() == 10
+    assert heap.replace(1) == 10
+    assert [heap.pop() for _ in range(3)] == [5, 3, 1]
+    with pytest.raises(ValueError):
+        heap.replace(1)
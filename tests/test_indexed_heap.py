@@ -0,0 +1,103 @@
+import random
+import pytest
+from structures.indexed_heap import IndexedHeap, IndexedMinHeap, IndexedMaxHeap
+
+
+def drain(heap):
+    return [heap.pop() for _ in range(heap.size())]
+
+
+def test_push_pop_order_min():
+    heap = IndexedMinHeap()
+    for key, priority in [("a", 5), ("b", 3), ("c", 8), ("d", 1)]:
+        heap.push(key, priority)
+    assert heap.peek() == ("d", 1)
+    assert drain(heap) == [("d", 1), ("b", 3), ("a", 5), ("c", 8)]
+    assert heap.isEmpty()
+
+
+def test_push_pop_order_max():
+    heap = IndexedMaxHeap()
+    for key, priority in [("a", 5), ("b", 3), ("c", 8)]:
+        heap.push(key, priority)
+    assert [key for key, _ in drain(heap)] == ["c", "a", "b"]
+
+
+def test_empty_raises():
+    heap = IndexedHeap()
+    with pytest.raises(ValueError):
+        heap.pop()
+    with pytest.raises(ValueError):
+        heap.peek()
+
+
+def test_duplicate_and_missing_keys_raise():
+    heap = IndexedHeap()
+    heap.push("a", 1)
+    with pytest.raises(KeyError):
+        heap.push("a", 2)
+    with pytest.raises(KeyError):
+        heap.update("b", 2)
+    with pytest.raises(KeyError):
+        heap.remove("b")
+
+
+def test_contains_and_len():
+    heap = IndexedHeap()
+    heap.push("a", 1)
+    heap.push("b", 2)
+    assert "a" in heap and "c" not in heap
+    assert len(heap) == 2
+    heap.remove("a")
+    assert "a" not in heap
+    assert heap.get_priority("b") == 2
+
+
+def test_update_both_directions():
+    heap = IndexedMinHeap()
+    for i in range(10):
+        heap.push(i, i)
+    heap.update(9, -1)
+    heap.update(0, 100)
+    assert heap.peek() == (9, -1)
+    assert [key for key, _ in drain(heap)] == [9, 1, 2, 3, 4, 5, 6, 7, 8, 0]
+
+
+def test_decrease_key():
+    heap = IndexedMinHeap()
+    heap.push("a", 5)
+    heap.push("b", 3)
+    heap.decrease_key("a", 1)
+    assert heap.peek() == ("a", 1)
+    with pytest.raises(ValueError):
+        heap.decrease_key("b", 4)
+    max_heap = IndexedMaxHeap()
+    max_heap.push("a", 1)
+    max_heap.decrease_key("a", 7)
+    with pytest.raises(ValueError):
+        max_heap.decrease_key("a", 2)
+
+
+def test_random_operations_match_reference():
+    rng = random.Random(7)
+    heap = IndexedHeap()
+    reference = {}
+    for step in range(2000):
+        op = rng.random()
+        if op < 0.4 or not reference:
+            key = step
+            reference[key] = rng.randint(0, 100)
+            heap.push(key, reference[key])
+        elif op < 0.6:
+            key = rng.choice(list(reference))
+            reference[key] = rng.randint(0, 100)
+            heap.update(key, reference[key])
+        elif op < 0.8:
+            key = rng.choice(list(reference))
+            assert heap.remove(key) == reference.pop(key)
+        else:
+            key, priority = heap.pop()
+            assert priority == min(reference.values())
+            assert reference.pop(key) == priority
+        assert len(heap) == len(reference)
+    assert [p for _, p in drain(heap)] == sorted(reference.values())
@@ -0,0 +1,80 @@
+import random
+import pytest
+from structures.lazy_heap import LazyHeap
+
+
+def test_push_pop_and_discard():
+    heap = LazyHeap()
+    for v in [5, 3, 8, 1, 9]:
+        heap.push(v)
+    assert heap.discard(1)
+    assert heap.discard(8)
+    assert not heap.discard(42)
+    assert heap.size() == 3
+    assert 1 not in heap and 3 in heap
+    assert heap.peek() == 3
+    assert [heap.pop() for _ in range(3)] == [3, 5, 9]
+    assert heap.isEmpty()
+    with pytest.raises(ValueError):
+        heap.pop()
+    with pytest.raises(ValueError):
+        heap.peek()
+
+
+def test_duplicates_discard_one_copy():
+    heap = LazyHeap(is_min=False)
+    for v in [4, 4, 2]:
+        heap.push(v)
+    heap.discard(4)
+    assert 4 in heap
+    assert [heap.pop() for _ in range(2)] == [4, 2]
+
+
+def test_compaction_bounds_dead_entries():
+    heap = LazyHeap(max_dead_ratio=0.25)
+    for v in range(100):
+        heap.push(v)
+    for v in range(50, 100):
+        heap.discard(v)
+        assert heap.dead_count() <= 0.25 * len(heap.data) + 1
+    assert heap.size() == 50
+    assert len(heap.data) < 70
+    assert [heap.pop() for _ in range(50)] == list(range(50))
+
+
+def test_invalid_ratio_raises():
+    with pytest.raises(ValueError):
+        LazyHeap(max_dead_ratio=1)
+
+
+def test_from_iterable_and_fused_operations():
+    heap = LazyHeap.from_iterable([7, 2, 5])
+    assert heap.size() == 3 and 7 in heap
+    heap.discard(2)
+    assert heap.pushpop(1) == 1
+    assert heap.pushpop(6) == 5
+    assert 5 not in heap and 6 in heap
+    assert heap.replace(0) == 6
+    assert [heap.pop() for _ in range(2)] == [0, 7]
+
+
+def test_random_operations_match_reference():
+    rng = random.Random(2)
+    heap = LazyHeap(max_dead_ratio=0.3)
+    reference = []
+    for _ in range(3000):
+        op = rng.random()
+        if op < 0.5 or not reference:
+            v = rng.randint(0, 200)
+            heap.push(v)
+            reference.append(v)
+        elif op < 0.8:
+            v = rng.choice(reference)
+            assert heap.discard(v)
+            reference.remove(v)
+        else:
+            v = heap.pop()
+            assert v == min(reference)
+            reference.remove(v)
+        assert heap.size() == len(reference)
+    assert [heap.pop() for _ in range(heap.size())] == sorted(reference)
@@ -0,0 +1,57 @@
+import random
+from structures.merge import merge
+
+
+def test_merge_sorted_lists():
+    rng = random.Random(5)
+    sources = [sorted(rng.randint(0, 100) for _ in range(rng.randint(0, 30))) for _ in range(6)]
+    assert list(merge(*sources)) == sorted(sum(sources, []))
+
+
+def test_merge_empty_inputs():
+    assert list(merge()) == []
+    assert list(merge([], [1], [])) == [1]
+
+
+def test_merge_reverse_and_key():
+    a = ["ccc", "a"]
+    b = ["dddd", "bb"]
+    assert list(merge(a, b, key=len, reverse=True)) == ["dddd", "ccc", "bb", "a"]
+    assert list(merge([5, 3], [4, 1], reverse=True)) == [5, 4, 3, 1]
+
+
+def test_merge_ties_keep_source_order():
+    a = [(1, "a"), (2, "a")]
+    b = [(1, "b"), (2, "b")]
+    first = lambda pair: pair[0]
+    assert list(merge(a, b, key=first)) == [(1, "a"), (1, "b"), (2, "a"), (2, "b")]
+    assert list(merge(a[::-1], b[::-1], key=first, reverse=True)) == [(2, "a"), (2, "b"), (1, "a"), (1, "b")]
+
+
+def test_merge_pulls_lazily():
+    pulled = []
+    def source(name, values):
+        for v in values:
+            pulled.append((name, v))
+            yield v
+    merged = merge(source("x", [1, 3, 5]), source("y", [2, 4, 6]))
+    assert next(merged) == 1
+    assert pulled == [("x", 1), ("y", 2)]
+    assert next(merged) == 2
+    assert pulled == [("x", 1), ("y", 2), ("x", 3)]
+    assert list(merged) == [3, 4, 5, 6]
+
+
+class Item:
+    """Orders by rank through __lt__ only, keeping the default identity __eq__."""
+    def __init__(self, rank, name):
+        self.rank = rank
+        self.name = name
+    def __lt__(self, other):
+        return self.rank < other.rank
+
+
+def test_merge_ties_keep_source_order_without_eq():
+    sources = [[Item(0, f"{name}{i}") for i in (1, 2)] for name in "abc"]
+    assert [item.name for item in merge(*sources)] == ["a1", "a2", "b1", "b2", "c1", "c2"]
+    assert [item.name for item in merge(*sources, reverse=True)] == ["a1", "a2", "b1", "b2", "c1", "c2"]
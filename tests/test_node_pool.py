@@ -0,0 +1,42 @@
+import pytest
+from structures.node_pool import NodePool
+
+
+class Node:
+    __slots__ = ('data', 'next')
+
+    def __init__(self, data):
+        self.data = data
+        self.next = None
+
+
+class Pooled(NodePool):
+    def __init__(self, pool_size):
+        super().__init__(Node, pool_size)
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+
+def test_released_nodes_are_reset_and_reused_up_to_pool_size():
+    pooled = Pooled(pool_size=1)
+    a, b = pooled._new_node(1), pooled._new_node(2)
+    a.next = b
+    pooled._release(a)
+    pooled._release(b)
+    assert a.data is None and a.next is None
+    assert b.data is None
+    assert pooled.memory_stats()["pooled_nodes"] == 1
+    assert pooled._new_node(3) is a and a.data == 3
+    assert pooled._new_node(4) is not b
+
+
+def test_memory_stats_compares_slotted_and_unslotted_nodes():
+    pooled = Pooled(pool_size=0)
+    pooled.count = 10
+    stats = pooled.memory_stats()
+    assert stats["elements"] == 10 and stats["pooled_nodes"] == 0
+    assert 0 < stats["bytes_per_node"] < stats["unslotted_bytes_per_node"]
+    assert stats["bytes_per_element"] == pytest.approx(stats["bytes_per_node"])
+    assert Pooled(pool_size=0).memory_stats()["bytes_per_element"] == 0.0
@@ -0,0 +1,131 @@
+import random
+import pytest
+import structures.numeric_heap as numeric_heap
+from structures.numeric_heap import NumericHeap
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "pure"])
+def numpy_toggle(request, monkeypatch):
+    """Run each test with and without the NumPy fast paths."""
+    if request.param:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(numeric_heap, "np", None)
+    return request.param
+
+
+def test_push_pop_order():
+    heap = NumericHeap()
+    for p in [5.0, 1.5, 3.0]:
+        heap.push(p)
+    assert heap.peek() == (1.5, 1)
+    assert [heap.pop() for _ in range(3)] == [(1.5, 1), (3.0, 2), (5.0, 0)]
+    assert heap.isEmpty()
+
+
+def test_max_heap_integers_with_payloads():
+    heap = NumericHeap(is_min=False, typecode='q')
+    heap.push(3, payload=30)
+    heap.push(7, payload=70)
+    assert heap.push(5) == 71
+    assert [heap.pop() for _ in range(3)] == [(7, 70), (5, 71), (3, 30)]
+
+
+def test_invalid_typecode_and_empty_raise():
+    with pytest.raises(ValueError):
+        NumericHeap(typecode='i')
+    heap = NumericHeap()
+    with pytest.raises(ValueError):
+        heap.pop()
+    with pytest.raises(ValueError):
+        heap.peek()
+
+
+def test_push_many_and_pop_many(numpy_toggle):
+    rng = random.Random(11)
+    values = [rng.random() for _ in range(500)]
+    heap = NumericHeap()
+    heap.push_many(values[:100])
+    heap.push_many(values[100:150])
+    heap.push_many(values[150:])
+    assert len(heap) == 500
+    assert heap.nbytes() == 500 * 16
+    first, ids = heap.pop_many(300)
+    assert list(first) == sorted(values)[:300]
+    assert [values[i] for i in ids] == list(first)
+    rest, _ = heap.pop_many(200)
+    assert list(rest) == sorted(values)[300:]
+    with pytest.raises(ValueError):
+        heap.pop_many(1)
+
+
+def test_push_many_payload_length_mismatch():
+    with pytest.raises(ValueError):
+        NumericHeap().push_many([1.0, 2.0], payloads=[1])
+
+
+def test_max_pop_many(numpy_toggle):
+    heap = NumericHeap(is_min=False, typecode='q')
+    heap.push_many(range(100), payloads=range(1000, 1100))
+    priorities, ids = heap.pop_many(60)
+    assert list(priorities) == list(range(99, 39, -1))
+    assert list(ids) == list(range(1099, 1039, -1))
+    assert heap.peek() == (39, 1039)
+
+
+def test_push_many_numpy_arrays():
+    np = pytest.importorskip("numpy")
+    heap = NumericHeap()
+    heap.push_many(np.array([3.0, 1.0, 2.0]), payloads=np.array([30, 10, 20]))
+    heap.push_many(np.array([0.5], dtype=np.float32))
+    assert heap.pop() == (0.5, 31)
+    priorities, ids = heap.pop_many(3)
+    assert np.frombuffer(priorities).tolist() == [1.0, 2.0, 3.0]
+    assert list(ids) == [10, 20, 30]
+
+
+def test_max_pop_many_extreme_integers(numpy_toggle):
+    heap = NumericHeap(is_min=False, typecode='q')
+    extremes = [-2**63, 2**63 - 1, 0, -2**63 + 1, 5]
+    heap.push_many(extremes)
+    priorities, _ = heap.pop_many(3)
+    assert list(priorities) == [2**63 - 1, 5, 0]
+    priorities, _ = heap.pop_many(2)
+    assert list(priorities) == [-2**63 + 1, -2**63]
+
+
+def test_push_many_rejects_lossy_numpy_arrays():
+    np = pytest.importorskip("numpy")
+    heap = NumericHeap(typecode='q')
+    with pytest.raises(ValueError):
+        heap.push_many(np.array([1.7, 2.9]))
+    with pytest.raises(ValueError):
+        heap.push_many([1], payloads=np.array([1.5]))
+    assert heap.isEmpty()
+    heap.push_many(np.array([2, 1], dtype=np.int32))
+    assert heap.pop() == (1, 1)
+
+@pytest.mark.parametrize("typecode, priority, payload", [
+    ('d', 2.0, 1.5), ('d', "1", 3), ('d', 1.0, 2**63), ('q', 2.5, None), ('q', 2**63, None)])
+def test_rejected_push_leaves_heap_unchanged(typecode, priority, payload):
+    heap = NumericHeap(typecode=typecode)
+    heap.push(3, payload=4)
+    with pytest.raises(ValueError):
+        heap.push(priority, payload=payload)
+    assert list(heap.priorities) == [3] and list(heap.ids) == [4]
+    assert heap.push(1) == 5
+    assert heap.pop() == (1, 5) and heap.pop() == (3, 4)
+
+def test_push_many_rejects_lossy_lists_like_numpy_arrays(numpy_toggle):
+    heap = NumericHeap(typecode='q')
+    with pytest.raises(ValueError):
+        heap.push_many([1.7, 2.9])
+    with pytest.raises(ValueError):
+        heap.push_many([1], payloads=[1.5])
+    if numpy_toggle:
+        import numpy as np
+        with pytest.raises(ValueError):
+            heap.push_many(np.array([1.7, 2.9]))
+    assert heap.isEmpty()
+    heap.push_many([2, 1])
+    assert heap.pop() == (1, 1)
@@ -0,0 +1,114 @@
+import itertools
+import random
+import pytest
+from structures.pairing_heap import PairingHeap, MinPairingHeap, MaxPairingHeap
+
+
+def test_min_push_and_pop_order():
+    heap = MinPairingHeap()
+    values = [5, 3, 8, 1, 2, 8]
+    for v in values:
+        heap.push(v)
+    assert heap.peek() == 1
+    assert heap.size() == 6
+    assert [heap.pop() for _ in range(6)] == sorted(values)
+    assert heap.isEmpty()
+
+
+def test_max_push_and_pop_order():
+    heap = MaxPairingHeap()
+    for v in [5, 3, 8, 1]:
+        heap.push(v)
+    assert [heap.pop() for _ in range(4)] == [8, 5, 3, 1]
+
+
+def test_empty_raises():
+    heap = PairingHeap()
+    with pytest.raises(ValueError):
+        heap.pop()
+    with pytest.raises(ValueError):
+        heap.peek()
+
+
+def test_meld():
+    a, b = MinPairingHeap(), MinPairingHeap()
+    for v in [4, 1, 7]:
+        a.push(v)
+    for v in [3, 0, 9]:
+        b.push(v)
+    a.meld(b)
+    assert b.isEmpty() and b.size() == 0
+    assert a.size() == 6
+    assert [a.pop() for _ in range(6)] == [0, 1, 3, 4, 7, 9]
+    a.meld(MinPairingHeap())
+    assert a.isEmpty()
+    with pytest.raises(ValueError):
+        a.meld(MaxPairingHeap())
+
+
+def test_decrease_key():
+    heap = MinPairingHeap()
+    nodes = [heap.push(v) for v in [10, 20, 30, 40]]
+    heap.pop()
+    heap.decrease_key(nodes[3], 5)
+    assert heap.peek() == 5
+    heap.decrease_key(nodes[3], 5)
+    with pytest.raises(ValueError):
+        heap.decrease_key(nodes[1], 25)
+    assert [heap.pop() for _ in range(3)] == [5, 20, 30]
+    max_heap = MaxPairingHeap()
+    node = max_heap.push(1)
+    max_heap.push(3)
+    max_heap.decrease_key(node, 4)
+    assert max_heap.peek() == 4
+
+
+def test_random_operations_match_sorted():
+    rng = random.Random(1)
+    heap = MinPairingHeap()
+    live = {} # Handles of the elements in the heap, by element
+    ids = itertools.count()
+    for step in range(3000):
+        op = rng.random()
+        # Elements carry a unique id, so the popped element identifies its handle.
+        if op < 0.5 or not live:
+            item = (rng.randint(0, 1000), next(ids))
+            live[item] = heap.push(item)
+        elif op < 0.7:
+            item = rng.choice(list(live))
+            decreased = (item[0] - rng.randint(0, 50), item[1])
+            heap.decrease_key(live[item], decreased)
+            live[decreased] = live.pop(item)
+        elif op < 0.8:
+            other = MinPairingHeap()
+            for _ in range(5):
+                item = (rng.randint(0, 1000), next(ids))
+                live[item] = other.push(item)
+            heap.meld(other)
+        else:
+            item = heap.pop()
+            assert item == min(live)
+            del live[item]
+        assert heap.size() == len(live)
+    assert [heap.pop() for _ in range(heap.size())] == sorted(live)
+
+
+def test_decrease_key_rejects_popped_and_foreign_nodes():
+    heap, other = MinPairingHeap(), MinPairingHeap()
+    popped = heap.push(1)
+    heap.push(5)
+    heap.push(7)
+    assert heap.pop() == 1
+    with pytest.raises(ValueError):
+        heap.decrease_key(popped, 0)
+    foreign_root = other.push(2)
+    foreign_child = other.push(3)
+    for node in [foreign_root, foreign_child]:
+        with pytest.raises(ValueError):
+            heap.decrease_key(node, 0)
+    assert heap.size() == 2 and heap.peek() == 5
+    heap.meld(other)
+    heap.decrease_key(foreign_child, 0)
+    with pytest.raises(ValueError):
+        other.decrease_key(foreign_root, 0)
+    assert [heap.pop() for _ in range(4)] == [0, 2, 5, 7]
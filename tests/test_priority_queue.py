@@ -51,4 +51,59 @@ def test_priority():
     s.add(2)
     s.add(3)
     s.add(3)
-    assert s.__str__() == "[0, 1, 2, 3, 3, 3, 4, 5, ...]"
\ No newline at end of file
+    assert s.__str__() == "[0, 1, 2, 3, 3, 3, 4, 5, ...]"
+def test_add_many_and_get_many():
+    s = PriorityQueue()
+    s.add(3)
+    s.add_many([5, 1, 3, 0])
+    assert s.peek_many([0, -1]) == [0, 5]
+    assert s.get_many(3) == [0, 1, 3]
+    assert str(s) == "[3, 5, ...]"
+    with pytest.raises(IndexError):
+        s.get_many(3)
+    with pytest.raises(IndexError):
+        s.peek_many([2])
+
+class Task:
+    """Orders by priority only, so equal priorities compare equal."""
+    def __init__(self, priority, name):
+        self.priority = priority
+        self.name = name
+    def __lt__(self, other):
+        return self.priority < other.priority
+    def __eq__(self, other):
+        return self.priority == other.priority
+
+def test_equal_priorities_are_fifo():
+    s = PriorityQueue()
+    for name, priority in [("a", 2), ("b", 1), ("c", 2), ("d", 1), ("e", 2)]:
+        s.add(Task(priority, name))
+    assert [s.get().name for _ in range(5)] == ["b", "d", "a", "c", "e"]
+
+def test_large_interleaved_matches_sorted():
+    s = PriorityQueue()
+    values = [(i * 7919) % 1000 for i in range(1000)]
+    s.add_many(values[:500])
+    out = s.get_many(100)
+    s.add_many(values[500:])
+    out += [s.get() for _ in range(len(s))]
+    assert out[:100] == sorted(values[:500])[:100]
+    assert sorted(out) == sorted(values)
+    assert s.isEmpty()
+
+class Job:
+    """Orders by priority through __lt__ only, keeping the default identity __eq__."""
+    def __init__(self, priority, name):
+        self.priority = priority
+        self.name = name
+    def __lt__(self, other):
+        return self.priority < other.priority
+
+def test_equal_priorities_are_fifo_without_eq():
+    s = PriorityQueue()
+    for name, priority in [("a", 1), ("b", 1), ("c", 1), ("d", 0), ("e", 1)]:
+        s.add(Job(priority, name))
+    assert [s.get().name for _ in range(5)] == ["d", "a", "b", "c", "e"]
+    s.add_many(Job(1, name) for name in "abcdefg")
+    assert [job.name for job in s.peek_many(range(7))] == list("abcdefg")
+    assert [s.get().name for _ in range(7)] == list("abcdefg")
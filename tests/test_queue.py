@@ -39,4 +39,58 @@ def test_str_and_repr():
     s.add(3)
     expected = "[1, 2, 3, ...]"
     assert s.__str__() == expected
-    assert repr(s) == expected
\ No newline at end of file
+    assert repr(s) == expected
+
+def test_fifo_order_across_growth():
+    s = Queue()
+    for i in range(100):
+        s.add(i)
+    assert len(s) == 100
+    assert [s.get() for _ in range(100)] == list(range(100))
+    assert s.isEmpty()
+
+def test_wraparound_interleaved():
+    s = Queue()
+    expected = []
+    for i in range(50):
+        s.add(i)
+        s.add(i + 1000)
+        expected += [i, i + 1000]
+        assert s.get() == expected.pop(0)
+    assert len(s) == len(expected)
+    assert s.peek() == expected[0]
+    assert str(s) == f"{str(expected)[:-1]}, ...]"
+
+def test_shrink_on_drain_keeps_order():
+    s = Queue()
+    for i in range(1000):
+        s.add(i)
+    for i in range(990):
+        assert s.get() == i
+    s.add('end')
+    assert [s.get() for _ in range(len(s))] == list(range(990, 1000)) + ['end']
+
+def test_add_many_and_get_many():
+    s = Queue()
+    s.add(-1)
+    s.add_many(range(100))
+    s.extend(iter([100, 101]))
+    assert len(s) == 103
+    assert s.get_many(3) == [-1, 0, 1]
+    assert s.get_many(0) == []
+    assert s.get_many(95) == list(range(2, 97))
+    assert s.peek_many([0, -1, 2]) == [97, 101, 99]
+    assert [s.get() for _ in range(len(s))] == list(range(97, 102))
+
+def test_get_many_too_many_raises():
+    s = Queue()
+    s.add_many([1, 2])
+    with pytest.raises(IndexError):
+        s.get_many(3)
+    assert len(s) == 2
+
+def test_peek_many_out_of_bounds_raises():
+    s = Queue()
+    s.add(1)
+    with pytest.raises(IndexError):
+        s.peek_many([1])
@@ -139,3 +139,129 @@ def test_empty_str():
 
 def test_repr(linked_list):
     assert repr(linked_list) == "[1, 2, 3]"
+
+def test_add_many_prepends(linked_list):
+    linked_list.add_many([0, -1])
+    assert str(linked_list) == "[-1, 0, 1, 2, 3]"
+
+def test_extend_appends(linked_list):
+    linked_list.extend(iter([4, 5]))
+    assert str(linked_list) == "[1, 2, 3, 4, 5]"
+    empty = SingularlyLinkedList()
+    empty.extend([1, 2])
+    assert str(empty) == "[1, 2]"
+
+def test_get_many(linked_list):
+    assert linked_list.get_many(2) == [1, 2]
+    assert str(linked_list) == "[3]"
+    with pytest.raises(ValueError):
+        linked_list.get_many(2)
+
+def test_peek_many(linked_list):
+    assert linked_list.peek_many([2, 0, -2, 2]) == [3, 1, 2, 3]
+    with pytest.raises(ValueError):
+        linked_list.peek_many([3])
+
+def test_nodes_have_no_dict():
+    from structures.s_linked_list import Node
+    assert not hasattr(Node(1), "__dict__")
+
+def test_pool_reuses_nodes():
+    ll = SingularlyLinkedList(pool_size=2)
+    ll.add_many([1, 2, 3, 4])
+    ll.get()
+    ll.remove(1)
+    ll.get_many(2)
+    stats = ll.memory_stats()
+    assert stats["elements"] == 0
+    assert stats["pooled_nodes"] == 2
+    ll.add(5)
+    ll.insert(1, 6)
+    ll.extend([7])
+    assert str(ll) == "[5, 6, 7]"
+    stats = ll.memory_stats()
+    assert stats["pooled_nodes"] == 0
+    assert stats["bytes_per_element"] == pytest.approx(stats["bytes_per_node"])
+    assert stats["unslotted_bytes_per_node"] > stats["bytes_per_node"]
+    assert stats["unslotted_total_bytes"] == pytest.approx(3 * stats["unslotted_bytes_per_node"])
+
+def test_random_operations_match_list():
+    import random
+    rng = random.Random(6)
+    ll = SingularlyLinkedList(pool_size=4)
+    reference = []
+    for step in range(3000):
+        op = rng.random()
+        if op < 0.25 or not reference:
+            index = rng.randint(0, len(reference))
+            ll.insert(index, step)
+            reference.insert(index, step)
+        elif op < 0.35:
+            ll.add(step)
+            reference.insert(0, step)
+        elif op < 0.5:
+            index = rng.randrange(len(reference))
+            assert ll.get(index) == reference.pop(index)
+        elif op < 0.6:
+            value = rng.choice(reference)
+            ll.remove(value)
+            reference.remove(value)
+        elif op < 0.7:
+            index = rng.randrange(len(reference))
+            ll.set(index, -step)
+            reference[index] = -step
+        elif op < 0.75:
+            n = rng.randint(0, min(3, len(reference)))
+            assert ll.get_many(n) == reference[:n]
+            del reference[:n]
+        elif op < 0.8:
+            ll.extend([step, step + 1])
+            reference += [step, step + 1]
+        else:
+            index = rng.randrange(len(reference))
+            assert ll.peek(index) == reference[index]
+        assert len(ll) == len(reference)
+    assert list(ll) == reference
+    assert list(reversed(ll)) == reference[::-1]
+
+def test_sequential_peek_uses_finger():
+    ll = SingularlyLinkedList()
+    ll.extend(range(20000))
+    assert [ll.peek(i) for i in range(len(ll))] == list(range(20000))
+
+def test_iteration_and_contains():
+    ll = SingularlyLinkedList()
+    ll.extend(range(5))
+    assert list(ll) == [0, 1, 2, 3, 4]
+    assert list(reversed(ll)) == [4, 3, 2, 1, 0]
+    assert 3 in ll
+    assert 7 not in ll
+    assert list(SingularlyLinkedList()) == []
+
+def test_getitem_and_slices():
+    import random
+    rng = random.Random(17)
+    ll = SingularlyLinkedList()
+    ll.extend(range(30))
+    reference = list(range(30))
+    assert ll[0] == 0 and ll[-1] == 29
+    with pytest.raises(IndexError):
+        ll[30]
+    with pytest.raises(IndexError):
+        ll[-31]
+    for _ in range(300):
+        start, stop = rng.randint(-35, 35), rng.randint(-35, 35)
+        step = rng.choice([1, 2, 3, -1, -2, -4])
+        assert list(ll[start:stop:step]) == reference[start:stop:step]
+    assert list(ll[::-1]) == reference[::-1]
+    view = ll[5:8]
+    assert not isinstance(view, list)
+    assert list(view) == [5, 6, 7]
+
+def test_str_truncates_long_lists():
+    ll = SingularlyLinkedList()
+    ll.extend(range(SingularlyLinkedList.STR_LIMIT + 5))
+    text = str(ll)
+    assert text.startswith("[0, 1, 2, ")
+    assert text.endswith(f"{SingularlyLinkedList.STR_LIMIT - 1}, ... (5 more)]")
+    assert repr(ll) == text
@@ -40,3 +40,20 @@ def test_str_and_repr():
     expected = "[1, 2, 3, ...]"
     assert s.__str__() == expected
     assert repr(s) == expected
+
+def test_add_many_and_get_many():
+    s = Stack()
+    s.add_many(range(5))
+    s.extend([5])
+    assert s.peek_many([0, 1, -1]) == [5, 4, 0]
+    assert s.get_many(2) == [5, 4]
+    assert s.get_many(0) == []
+    assert s.get() == 3
+
+def test_get_many_too_many_raises():
+    s = Stack()
+    s.add_many([1])
+    with pytest.raises(IndexError):
+        s.get_many(2)
+    with pytest.raises(IndexError):
+        s.peek_many([1])
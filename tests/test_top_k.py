@@ -0,0 +1,77 @@
+import random
+import pytest
+from structures.top_k import TopK, nlargest, nsmallest
+
+
+def test_nlargest_and_nsmallest_match_sorted():
+    rng = random.Random(3)
+    values = [rng.randint(0, 1000) for _ in range(2000)]
+    assert nlargest(10, values) == sorted(values, reverse=True)[:10]
+    assert nsmallest(10, iter(values)) == sorted(values)[:10]
+
+
+def test_k_larger_than_input():
+    assert nlargest(5, [2, 1]) == [2, 1]
+    assert nsmallest(0, [2, 1]) == []
+
+
+def test_key_and_ties_prefer_earliest():
+    words = ["bb", "a", "cc", "dd", "e"]
+    assert nlargest(2, words, key=len) == ["bb", "cc"]
+    assert nsmallest(2, words, key=len) == ["a", "e"]
+
+
+def test_items_are_never_compared():
+    items = [{"score": s} for s in [3, 1, 3, 2]]
+    top = nlargest(3, items, key=lambda d: d["score"])
+    assert [d["score"] for d in top] == [3, 3, 2]
+    assert top[0] is items[0]
+
+
+def test_consumes_generator_lazily():
+    pulled = []
+    def stream():
+        for i in range(100):
+            pulled.append(i)
+            yield i
+    selector = TopK(3)
+    gen = stream()
+    selector.push(next(gen))
+    assert pulled == [0]
+    selector.consume(gen)
+    assert selector.snapshot() == [99, 98, 97]
+    assert selector.seen() == 100
+    assert len(selector) == 3
+
+
+def test_snapshots():
+    selector = TopK(2, largest=False)
+    snaps = list(selector.snapshots([5, 4, 9, 1, 7], every=2))
+    assert snaps == [[4, 5], [1, 4], [1, 4]]
+    with pytest.raises(ValueError):
+        list(selector.snapshots([], every=0))
+
+
+def test_invalid_k_raises():
+    with pytest.raises(ValueError):
+        TopK(0)
+
+
+class Item:
+    """Orders by priority through __lt__ only, keeping the default identity __eq__."""
+    def __init__(self, priority, index):
+        self.priority = priority
+        self.index = index
+    def __lt__(self, other):
+        return self.priority < other.priority
+
+
+def test_ties_prefer_earliest_items_without_eq():
+    rng = random.Random(9)
+    for _ in range(50):
+        items = [Item(rng.randint(0, 3), i) for i in range(rng.randint(1, 30))]
+        k = rng.randint(1, 8)
+        smallest = sorted(items, key=lambda item: item.priority)[:k]
+        largest = sorted(items, key=lambda item: -item.priority)[:k]
+        assert [item.index for item in nsmallest(k, items)] == [item.index for item in smallest]
+        assert [item.index for item in nlargest(k, items)] == [item.index for item in largest]
@@ -0,0 +1,138 @@
+import pytest
+from structures.unrolled_linked_list import UnrolledLinkedList
+
+@pytest.fixture
+def empty_list():
+    return UnrolledLinkedList(block_capacity=4)
+
+@pytest.fixture
+def populated_list():
+    ull = UnrolledLinkedList(block_capacity=4)
+    for i in range(10):
+        ull.add(i)
+    return ull
+
+def test_invalid_capacity():
+    with pytest.raises(ValueError):
+        UnrolledLinkedList(block_capacity=1)
+
+def test_add_fills_blocks(populated_list):
+    assert str(populated_list) == "[0, 1, 2, 3, 4, 5, 6, 7, 8, 9]"
+    assert len(populated_list) == 10
+    assert populated_list.block_count() == 3
+
+def test_insert(populated_list):
+    populated_list.insert(0, -1)
+    populated_list.insert(5, 99)
+    populated_list.insert(-2, 100)
+    populated_list.insert(len(populated_list), 200)
+    assert list(populated_list) == [-1, 0, 1, 2, 3, 99, 4, 5, 6, 7, 8, 100, 9, 200]
+
+def test_insert_out_of_bounds(empty_list):
+    with pytest.raises(IndexError):
+        empty_list.insert(1, 5)
+
+def test_get(populated_list):
+    assert populated_list.get() == 9
+    assert populated_list.get(0) == 0
+    assert populated_list.get(3) == 4
+    assert list(populated_list) == [1, 2, 3, 5, 6, 7, 8]
+    with pytest.raises(IndexError):
+        populated_list.get(7)
+
+def test_remove(populated_list):
+    populated_list.remove(5)
+    assert list(populated_list) == [0, 1, 2, 3, 4, 6, 7, 8, 9]
+    with pytest.raises(ValueError):
+        populated_list.remove(42)
+
+def test_remove_from_empty(empty_list):
+    with pytest.raises(IndexError):
+        empty_list.remove(1)
+
+def test_set_and_peek(populated_list):
+    populated_list.set(6, 60)
+    populated_list.set(-1, 90)
+    assert populated_list.peek(6) == 60
+    assert populated_list.peek(-1) == 90
+    with pytest.raises(ValueError):
+        populated_list.set(10, 1)
+    with pytest.raises(ValueError):
+        populated_list.peek(-11)
+
+def test_many(populated_list):
+    populated_list.extend(range(10, 13))
+    assert populated_list.get_many(4) == [12, 11, 10, 9]
+    assert populated_list.peek_many([0, -1]) == [0, 8]
+    with pytest.raises(IndexError):
+        populated_list.get_many(10)
+
+def test_empty_blocks_are_released(populated_list):
+    populated_list.get_many(10)
+    assert populated_list.isEmpty()
+    assert populated_list.block_count() == 0
+    assert str(populated_list) == "[]"
+    populated_list.add(1)
+    assert list(populated_list) == [1]
+
+def test_iteration_and_slices(populated_list):
+    reference = list(range(10))
+    assert list(reversed(populated_list)) == reference[::-1]
+    assert 7 in populated_list and 10 not in populated_list
+    assert populated_list[4] == 4
+    with pytest.raises(IndexError):
+        populated_list[10]
+    for s in [slice(2, 9), slice(None, None, 3), slice(8, 1, -2), slice(None, None, -1), slice(5, 2)]:
+        assert list(populated_list[s]) == reference[s]
+
+def test_str_truncates_long_lists():
+    ull = UnrolledLinkedList()
+    ull.extend(range(UnrolledLinkedList.STR_LIMIT + 2))
+    assert str(ull).endswith(f"{UnrolledLinkedList.STR_LIMIT - 1}, ... (2 more)]")
+
+def test_uses_fewer_blocks_than_elements():
+    ull = UnrolledLinkedList(block_capacity=64)
+    ull.extend(range(6400))
+    stats = ull.memory_stats()
+    assert stats["blocks"] == 100
+    assert stats["elements"] == 6400
+
+def test_random_operations_match_list():
+    import random
+    rng = random.Random(18)
+    ull = UnrolledLinkedList(block_capacity=4)
+    reference = []
+    for step in range(4000):
+        op = rng.random()
+        if op < 0.3 or not reference:
+            index = rng.randint(0, len(reference))
+            ull.insert(index, step)
+            reference.insert(index, step)
+        elif op < 0.4:
+            ull.add(step)
+            reference.append(step)
+        elif op < 0.55:
+            index = rng.randrange(len(reference))
+            assert ull.get(index) == reference.pop(index)
+        elif op < 0.65:
+            value = rng.choice(reference)
+            ull.remove(value)
+            reference.remove(value)
+        elif op < 0.7:
+            index = rng.randrange(-len(reference), len(reference))
+            ull.set(index, -step)
+            reference[index] = -step
+        elif op < 0.75:
+            n = rng.randint(0, min(5, len(reference)))
+            assert ull.get_many(n) == reference[::-1][:n]
+            del reference[len(reference) - n:]
+        elif op < 0.8:
+            ull.extend([step, step + 1, step + 2])
+            reference += [step, step + 1, step + 2]
+        else:
+            index = rng.randrange(len(reference))
+            assert ull.peek(index) == reference[index]
+        assert len(ull) == len(reference)
+        assert ull.block_count() <= len(reference)
+    assert list(ull) == reference
+    assert list(reversed(ull)) == reference[::-1]